@@ -0,0 +1,84 @@
+"""
+Benchmark: montagem do modelo PuLP termo a termo × montagem em bloco.
+
+Compara o laço original de simplex() (``sum([a_ij * x_j ...])`` por linha,
+inclusive coeficientes nulos) com ``ppl.construcao.montar_pulp`` para tamanhos
+m×n crescentes, em matrizes densas e esparsas. Só mede a montagem, sem resolver.
+
+Uso:
+    python benchmarks/bench_construcao.py [--tamanhos 10 50 100 200] [--densidade 0.05] [--json]
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ppl.construcao import montar_pulp  # noqa: E402
+
+
+def montar_laco(c, A, b, operadores, maximizar):
+    """Montagem original de simplex(), termo a termo"""
+    from pulp import LpMaximize, LpMinimize, LpProblem, LpVariable
+
+    num_variables = len(c)
+    prob = LpProblem("PPL", LpMaximize if maximizar else LpMinimize)
+    vars = [LpVariable(f"x{i+1}", lowBound=0) for i in range(num_variables)]
+    prob += sum([c[i] * vars[i] for i in range(num_variables)]), "FuncaoObjetivo"
+    for i in range(len(b)):
+        expr = sum([A[i][j] * vars[j] for j in range(num_variables)])
+        op = operadores[i]
+        if op == "≤":
+            prob += (expr <= b[i], f"Restricao_{i+1}")
+        elif op == "≥":
+            prob += (expr >= b[i], f"Restricao_{i+1}")
+        else:
+            prob += (expr == b[i], f"Restricao_{i+1}")
+    return prob, vars
+
+
+def cronometrar(funcao, *args, repeticoes=3):
+    """Menor tempo (s) entre algumas repetições"""
+    melhor = float("inf")
+    for _ in range(repeticoes):
+        inicio = time.perf_counter()
+        funcao(*args)
+        melhor = min(melhor, time.perf_counter() - inicio)
+    return melhor
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--tamanhos", type=int, nargs="+", default=[10, 50, 100, 200])
+    parser.add_argument("--densidade", type=float, default=0.05)
+    parser.add_argument("--json", action="store_true", help="uma linha JSON por medição")
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    if not args.json:
+        print(f"{'m×n':>10} {'densidade':>9} {'laço (s)':>10} {'bloco (s)':>10} {'ganho':>7}")
+    for tamanho in args.tamanhos:
+        for densidade in (1.0, args.densidade):
+            m = n = tamanho
+            A = rng.random((m, n)) * (rng.random((m, n)) < densidade)
+            c, b = rng.random(n), rng.random(m) * n
+            operadores = ["≤"] * m
+            A_lista = A.tolist()
+
+            t_laco = cronometrar(montar_laco, c.tolist(), A_lista, b.tolist(), operadores, True)
+            t_bloco = cronometrar(montar_pulp, c, A, b, operadores, True)
+            if args.json:
+                print(json.dumps({"m": m, "n": n, "densidade": densidade,
+                                  "laco_s": t_laco, "bloco_s": t_bloco}))
+            else:
+                print(f"{f'{m}×{n}':>10} {densidade:>9.2f} {t_laco:>10.4f} {t_bloco:>10.4f} "
+                      f"{t_laco / t_bloco:>6.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""
+Benchmark: resolução monolítica × decomposição em blocos.
+
+Gera PPLs com K blocos independentes (fábricas, cada uma com as suas
+restrições de capacidade) e, opcionalmente, algumas linhas ligantes de
+capacidade compartilhada, com as linhas embaralhadas para que a estrutura não
+seja visível na ordem. Para cada motor, compara o tempo do problema inteiro com
+o de ``decompor=True`` (blocos em paralelo ou Dantzig–Wolfe) e confere o valor
+ótimo.
+
+Uso:
+    python benchmarks/bench_decomposicao.py [--blocos 4 8 16] [--linhas 60] [--colunas 80]
+        [--ligantes 0 3] [--motores revisado highs] [--json]
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ppl.motores import resolver  # noqa: E402
+
+
+def gerar(blocos, linhas, colunas, ligantes, rng):
+    """PPL de maximização com ``blocos`` blocos linhas×colunas e ``ligantes`` linhas de borda"""
+    n = blocos * colunas
+    A = np.zeros((blocos * linhas + ligantes, n))
+    for k in range(blocos):
+        bloco = rng.uniform(0.1, 5.0, (linhas, colunas)) * (rng.random((linhas, colunas)) < 0.3)
+        A[k * linhas:(k + 1) * linhas, k * colunas:(k + 1) * colunas] = bloco
+    b = rng.uniform(20.0, 100.0, blocos * linhas)
+    if ligantes:
+        A[blocos * linhas:] = rng.uniform(0.0, 1.0, (ligantes, n)) * (rng.random((ligantes, n)) < 0.7)
+        b = np.concatenate([b, rng.uniform(5.0, 30.0, ligantes) * blocos])
+    ordem = rng.permutation(len(b))
+    return rng.uniform(1.0, 10.0, n), A[ordem], b[ordem], ["≤"] * len(b)
+
+
+def cronometrar(*args, **kwargs):
+    inicio = time.perf_counter()
+    resultado = resolver(*args, **kwargs)
+    return resultado, time.perf_counter() - inicio
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--blocos", type=int, nargs="+", default=[4, 8, 16])
+    parser.add_argument("--linhas", type=int, default=60, help="restrições por bloco")
+    parser.add_argument("--colunas", type=int, default=80, help="variáveis por bloco")
+    parser.add_argument("--ligantes", type=int, nargs="+", default=[0, 3])
+    parser.add_argument("--motores", nargs="+", default=["revisado", "highs"])
+    parser.add_argument("--json", action="store_true", help="uma linha JSON por medição")
+    args = parser.parse_args()
+
+    # Aquecimento: importações e primeira chamada de cada motor fora da medição
+    for motor in args.motores:
+        resolver([1.0, 1.0], [[1.0, 0.0], [0.0, 1.0]], [1.0, 2.0], ["≤", "≤"], "Maximizar",
+                 motor=motor, decompor=True)
+
+    rng = np.random.default_rng(0)
+    if not args.json:
+        print(f"{'motor':>9} {'blocos':>6} {'lig.':>4} {'m×n':>11} {'tipo':>14} {'rodadas':>7} "
+              f"{'proc.':>5} {'inteiro (s)':>11} {'blocos (s)':>10} {'aceleração':>10}")
+    for blocos in args.blocos:
+        for ligantes in args.ligantes:
+            c, A, b, operadores = gerar(blocos, args.linhas, args.colunas, ligantes, rng)
+            m, n = A.shape
+            for motor in args.motores:
+                inteiro, t_inteiro = cronometrar(c, A, b, operadores, "Maximizar", motor=motor)
+                dec, t_dec = cronometrar(c, A, b, operadores, "Maximizar", motor=motor, decompor=True)
+                if inteiro.status != dec.status or (inteiro.status == "Optimal"
+                                                    and not np.isclose(inteiro.valorOtimo, dec.valorOtimo)):
+                    print(f"divergência em {motor} {m}×{n}: {inteiro.status}/{dec.status}", file=sys.stderr)
+                e = dec.decomposicao
+                medicao = {"motor": motor, "blocos": blocos, "ligantes": ligantes, "m": m, "n": n,
+                           "tipo": e.tipo, "rodadas": e.rodadas, "processos": e.processos,
+                           "inteiro_s": t_inteiro, "decomposto_s": t_dec, "aceleracao": t_inteiro / t_dec}
+                if args.json:
+                    print(json.dumps(medicao, ensure_ascii=False))
+                else:
+                    print(f"{motor:>9} {blocos:>6} {ligantes:>4} {f'{m}×{n}':>11} {e.tipo:>14} {e.rodadas:>7} "
+                          f"{e.processos:>5} {t_inteiro:>11.4f} {t_dec:>10.4f} {t_inteiro / t_dec:>9.1f}×")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,291 @@
+"""
+Benchmark: famílias de PPL geradas × motores, com comparação contra uma base.
+
+Gera, de forma reprodutível (semente fixa), seis famílias de problemas em
+tamanhos crescentes:
+
+- denso:      A cheia e positiva, só "≤" (ótimo único, caso típico);
+- esparso:    ~5% de não nulos, só "≤";
+- degenerado: dados inteiros e 2n restrições ativas no mesmo vértice ótimo;
+- inviavel:   restrições "≤" mais a soma de algumas delas como "≥" com folga negativa;
+- ilimitado:  colunas com lucro positivo que só aparecem com coeficiente ≤ 0;
+- misto:      linhas "≤", "≥" e "=" com coeficientes de sinais variados (minimização).
+
+Cada problema é resolvido por ``simplex()`` (sem cache) em cada motor
+disponível, e as fases medidas pelo controle (ver ppl.desempenho) são somadas
+em montagem, resolução e extração (duais, solução, tableau). Para cada caso
+ficam a mediana das repetições, as iterações, a vazão (problemas/s e não
+nulos/s) e o pico de memória rastreada pelo tracemalloc (numa execução à
+parte; memória nativa do HiGHS e do processo do CBC não entra nessa conta).
+O status obtido é conferido com o esperado da família.
+
+``--salvar`` grava as medições em JSON; ``--comparar`` lê um arquivo salvo e
+aponta regressões (tempo total acima da tolerância, mudança de status ou mais
+iterações), saindo com código 1 se houver alguma.
+
+Uso:
+    python benchmarks/bench_familias.py [--tamanhos 25 50 100] [--motores revisado highs]
+        [--familias denso misto] [--repeticoes 3] [--json] [--salvar base.json]
+        [--comparar base.json] [--tolerancia 0.25]
+"""
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+from contextlib import contextmanager
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ppl.motores import MOTORES  # noqa: E402
+from ppl.resolucao import simplex  # noqa: E402
+from ppl.tarefas import Controle  # noqa: E402
+
+# Fases da medição (ver ppl.desempenho) agrupadas nas três etapas do relatório
+ETAPAS = {
+    "montagem": ("montagem",),
+    "resolucao": ("solver", "fase 1", "fase 2", "partida a quente", "barreira", "crossover"),
+    "extracao": ("extração", "duais", "tableau"),
+}
+# Diferenças de tempo abaixo disto são ruído de medição, não regressão
+PISO_REGRESSAO_S = 0.002
+
+
+def _positiva(rng, m, n, densidade=1.0):
+    """Matriz com entradas em [1, 10) e ao menos um não nulo por coluna"""
+    A = rng.uniform(1.0, 10.0, (m, n))
+    if densidade < 1.0:
+        mascara = rng.random((m, n)) < densidade
+        mascara[rng.integers(0, m, n), np.arange(n)] = True
+        A *= mascara
+    return A
+
+
+def gerar_denso(n, rng):
+    A = _positiva(rng, n, n)
+    return rng.uniform(1.0, 10.0, n), A, A.sum(axis=1) * 0.5, ["≤"] * n, "Maximizar", "Optimal"
+
+
+def gerar_esparso(n, rng):
+    A = _positiva(rng, n, n, densidade=0.05)
+    return rng.uniform(1.0, 10.0, n), A, A.sum(axis=1) * 0.5, ["≤"] * n, "Maximizar", "Optimal"
+
+
+def gerar_degenerado(n, rng):
+    """Todas as 2n restrições passam pelo vértice x0 (com metade das coordenadas nulas)"""
+    m = 2 * n
+    A = rng.integers(1, 6, (m, n)).astype(float)
+    x0 = rng.integers(0, 3, n) * (rng.random(n) < 0.5)
+    # c = Aᵀy com y ≥ 0 torna x0 ótimo (e o problema limitado)
+    y = rng.integers(0, 2, m)
+    return A.T @ y + 0.0, A, A @ x0 + 0.0, ["≤"] * m, "Maximizar", "Optimal"
+
+
+def gerar_inviavel(n, rng):
+    A = _positiva(rng, n, n)
+    b = A.sum(axis=1) * 0.5
+    # A soma de k linhas "≤" exigida acima da soma dos seus lados direitos
+    k = max(n // 4, 2)
+    linhas = rng.choice(n, k, replace=False)
+    A = np.vstack([A, A[linhas].sum(axis=0)])
+    b = np.append(b, b[linhas].sum() * 1.01)
+    return rng.uniform(1.0, 10.0, n), A, b, ["≤"] * n + ["≥"], "Maximizar", "Infeasible"
+
+
+def gerar_ilimitado(n, rng):
+    A = _positiva(rng, n, n)
+    livres = rng.choice(n, max(n // 10, 1), replace=False)
+    A[:, livres] *= -1.0
+    return rng.uniform(1.0, 10.0, n), A, A.sum(axis=1).clip(1.0, None), ["≤"] * n, "Maximizar", "Unbounded"
+
+
+def gerar_misto(n, rng):
+    """Um terço de cada tipo de linha, todas satisfeitas por x0 > 0; custos positivos limitam o mínimo"""
+    A = rng.uniform(-5.0, 10.0, (n, n))
+    x0 = rng.uniform(0.5, 2.0, n)
+    ax = A @ x0
+    operadores = np.array(["≤", "≥", "="])[np.arange(n) % 3]
+    folga = rng.uniform(0.5, 5.0, n)
+    b = np.where(operadores == "≤", ax + folga, np.where(operadores == "≥", ax - folga, ax))
+    return rng.uniform(1.0, 10.0, n), A, b, list(operadores), "Minimizar", "Optimal"
+
+
+FAMILIAS = {
+    "denso": gerar_denso,
+    "esparso": gerar_esparso,
+    "degenerado": gerar_degenerado,
+    "inviavel": gerar_inviavel,
+    "ilimitado": gerar_ilimitado,
+    "misto": gerar_misto,
+}
+
+
+def motores_disponiveis():
+    """Motores cujas dependências estão instaladas"""
+    dependencias = {"highs": "scipy.optimize", "pulp": "pulp"}
+    disponiveis = []
+    for motor in MOTORES:
+        try:
+            if motor in dependencias:
+                __import__(dependencias[motor])
+        except ImportError:
+            continue
+        disponiveis.append(motor)
+    return disponiveis
+
+
+@contextmanager
+def _silenciar_saida():
+    """Descarta o que o CBC (subprocesso) escreve no stdout, para não misturar com o JSON"""
+    sys.stdout.flush()
+    salvo = os.dup(1)
+    with open(os.devnull, "w") as nulo:
+        os.dup2(nulo.fileno(), 1)
+        try:
+            yield
+        finally:
+            os.dup2(salvo, 1)
+            os.close(salvo)
+
+
+def executar(problema, motor):
+    """Uma resolução: (resultado, segundos totais, segundos por etapa)"""
+    c, A, b, operadores, tipo, _ = problema
+    controle = Controle()
+    inicio = time.perf_counter()
+    with _silenciar_saida():
+        r = simplex(c, A, b, operadores, len(c), tipo, motor=motor, usar_cache=False, controle=controle)
+    total = time.perf_counter() - inicio
+    fases = controle.medicao.fases
+    etapas = {etapa: sum(fases[f][0] for f in nomes if f in fases) for etapa, nomes in ETAPAS.items()}
+    return r, total, etapas
+
+
+def pico_memoria(problema, motor):
+    """Pico de memória rastreada (MiB) numa resolução à parte"""
+    tracemalloc.start()
+    try:
+        executar(problema, motor)
+        _, pico = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return pico / 1024 / 1024
+
+
+def medir_caso(familia, tamanho, motor, problema, repeticoes, memoria):
+    totais, etapas = [], {etapa: [] for etapa in ETAPAS}
+    for _ in range(repeticoes):
+        r, total, por_etapa = executar(problema, motor)
+        totais.append(total)
+        for etapa, segundos in por_etapa.items():
+            etapas[etapa].append(segundos)
+    A = problema[1]
+    nao_nulos = int(np.count_nonzero(A))
+    total = statistics.median(totais)
+    return {
+        "familia": familia, "tamanho": tamanho, "motor": motor, "m": A.shape[0], "n": A.shape[1],
+        "nao_nulos": nao_nulos, "status": r.status, "esperado": problema[5], "iteracoes": r.iteracoes,
+        "total_s": total, **{f"{etapa}_s": statistics.median(v) for etapa, v in etapas.items()},
+        "problemas_por_s": 1.0 / total if total else None,
+        "nao_nulos_por_s": nao_nulos / total if total else None,
+        "pico_mib": pico_memoria(problema, motor) if memoria else None,
+    }
+
+
+def comparar(medicoes, base, tolerancia):
+    """Regressões das medições em relação à base salva (lista de dicionários)"""
+    anteriores = {(b["familia"], b["tamanho"], b["motor"]): b for b in base["medicoes"]}
+    regressoes = []
+    for atual in medicoes:
+        anterior = anteriores.get((atual["familia"], atual["tamanho"], atual["motor"]))
+        if anterior is None:
+            continue
+        motivos = []
+        if atual["status"] != anterior["status"]:
+            motivos.append(f"status {anterior['status']} → {atual['status']}")
+        limite = anterior["total_s"] * (1 + tolerancia)
+        if atual["total_s"] > limite and atual["total_s"] - anterior["total_s"] > PISO_REGRESSAO_S:
+            motivos.append(f"tempo {anterior['total_s']:.4f} s → {atual['total_s']:.4f} s "
+                           f"({atual['total_s'] / anterior['total_s'] - 1:+.0%})")
+        if atual["iteracoes"] > anterior["iteracoes"] * (1 + tolerancia):
+            motivos.append(f"iterações {anterior['iteracoes']} → {atual['iteracoes']}")
+        if motivos:
+            regressoes.append({"familia": atual["familia"], "tamanho": atual["tamanho"],
+                               "motor": atual["motor"], "motivos": motivos})
+    return regressoes
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--tamanhos", type=int, nargs="+", default=[25, 50, 100])
+    parser.add_argument("--motores", nargs="+", default=motores_disponiveis())
+    parser.add_argument("--familias", nargs="+", default=list(FAMILIAS), choices=list(FAMILIAS))
+    parser.add_argument("--repeticoes", type=int, default=3)
+    parser.add_argument("--sem-memoria", action="store_true", help="não mede o pico de memória")
+    parser.add_argument("--semente", type=int, default=0)
+    parser.add_argument("--json", action="store_true", help="uma linha JSON por medição")
+    parser.add_argument("--salvar", metavar="ARQUIVO", help="grava as medições (base para --comparar)")
+    parser.add_argument("--comparar", metavar="ARQUIVO", help="aponta regressões em relação à base")
+    parser.add_argument("--tolerancia", type=float, default=0.25, help="aumento relativo tolerado")
+    args = parser.parse_args()
+
+    # Aquecimento: importações e primeira chamada de cada motor fora da medição
+    aquecimento = gerar_denso(5, np.random.default_rng(args.semente))
+    for motor in args.motores:
+        executar(aquecimento, motor)
+
+    if not args.json:
+        print(f"{'família':>10} {'n':>4} {'motor':>8} {'status':>10} {'it.':>5} {'montagem':>9} "
+              f"{'resolução':>9} {'extração':>9} {'total (s)':>9} {'prob/s':>7} {'pico MiB':>8}")
+    medicoes = []
+    for familia in args.familias:
+        for tamanho in args.tamanhos:
+            # Mesma semente por (família, tamanho): o problema não depende de quais outros rodam
+            rng = np.random.default_rng([args.semente, list(FAMILIAS).index(familia), tamanho])
+            problema = FAMILIAS[familia](tamanho, rng)
+            for motor in args.motores:
+                medicao = medir_caso(familia, tamanho, motor, problema, args.repeticoes, not args.sem_memoria)
+                medicoes.append(medicao)
+                if medicao["status"] != medicao["esperado"]:
+                    print(f"status inesperado em {familia} n={tamanho} ({motor}): "
+                          f"{medicao['status']} (esperado {medicao['esperado']})", file=sys.stderr)
+                if args.json:
+                    print(json.dumps(medicao), flush=True)
+                else:
+                    pico = "—" if medicao["pico_mib"] is None else f"{medicao['pico_mib']:.2f}"
+                    print(f"{familia:>10} {tamanho:>4} {motor:>8} {medicao['status']:>10} "
+                          f"{medicao['iteracoes']:>5} {medicao['montagem_s']:>9.4f} {medicao['resolucao_s']:>9.4f} "
+                          f"{medicao['extracao_s']:>9.4f} {medicao['total_s']:>9.4f} "
+                          f"{medicao['problemas_por_s']:>7.1f} {pico:>8}", flush=True)
+
+    if args.salvar:
+        documento = {"ambiente": {"python": platform.python_version(), "numpy": np.__version__,
+                                  "plataforma": platform.platform(), "processador": platform.processor(),
+                                  "semente": args.semente, "repeticoes": args.repeticoes},
+                     "medicoes": medicoes}
+        with open(args.salvar, "w", encoding="utf-8") as f:
+            json.dump(documento, f, ensure_ascii=False, indent=1)
+
+    if args.comparar:
+        with open(args.comparar, encoding="utf-8") as f:
+            regressoes = comparar(medicoes, json.load(f), args.tolerancia)
+        for regressao in regressoes:
+            if args.json:
+                print(json.dumps({"regressao": regressao}, ensure_ascii=False))
+            else:
+                print(f"REGRESSÃO {regressao['familia']} n={regressao['tamanho']} ({regressao['motor']}): "
+                      + "; ".join(regressao["motivos"]))
+        if not args.json:
+            print(f"{len(regressoes)} regressão(ões) em relação a {args.comparar}")
+        if regressoes:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
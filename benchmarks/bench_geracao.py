@@ -0,0 +1,118 @@
+"""
+Benchmark: modelo inteiro × geração preguiçosa de linhas.
+
+Gera PPLs com muitas restrições "≤" das quais poucas ficam ativas no ótimo:
+"esfera" (planos tangentes à bola unitária em direções aleatórias, um
+poliedro que aproxima a bola) e "capacidade" (A ≥ 0 esparsa, lados direitos
+folgados na maioria das linhas). Para cada motor, compara tempo e pico de
+memória (tracemalloc, numa execução à parte) do problema inteiro com os de
+``gerar_linhas=True``, confere o valor ótimo e mostra o tamanho final do
+conjunto de trabalho e as rodadas.
+
+Uso:
+    python benchmarks/bench_geracao.py [--linhas 20000 100000] [--colunas 50 200]
+        [--familias esfera capacidade] [--motores highs revisado] [--sem-memoria] [--json]
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+from scipy.sparse import random as esparsa
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ppl.motores import resolver  # noqa: E402
+
+# O Simplex Revisado fatora bases densas m×m: no modelo inteiro, só até este número de linhas
+MAX_LINHAS_REVISADO = 3000
+
+
+def gerar(familia, m, n, rng):
+    """PPL de maximização com m linhas "≤" e n variáveis"""
+    if familia == "esfera":
+        A = rng.normal(size=(m, n))
+        A /= np.linalg.norm(A, axis=1)[:, None]
+        return rng.uniform(0.0, 1.0, n), A, np.ones(m), ["≤"] * m
+    A = esparsa(m, n, density=min(10 / n, 1.0), format="csr", random_state=rng, data_rvs=lambda k: rng.uniform(1, 10, k))
+    b = rng.uniform(1.0, 2.0, m) * np.asarray(A.sum(axis=1)).ravel() * n
+    b[rng.choice(m, max(m // 100, 1), replace=False)] /= n      # 1% das linhas aperta de verdade
+    return rng.uniform(1.0, 10.0, n), A, b + 1.0, ["≤"] * m
+
+
+def cronometrar(*args, **kwargs):
+    inicio = time.perf_counter()
+    resultado = resolver(*args, **kwargs)
+    return resultado, time.perf_counter() - inicio
+
+
+def pico_memoria(*args, **kwargs):
+    """Pico de memória rastreada (MiB) numa resolução à parte"""
+    tracemalloc.start()
+    try:
+        resolver(*args, **kwargs)
+        _, pico = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return pico / 1024 / 1024
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--linhas", type=int, nargs="+", default=[20_000, 100_000])
+    parser.add_argument("--colunas", type=int, nargs="+", default=[50, 200])
+    parser.add_argument("--familias", nargs="+", default=["esfera", "capacidade"])
+    parser.add_argument("--motores", nargs="+", default=["highs", "revisado"])
+    parser.add_argument("--sem-memoria", action="store_true", help="não mede o pico de memória")
+    parser.add_argument("--json", action="store_true", help="uma linha JSON por medição")
+    args = parser.parse_args()
+
+    # Aquecimento: importações e primeira chamada de cada motor fora da medição
+    for motor in args.motores:
+        resolver([1.0, 1.0], [[1.0, 0.0], [0.0, 1.0]], [1.0, 2.0], ["≤", "≤"], "Maximizar",
+                 motor=motor, gerar_linhas=True)
+
+    rng = np.random.default_rng(0)
+    if not args.json:
+        print(f"{'família':>10} {'motor':>9} {'m×n':>13} {'ativas':>7} {'rodadas':>7} {'inteiro (s)':>11} "
+              f"{'linhas (s)':>10} {'aceleração':>10} {'MiB inteiro':>11} {'MiB linhas':>10}")
+    for familia in args.familias:
+        for m in args.linhas:
+            for n in args.colunas:
+                c, A, b, operadores = gerar(familia, m, n, rng)
+                for motor in args.motores:
+                    inteiro_cabe = motor != "revisado" or m <= MAX_LINHAS_REVISADO
+                    inteiro, t_inteiro = (cronometrar(c, A, b, operadores, "Maximizar", motor=motor)
+                                          if inteiro_cabe else (None, None))
+                    lazy, t_lazy = cronometrar(c, A, b, operadores, "Maximizar", motor=motor, gerar_linhas=True)
+                    if inteiro is not None and (inteiro.status != lazy.status or (
+                            inteiro.status == "Optimal" and not np.isclose(inteiro.valorOtimo, lazy.valorOtimo))):
+                        print(f"divergência em {familia} {motor} {m}×{n}: {inteiro.status}/{lazy.status}",
+                              file=sys.stderr)
+                    memoria = (None, None)
+                    if not args.sem_memoria:
+                        memoria = (pico_memoria(c, A, b, operadores, "Maximizar", motor=motor) if inteiro_cabe
+                                   else None,
+                                   pico_memoria(c, A, b, operadores, "Maximizar", motor=motor, gerar_linhas=True))
+                    g = lazy.geracao
+                    medicao = {"familia": familia, "motor": motor, "m": m, "n": n, "ativas": g.ativas,
+                               "rodadas": g.rodadas, "inteiro_s": t_inteiro, "linhas_s": t_lazy,
+                               "aceleracao": t_inteiro / t_lazy if t_inteiro else None,
+                               "mib_inteiro": memoria[0], "mib_linhas": memoria[1]}
+                    if args.json:
+                        print(json.dumps(medicao, ensure_ascii=False))
+                        continue
+                    def fmt(v, f, largura):
+                        return f"{'—':>{largura}}" if v is None else f"{v:>{largura}{f}}"
+                    print(f"{familia:>10} {motor:>9} {f'{m}×{n}':>13} {g.ativas:>7,} {g.rodadas:>7} "
+                          f"{fmt(t_inteiro, '.3f', 11)} {t_lazy:>10.3f} "
+                          f"{fmt(medicao['aceleracao'], '.1f', 9)}{'×' if t_inteiro else ' '} "
+                          f"{fmt(memoria[0], '.1f', 11)} {fmt(memoria[1], '.1f', 10)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""
+Benchmark: branch-and-bound (ppl.inteiro) em série e em paralelo.
+
+Gera problemas da mochila multidimensional com variáveis binárias (ou inteiras
+limitadas) e resolve cada um com 1 processo e com ``--processos`` processos,
+medindo nós resolvidos, nós por segundo e o efeito da partida a quente (média
+de iterações por nó contra as iterações da raiz). O valor ótimo é conferido
+com o CBC (motor "pulp") quando ``--conferir`` é passado.
+
+Uso:
+    python benchmarks/bench_inteiro.py [--tamanhos 15 20 25] [--processos 4] [--gap 0] [--json]
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ppl.inteiro import resolver_inteiro  # noqa: E402
+from ppl.motores import resolver  # noqa: E402
+
+RESTRICOES = 5
+
+
+def gerar(tamanho, rng, tipo="Binária"):
+    """Mochila multidimensional: max c·x, A x ≤ b, com b = metade da soma de cada linha"""
+    A = rng.integers(5, 60, (RESTRICOES, tamanho)).astype(float)
+    b = A.sum(axis=1) * 0.5
+    c = A.sum(axis=0) + rng.integers(0, 20, tamanho)
+    return c, A, b, ["≤"] * RESTRICOES, [tipo] * tamanho
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--tamanhos", type=int, nargs="+", default=[15, 20, 25])
+    parser.add_argument("--processos", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--motor", default="revisado", choices=["revisado", "highs"])
+    parser.add_argument("--gap", type=float, default=0.0)
+    parser.add_argument("--conferir", action="store_true", help="confere o valor ótimo com o CBC")
+    parser.add_argument("--json", action="store_true", help="uma linha JSON por medição")
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    if not args.json:
+        print(f"{'n':>4} {'proc':>4} {'nós':>7} {'nós/s':>7} {'it. raiz':>8} {'it./nó':>7} "
+              f"{'quentes':>7} {'tempo (s)':>9}  Z*")
+    for tamanho in args.tamanhos:
+        c, A, b, operadores, tipos = gerar(tamanho, rng)
+        referencia = None
+        if args.conferir:
+            referencia = resolver(c, A, b, operadores, "Maximizar", motor="pulp", tipos=tipos, gap=0.0)
+        for processos in sorted({1, args.processos}):
+            inicio = time.perf_counter()
+            r = resolver_inteiro(args.motor, c, A, b, operadores, True, tipos, gap=args.gap, processos=processos)
+            segundos = time.perf_counter() - inicio
+            e = r.mip
+            por_no = (e.iteracoes_lp - e.iteracoes_raiz) / max(e.nos - 1, 1)
+            if referencia is not None and not np.isclose(r.valorOtimo, referencia.valorOtimo):
+                print(f"divergência em n={tamanho}: {r.valorOtimo} × CBC {referencia.valorOtimo}", file=sys.stderr)
+            medicao = {"n": tamanho, "processos": processos, "status": r.status, "valor": r.valorOtimo,
+                       "nos": e.nos, "nos_por_s": e.nos_por_segundo, "iteracoes_raiz": e.iteracoes_raiz,
+                       "iteracoes_por_no": por_no, "partidas_quentes": e.partidas_quentes, "segundos": segundos}
+            if args.json:
+                print(json.dumps(medicao))
+            else:
+                print(f"{tamanho:>4} {processos:>4} {e.nos:>7} {e.nos_por_segundo:>7.0f} {e.iteracoes_raiz:>8} "
+                      f"{por_no:>7.1f} {e.partidas_quentes:>7} {segundos:>9.3f}  {r.valorOtimo:g}")
+
+
+if __name__ == "__main__":
+    main()
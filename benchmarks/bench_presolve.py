@@ -0,0 +1,102 @@
+"""
+Benchmark: resolução com e sem pré-resolução (presolve + escala).
+
+Gera PPLs com redundâncias típicas de modelos montados à mão ou por planilha
+(restrições duplicadas e paralelas, variáveis fixadas por igualdades de um só
+coeficiente, colunas sem uso ou dominadas e linhas em escalas muito diferentes)
+e compara, para cada motor, o tempo total com e sem ``presolve=True``. O valor
+ótimo das duas resoluções é conferido.
+
+Uso:
+    python benchmarks/bench_presolve.py [--tamanhos 50 100 200] [--motores revisado highs] [--json]
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ppl.motores import resolver  # noqa: E402
+
+
+def gerar(tamanho, rng):
+    """PPL de maximização viável e limitado, com ~50% de linhas/colunas redundantes"""
+    m = n = tamanho
+    A = rng.random((m, n)) * (rng.random((m, n)) < 0.3)
+    b = A.sum(axis=1) + rng.random(m) * n
+    c = rng.random(n)
+
+    # Colunas dominadas (custo negativo e só consomem recursos) e vazias
+    extras = n // 8
+    A = np.hstack([A, rng.random((m, extras)) * (rng.random((m, extras)) < 0.3), np.zeros((m, extras))])
+    c = np.concatenate([c, -rng.random(extras), -rng.random(extras)])
+    operadores = ["≤"] * m
+
+    # Restrições paralelas (cópias escaladas, algumas mais frouxas)
+    k = m // 4
+    origem = rng.integers(0, m, k)
+    fator = rng.choice([0.5, 2.0, 10.0], k)
+    A = np.vstack([A, A[origem] * fator[:, None]])
+    b = np.concatenate([b, b[origem] * fator * rng.choice([1.0, 1.5], k)])
+    operadores += ["≤"] * k
+
+    # Variáveis fixadas por igualdades singulares
+    fixas = rng.choice(n, n // 8, replace=False)
+    linhas = np.zeros((len(fixas), A.shape[1]))
+    linhas[np.arange(len(fixas)), fixas] = 1.0
+    A = np.vstack([A, linhas])
+    b = np.concatenate([b, rng.random(len(fixas))])
+    operadores += ["="] * len(fixas)
+
+    # Escalas muito diferentes entre as linhas
+    escala = 10.0 ** rng.integers(-3, 4, A.shape[0])
+    return c, A * escala[:, None], b * escala, operadores
+
+
+def cronometrar(*args, **kwargs):
+    inicio = time.perf_counter()
+    resultado = resolver(*args, **kwargs)
+    return resultado, time.perf_counter() - inicio
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--tamanhos", type=int, nargs="+", default=[50, 100, 200])
+    parser.add_argument("--motores", nargs="+", default=["revisado", "highs"])
+    parser.add_argument("--json", action="store_true", help="uma linha JSON por medição")
+    args = parser.parse_args()
+
+    # Aquecimento: importações e primeira chamada de cada motor fora da medição
+    for motor in args.motores:
+        resolver([1.0, 1.0], [[1.0, 1.0], [1.0, 1.0]], [1.0, 2.0], ["≤", "≤"], "Maximizar",
+                 motor=motor, presolve=True)
+
+    rng = np.random.default_rng(0)
+    if not args.json:
+        print(f"{'motor':>9} {'m×n':>9} {'linhas-':>8} {'colunas-':>9} {'sem (s)':>9} {'com (s)':>9} {'poupado':>8}")
+    for tamanho in args.tamanhos:
+        c, A, b, operadores = gerar(tamanho, rng)
+        m, n = A.shape
+        for motor in args.motores:
+            sem, t_sem = cronometrar(c, A, b, operadores, "Maximizar", motor=motor)
+            com, t_com = cronometrar(c, A, b, operadores, "Maximizar", motor=motor, presolve=True)
+            if sem.status != com.status or (sem.status == "Optimal" and not np.isclose(sem.valorOtimo, com.valorOtimo)):
+                print(f"divergência em {motor} {m}×{n}: {sem.status}/{com.status}", file=sys.stderr)
+            e = com.presolve
+            medicao = {"motor": motor, "m": m, "n": n, "linhas_removidas": e.linhas_removidas,
+                       "colunas_removidas": e.colunas_removidas, "sem_s": t_sem, "com_s": t_com,
+                       "poupado_s": t_sem - t_com}
+            if args.json:
+                print(json.dumps(medicao))
+            else:
+                print(f"{motor:>9} {f'{m}×{n}':>9} {e.linhas_removidas:>8} {e.colunas_removidas:>9} "
+                      f"{t_sem:>9.4f} {t_com:>9.4f} {t_sem - t_com:>+8.4f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,7 +1,27 @@
 import numpy as np
 import streamlit as st
 import pandas as pd
-from pulp import LpMaximize, LpMinimize, LpProblem, LpVariable, LpStatus, value
+
+from ppl import Problema, simplex, validar_entrada
+from ppl.cache import cache_global
+from ppl.desempenho import Medicao, emitir
+from ppl.exportacao import (FORMATOS, ativas, exportar, filtrar, linhas, nao_nulas, pagina, parquet_disponivel,
+                            tabela_iis, tabela_restricoes, tabela_solucao, tabelas_sensibilidade)
+from ppl.inteiro import GAP_PADRAO, TIPOS
+from ppl.leitura import ler_modelo
+from ppl.motores import MOTORES, motor_padrao, resolver
+from ppl.sensibilidade import analisar
+from ppl.tarefas import gerenciador_global
+
+# Limites do formulário (a grade de edição não cria um widget por coeficiente)
+MAX_VARIAVEIS = 100
+MAX_RESTRICOES = 100
+OPERADORES = ["≤", "=", "≥"]
+
+# Resoluções que terminam nesse prazo (s) são exibidas direto, sem acompanhamento
+ESPERA_SINCRONA = 0.3
+INTERVALO_PROGRESSO = 0.5
+LINHAS_POR_PAGINA = 100
 
 st.set_page_config(
     page_title="Calculadora Simplex - PPL",
@@ -130,132 +150,301 @@ st.markdown("""
 
 # ==================== FUNÇÕES PRINCIPAIS ====================
 
-def simplex(funcObj, restricoes, constantes, operadores, num_variables, tipo_otimizacao):
+def exibir_falha(resultado, progresso=None, nomes_variaveis=None, modelo=None):
     """
-    Resolve Problemas de Programação Linear usando biblioteca PuLP
-    Agora suporta restrições do tipo ≤, ≥ e =.
-    Retorna também um tableau simplificado para exibição (com uma coluna de folga/sobra por restrição).
-    Observação: o tableau aqui é uma representação simples para visualização.
+    Mostra ao usuário por que não há solução ótima. ``modelo``: (restrições,
+    constantes, operadores, nomes das restrições) para escrever o conflito mínimo.
     """
-    try:
-        # Define o tipo de problema
-        if tipo_otimizacao == "Maximizar":
-            prob = LpProblem("PPL", LpMaximize)
-        else:
-            prob = LpProblem("PPL", LpMinimize)
-        
-        # Cria as variáveis de decisão (não-negativas)
-        vars = [LpVariable(f"x{i+1}", lowBound=0) for i in range(num_variables)]
-        
-        # Define a função objetivo
-        prob += sum([funcObj[i] * vars[i] for i in range(num_variables)]), "FuncaoObjetivo"
-        
-        # Adiciona as restrições conforme o operador escolhido
-        for i in range(len(constantes)):
-            expr = sum([restricoes[i][j] * vars[j] for j in range(num_variables)])
-            op = operadores[i]
-            if op == "≤":
-                prob += (expr <= constantes[i], f"Restricao_{i+1}")
-            elif op == "≥":
-                prob += (expr >= constantes[i], f"Restricao_{i+1}")
-            else:  # "="
-                prob += (expr == constantes[i], f"Restricao_{i+1}")
-        
-        # Resolve o problema
-        status = prob.solve()
-        
-        # Verifica se encontrou solução ótima
-        if LpStatus[prob.status] != "Optimal":
-            st.error(f"❌ **Não foi possível encontrar solução ótima.**\n\nStatus: {LpStatus[prob.status]}")
-            if LpStatus[prob.status] == "Infeasible":
-                st.warning("⚠️ O problema é **inviável** - as restrições são inconsistentes.")
-            elif LpStatus[prob.status] == "Unbounded":
-                st.warning("⚠️ O problema é **ilimitado** - a função objetivo pode crescer indefinidamente.")
-            return None, None, None, None
-        
-        # Extrai a solução
-        solucao = np.array([value(var) for var in vars])
-        
-        # Valor ótimo
-        valorOtimo = value(prob.objective)
-        
-        # Preços-sombra (dual values das restrições)
-        precoSombra = []
-        for i in range(len(constantes)):
-            constraint = prob.constraints.get(f"Restricao_{i+1}")
-            if constraint and hasattr(constraint, 'pi') and constraint.pi is not None:
-                precoSombra.append(constraint.pi)
-            else:
-                precoSombra.append(0.0)
-        precoSombra = np.array(precoSombra)
-        
-        # Monta um tableau simplificado para exibição
-        # Colunas: variáveis de decisão | uma coluna 's_i' por restrição (folga/sobra) | LD
-        n_cons = len(constantes)
-        tableau = np.zeros((n_cons + 1, num_variables + n_cons + 1))
-        
-        # Preenche com valores das restrições e coluna de folga/sobra
-        for i in range(n_cons):
-            for j in range(num_variables):
-                tableau[i, j] = restricoes[i][j]
-            # para <= colocamos +1 na coluna de folga, para >= colocamos -1, para = colocamos 0
-            if operadores[i] == "≤":
-                tableau[i, num_variables + i] = 1
-            elif operadores[i] == "≥":
-                tableau[i, num_variables + i] = -1
-            else:
-                tableau[i, num_variables + i] = 0
-            tableau[i, -1] = constantes[i]
-        
-        # Linha da função objetivo (coeficientes)
-        for i, coef in enumerate(funcObj):
-            tableau[-1, i] = coef
-        tableau[-1, -1] = valorOtimo
-        
-        return solucao, valorOtimo, precoSombra, tableau
-        
-    except Exception as e:
-        st.error(f"❌ **Erro ao resolver o problema:**\n\n{str(e)}")
-        return None, None, None, None
+    if progresso is not None and progresso.cancelada:
+        st.info(f"⏹️ Resolução cancelada após {progresso.segundos:.1f} s ({progresso.iteracoes} iterações).")
+        if resultado.mip is not None:
+            exibir_mip(resultado.mip)
+        return
+    st.error(f"❌ **Não foi possível encontrar solução ótima.**\n\nStatus: {resultado.status}")
+    if resultado.status == "Infeasible":
+        st.warning("⚠️ O problema é **inviável** - as restrições são inconsistentes.")
+        if resultado.iis is not None and modelo is not None:
+            exibir_iis(resultado.iis, modelo, nomes_variaveis)
+        elif resultado.mip is not None:
+            st.info("ℹ️ Sem as exigências de integralidade o problema é viável: o conflito vem das "
+                    "variáveis inteiras/binárias, não de um subconjunto das restrições.")
+    elif resultado.status == "Unbounded":
+        st.warning("⚠️ O problema é **ilimitado** - a função objetivo pode crescer indefinidamente.")
+    elif resultado.status == "Not Solved":
+        st.warning("⏱️ O **limite de tempo** (ou de iterações) foi atingido antes do ótimo.")
+        if resultado.mip is not None:
+            exibir_mip(resultado.mip)
+        if resultado.solucao is not None:
+            st.markdown(f"**Melhor ponto viável encontrado** (Z = {resultado.valorOtimo:,.4f}) — "
+                        "variáveis não nulas:")
+            nao_nulas = np.flatnonzero(np.abs(resultado.solucao) > 1e-9)
+            st.dataframe(
+                pd.DataFrame({'Variável': [nomes_variaveis[j] if nomes_variaveis else f"x{j+1}" for j in nao_nulas],
+                              'Valor': resultado.solucao[nao_nulas]}),
+                use_container_width=True,
+                hide_index=True
+            )
 
 
-def validar_entrada(funcObj, restricoes, constantes, operadores):
-    """Valida os dados de entrada do problema"""
-    erros = []
-    
-    # Verifica se os coeficientes da função objetivo são números válidos
-    if not all(isinstance(c, (int, float, np.floating, np.integer)) for c in funcObj):
-        erros.append("⚠️ Coeficientes da função objetivo devem ser numéricos")
-    
-    # Verifica se há pelo menos uma restrição
-    if len(restricoes) == 0:
-        erros.append("⚠️ Deve haver pelo menos uma restrição")
+def exibir_iis(iis, modelo, nomes_variaveis):
+    """Conflito mínimo de restrições (IIS) que torna o problema inviável"""
+    restricoes, constantes, operadores, nomes_restricoes = modelo
+    total = len(constantes)
+    st.markdown(f"#### 🔎 Conflito mínimo: {len(iis.linhas):,} de {total:,} restrições")
+    st.markdown("Estas restrições (com x ≥ 0) não podem valer ao mesmo tempo, e retirar **qualquer uma** "
+                "delas torna o restante viável. Revise uma delas para corrigir o modelo.")
+    if nomes_variaveis is None:
+        nomes_variaveis = [f"x{j+1}" for j in range(np.shape(restricoes)[1])]
+    tabela = tabela_iis(iis.linhas, restricoes, constantes, operadores, nomes_variaveis, nomes_restricoes)
+    st.dataframe(pd.DataFrame(tabela), use_container_width=True, hide_index=True)
+    st.caption(f"🧭 Semente de Farkas com {iis.semente:,} restrições, {iis.resolucoes:,} re-resoluções "
+               f"({iis.iteracoes:,} pivôs) em {iis.segundos * 1000:.1f} ms"
+               + ("" if iis.minimo else " | ⚠️ interrompido: o conjunto é inviável, mas pode não ser mínimo"))
+
+
+def exibir_presolve(estatisticas):
+    """Resumo do que a pré-resolução eliminou e do tempo de cada etapa"""
+    e = estatisticas
+    escala = (f" | escala max/min {e.razao_antes:.3g} → {e.razao_depois:.3g}"
+              if e.razao_depois != e.razao_antes else "")
+    st.caption(f"🧹 Pré-resolução: {e.linhas_removidas:,} de {e.linhas:,} restrições e "
+               f"{e.colunas_removidas:,} de {e.colunas:,} variáveis eliminadas{escala} | "
+               f"pré-resolução {e.segundos_presolve * 1000:.1f} ms + resolução {e.segundos_resolucao * 1000:.1f} ms")
+
+
+def exibir_decomposicao(estatisticas):
+    """Resumo da estrutura em blocos encontrada e de como ela foi resolvida"""
+    e = estatisticas
+    if e.tipo == "monolítico":
+        st.caption(f"🧩 Decomposição: nenhuma estrutura em blocos encontrada; resolvido inteiro "
+                   f"(detecção {e.segundos_deteccao * 1000:.1f} ms)")
+        return
+    como = (f"{e.blocos:,} blocos independentes" if e.tipo == "bloco-diagonal" else
+            f"{e.blocos:,} blocos ligados por {e.ligantes:,} restrições (Dantzig–Wolfe, {e.rodadas:,} rodadas, "
+            f"{e.colunas:,} colunas)")
+    st.caption(f"🧩 Decomposição: {como} em {e.processos} processo(s) | detecção {e.segundos_deteccao * 1000:.1f} ms "
+               f"+ resolução {e.segundos_resolucao * 1000:.1f} ms"
+               + (f" | ⚠️ {e.observacao}" if e.observacao else ""))
+
+
+def exibir_geracao(estatisticas):
+    """Resumo da geração de linhas: conjunto de trabalho, rodadas e tempos"""
+    e = estatisticas
+    st.caption(f"📉 Geração de linhas: {e.ativas:,} de {e.linhas:,} restrições no modelo final "
+               f"(começou com {e.iniciais:,}; até {e.lote:,} por rodada) em {e.rodadas:,} rodada(s), "
+               f"{e.quentes:,} com partida a quente | varredura {e.segundos_varredura * 1000:.1f} ms "
+               f"+ resolução {e.segundos_resolucao * 1000:.1f} ms")
+
+
+def exibir_barreira(estatisticas, escolha=None):
+    """Resumo da barreira (iterações, resíduos, crossover) e, no motor auto, do método escolhido"""
+    if escolha is not None:
+        st.caption(f"🤖 Método automático: **{escolha.metodo}** ({escolha.motivo})")
+    e = estatisticas
+    if e is None:
+        return
+    crossover = (f"crossover {e.iteracoes_crossover:,} pivôs em {e.segundos_crossover * 1000:.1f} ms"
+                 if e.crossover else "sem crossover (solução do ponto interior)")
+    st.caption(f"🚧 Barreira: {e.iteracoes:,} iterações em {e.segundos_barreira * 1000:.1f} ms "
+               f"(resíduos {e.residuo_primal:.1e}/{e.residuo_dual:.1e}, gap {e.gap:.1e}) | {crossover}"
+               + (f" | ⚠️ {e.observacao}" if e.observacao else ""))
+
+
+def exibir_mip(estatisticas):
+    """Resumo da busca do branch-and-bound (problemas com variáveis inteiras)"""
+    e = estatisticas
+    gap = "—" if e.gap is None else f"{e.gap:.4%}"
+    limitante = "—" if e.limitante is None else f"{e.limitante:,.4f}"
+    abertos = f" | {e.nos_abertos:,} nós em aberto" if e.nos_abertos else ""
+    media = (e.iteracoes_lp - e.iteracoes_raiz) / max(e.nos - 1, 1)
+    st.caption(f"🌳 Branch-and-bound: {e.nos:,} nós em {e.segundos:.2f} s ({e.nos_por_segundo:,.0f} nós/s, "
+               f"{e.processos} processo{'s' if e.processos > 1 else ''}){abertos} | limitante {limitante} | "
+               f"gap {gap} | raiz com {e.iteracoes_raiz} iterações, demais nós com {media:.1f} em média "
+               f"({e.partidas_quentes:,} a partir da base do pai)")
+
+
+def exibir_desempenho(medicao, encerrar_renderizacao, extras):
+    """
+    Fecha a fase de renderização, mostra o expander "Desempenho" e emite a
+    medição da resolução como uma linha JSON (ver ppl.desempenho).
+    """
+    encerrar_renderizacao()
+    registro = medicao.registro(**extras)
+    emitir(registro)
     
-    # Verifica se todas as restrições têm o mesmo número de coeficientes
-    if restricoes and not all(len(r) == len(restricoes[0]) for r in restricoes):
-        erros.append("⚠️ Todas as restrições devem ter o mesmo número de variáveis")
+    with st.expander("⏱️ **Desempenho**", expanded=False):
+        total = medicao.total()
+        col_d1, col_d2, col_d3 = st.columns(3)
+        col_d1.metric("Tempo medido", f"{total * 1000:,.1f} ms")
+        col_d2.metric("Iterações", f"{medicao.contadores.get('iteracoes', 0):,}")
+        if "nos" in medicao.contadores:
+            col_d3.metric("Nós (branch-and-bound)", f"{medicao.contadores['nos']:,}")
+        st.dataframe(
+            pd.DataFrame({
+                'Fase': list(medicao.fases),
+                'Tempo (ms)': [f[0] * 1000 for f in medicao.fases.values()],
+                '% do total': [f[0] / total * 100 if total else 0.0 for f in medicao.fases.values()],
+                'Blocos alocados': [f[1] for f in medicao.fases.values()],
+                'Chamadas': [f[2] for f in medicao.fases.values()],
+            }),
+            use_container_width=True,
+            hide_index=True,
+            column_config={
+                "Tempo (ms)": st.column_config.NumberColumn(format="%.2f"),
+                "% do total": st.column_config.NumberColumn(format="%.1f%%"),
+                "Blocos alocados": st.column_config.NumberColumn(
+                    help="Saldo de blocos de memória alocados no processo durante a fase"),
+            }
+        )
+        st.caption("Cada resolução também é registrada como uma linha JSON no logger `ppl.desempenho` "
+                   "(e no arquivo de SIMPLEX_LOG_DESEMPENHO, se definido).")
+        if medicao.perfil is not None:
+            st.markdown("**🔬 Perfil da resolução**")
+            st.code(medicao.perfil, language=None)
+            st.download_button("⬇️ Baixar perfil", medicao.perfil, file_name="perfil_simplex.txt",
+                               key=f"baixar_perfil_{extras['origem']}", on_click="ignore")
+
+
+@st.fragment
+def exibir_tabela(chave, tabela, filtros=(), visiveis=None, formato="%.2f", arquivo="tabela"):
+    """
+    Tabela de resultados numérica (ver ppl.exportacao) num fragmento: filtros,
+    paginação e downloads não reexecutam a página. Só a página visível vira
+    DataFrame; CSV/Parquet são gerados em blocos quando o botão é clicado.
+    filtros: (rótulo, máscara, marcado por padrão) para cada caixa de seleção.
+    visiveis: colunas exibidas (o download leva todas).
+    """
+    for i, (rotulo, mascara, padrao) in enumerate(filtros):
+        if st.checkbox(rotulo, value=padrao, key=f"{chave}_filtro_{i}"):
+            tabela = filtrar(tabela, mascara)
     
-    # Verifica consistência entre tamanhos
-    if not (len(constantes) == len(restricoes) == len(operadores)):
-        erros.append("⚠️ Número de constantes, operadores e restrições deve ser o mesmo")
+    total = linhas(tabela)
+    inicio = 0
+    if total > LINHAS_POR_PAGINA:
+        paginas = -(-total // LINHAS_POR_PAGINA)
+        numero = st.number_input(f"Página (de {paginas:,})", min_value=1, max_value=paginas, value=1,
+                                 key=f"{chave}_pagina_{total}")
+        inicio = (numero - 1) * LINHAS_POR_PAGINA
+        st.caption(f"Linhas {inicio + 1:,}–{min(inicio + LINHAS_POR_PAGINA, total):,} de {total:,}")
     
-    # Verifica os operadores
-    if any(op not in ["≤", "≥", "="] for op in operadores):
-        erros.append("⚠️ Operadores inválidos detectados")
+    visivel = pagina(tabela, inicio, LINHAS_POR_PAGINA)
+    if visiveis is not None:
+        visivel = {nome: visivel[nome] for nome in visiveis}
+    st.dataframe(
+        pd.DataFrame(visivel),
+        use_container_width=True,
+        hide_index=True,
+        column_config={nome: st.column_config.NumberColumn(nome, format=formato)
+                       for nome, valores in visivel.items() if valores.dtype.kind == "f"}
+    )
     
-    # Nota sobre constantes negativas (permitidas, mas pode gerar inviabilidade)
-    # Não bloqueamos, apenas avisamos
-    if any((not isinstance(c, (int, float, np.floating, np.integer))) for c in constantes):
-        erros.append("⚠️ As constantes (lado direito) devem ser numéricas")
+    formatos = ["csv", "parquet"] if parquet_disponivel() else ["csv"]
+    for coluna, formato_arquivo in zip(st.columns(len(formatos)), formatos):
+        coluna.download_button(f"⬇️ {formato_arquivo.upper()}", lambda f=formato_arquivo: exportar(tabela, f),
+                               file_name=f"{arquivo}.{formato_arquivo}", mime=FORMATOS[formato_arquivo],
+                               key=f"{chave}_baixar_{formato_arquivo}", on_click="ignore")
+
+
+def tabela_tableau(tableau, cabecalhos, rotulos):
+    """Tableau como tabela: coluna "Base" com o rótulo de cada linha e uma coluna por cabeçalho"""
+    return {"Base": np.asarray(rotulos, dtype=object),
+            **{nome: tableau[:, j] for j, nome in enumerate(cabecalhos)}}
+
+
+@st.fragment
+def exibir_historico(historico, cabecalhos, nomes_colunas):
+    """
+    Tableau após cada pivô, reconstruído sob demanda do histórico compacto
+    (ver ppl.historico). Num fragmento: mover o controle só reexecuta este trecho.
+    """
+    total = len(historico)
+    k = st.slider("Pivô", 0, total, total,
+                  help="0 = tableau inicial; cada passo aplica um pivô (o último é o tableau final)")
+    passo = historico.passo(k)
+    if passo.entrou is None:
+        st.caption("Tableau inicial: base formada pelas folgas e artificiais")
+    else:
+        st.caption(f"{passo.fase} — pivô {k} de {total}: entra **{nomes_colunas[passo.entrou]}**, "
+                   f"sai **{nomes_colunas[passo.saiu]}**")
+    rotulos = [nomes_colunas[j] for j in passo.base] + [passo.linha_custo]
+    st.dataframe(
+        pd.DataFrame(passo.tableau, columns=cabecalhos, index=rotulos),
+        use_container_width=True,
+        column_config={nome: st.column_config.NumberColumn(nome, format="%.2f") for nome in cabecalhos}
+    )
+    if historico.descartados:
+        st.caption(f"ℹ️ Só os primeiros {total:,} pivôs foram guardados; os outros "
+                   f"{historico.descartados:,} passaram do limite de memória do histórico.")
+
+
+@st.fragment(run_every=INTERVALO_PROGRESSO)
+def acompanhar_tarefa(chave):
+    """
+    Painel de progresso de uma resolução em segundo plano, atualizado sozinho.
+    Quando a tarefa termina, reexecuta a aplicação para exibir o resultado.
+    """
+    pedido = st.session_state.get(chave)
+    if pedido is None:
+        return
+    tarefa = pedido["tarefa"]
+    if tarefa.pronta():
+        st.rerun()
     
-    return erros
+    progresso = tarefa.progresso()
+    st.markdown('<div class="sub-header">⏳ Resolvendo em segundo plano</div>', unsafe_allow_html=True)
+    col_p1, col_p2, col_p3, col_p4 = st.columns(4)
+    arvore = progresso.fase == "Branch-and-bound"
+    col_p1.metric("Tempo decorrido", f"{progresso.segundos:.1f} s")
+    col_p2.metric("Nós resolvidos" if arvore else "Iterações", f"{progresso.iteracoes:,}")
+    col_p3.metric("Fase", progresso.fase)
+    col_p4.metric("Incumbente" if arvore else "Valor atual",
+                  "—" if progresso.objetivo is None else f"{progresso.objetivo:,.4f}",
+                  help="Melhor solução inteira encontrada até agora" if arvore else
+                       "Na Fase 1, soma das artificiais; na Fase 2, valor da função objetivo no ponto atual")
+    if arvore:
+        col_b1, col_b2, col_b3, _ = st.columns(4)
+        col_b1.metric("Limitante", "—" if progresso.limitante is None else f"{progresso.limitante:,.4f}",
+                      help="Melhor valor ainda possível entre os nós não explorados")
+        col_b2.metric("Gap", "—" if progresso.gap is None else f"{progresso.gap:.4%}")
+        col_b3.metric("Nós/s", f"{progresso.iteracoes / max(progresso.segundos, 1e-9):,.0f}")
+    if progresso.limite_tempo:
+        st.progress(min(progresso.segundos / progresso.limite_tempo, 1.0),
+                    text=f"Limite de tempo: {progresso.limite_tempo:.0f} s")
+    if progresso.cancelada:
+        st.caption("⏹️ Cancelamento solicitado...")
+    elif st.button("⏹️ Cancelar", key=f"cancelar_{chave}"):
+        tarefa.cancelar()
+
+
+def subscrito(numero):
+    """Índice em dígitos subscritos (12 -> ₁₂)"""
+    return str(numero).translate(str.maketrans("0123456789", "₀₁₂₃₄₅₆₇₈₉"))
+
+
+def redimensionar(valores, tamanho, padrao):
+    """Corta ou completa uma lista com o valor padrão"""
+    return list(valores[:tamanho]) + [padrao] * max(tamanho - len(valores), 0)
+
+
+def base_editor(chave, assinatura, montar):
+    """
+    DataFrame de partida de um st.data_editor e a versão dele.
+    A base só é recriada (com versão nova, ou seja, um editor novo) quando a
+    assinatura muda; fora isso, as edições ficam no estado do próprio editor.
+    """
+    guardado = st.session_state.get(chave)
+    if guardado is None or guardado["assinatura"] != assinatura:
+        versao = guardado["versao"] + 1 if guardado else 0
+        guardado = {"assinatura": assinatura, "base": montar(), "versao": versao}
+        st.session_state[chave] = guardado
+    return guardado["base"], guardado["versao"]
 
 
 # ==================== INTERFACE PRINCIPAL ====================
 
 # Cabeçalho
 st.markdown('<div class="main-header">📊 Calculadora de Programação Linear</div>', unsafe_allow_html=True)
-st.markdown('<div class="subtitle">Resolva problemas de otimização com o Método Simplex usando PuLP</div>', unsafe_allow_html=True)
+st.markdown('<div class="subtitle">Resolva problemas de otimização com o Método Simplex: Simplex Revisado próprio, HiGHS, PuLP ou pontos interiores</div>', unsafe_allow_html=True)
 
 # Informações sobre a ferramenta
 with st.expander("📚 **Sobre esta Calculadora** | Clique para expandir", expanded=False):
@@ -281,12 +470,14 @@ with st.expander("📚 **Sobre esta Calculadora** | Clique para expandir", expan
         st.markdown("""
         ### ⚙️ **Características desta Calculadora**
         
-        - ✅ Suporta **até 10 variáveis** de decisão
+        - ✅ Suporta **até 100 variáveis e 100 restrições** no formulário
         - ✅ Problemas de **Maximização** e **Minimização**
         - ✅ Restrições do tipo **≤**, **≥** e **=**
+        - ✅ Variáveis **inteiras** e **binárias** (branch-and-bound)
         - ✅ Calcula **ponto ótimo** e **valor ótimo**
         - ✅ Determina **preços-sombra** (shadow prices)
-        - ✅ Exibe **tableau simplificado** do Simplex
+        - ✅ **Análise de sensibilidade** (faixas de b e c)
+        - ✅ Exibe o **tableau ótimo** do Simplex (motor revisado)
         - ✅ Validação automática de entrada
         - ✅ Interface intuitiva e visual
         """)
@@ -296,9 +487,9 @@ with st.expander("📚 **Sobre esta Calculadora** | Clique para expandir", expan
     ### 📖 **Como usar:**
     
     1. **Configure** o número de variáveis e restrições na barra lateral
-    2. **Nomeie** as variáveis (opcional) para facilitar a interpretação
-    3. **Insira** os coeficientes da função objetivo
-    4. **Defina** as restrições com seus coeficientes, tipo e limites
+    2. **Nomeie** as variáveis e escolha o tipo (contínua, inteira ou binária) na barra lateral
+    3. **Insira** os coeficientes da função objetivo na grade (dá para colar da planilha)
+    4. **Defina** as restrições na grade: coeficientes, operador e lado direito
     5. **Clique** em "Calcular Solução Ótima" para obter os resultados
     6. **Analise** os resultados: ponto ótimo, valor ótimo, preços-sombra e tableau
     """)
@@ -322,40 +513,143 @@ tipo_otimizacao = st.sidebar.radio(
 st.sidebar.markdown("---")
 
 # Número de Variáveis
-num_variables = st.sidebar.selectbox(
+num_variables = st.sidebar.number_input(
     "🔢 **Número de Variáveis de Decisão**",
-    options=[2, 3, 4, 5, 6, 7, 8, 9, 10],
-    index=0,
-    help="Escolha quantas variáveis de decisão o problema terá (máximo 10)"
+    min_value=2,
+    max_value=MAX_VARIAVEIS,
+    value=2,
+    step=1,
+    help=f"Quantas variáveis de decisão o problema terá (máximo {MAX_VARIAVEIS})"
 )
 
 # Número de Restrições
 num_constraints = st.sidebar.number_input(
     "🔒 **Número de Restrições**",
     min_value=1,
-    max_value=10,
+    max_value=MAX_RESTRICOES,
     value=2,
     step=1,
-    help="Quantidade de restrições do problema (máximo 10)"
+    help=f"Quantidade de restrições do problema (máximo {MAX_RESTRICOES})"
+)
+
+# Motor de resolução
+nomes_motores = list(MOTORES)
+motor = st.sidebar.selectbox(
+    "🧮 **Motor de Resolução**",
+    options=nomes_motores,
+    index=nomes_motores.index(motor_padrao()),
+    help="revisado: Simplex Revisado próprio (tableau ótimo verdadeiro). "
+         "highs: HiGHS em processo. pulp: CBC via arquivos temporários. "
+         "barreira: pontos interiores com crossover para o Simplex Revisado. "
+         "auto: barreira em modelos grandes, Simplex Revisado nos pequenos. "
+         "O padrão pode ser definido pela variável de ambiente SIMPLEX_MOTOR."
+)
+
+# Limite de tempo das resoluções em segundo plano
+limite_tempo = st.sidebar.number_input(
+    "⏱️ **Tempo Limite (s)**",
+    min_value=1,
+    max_value=3600,
+    value=60,
+    step=5,
+    help="Ao atingir o limite, a resolução para e mostra o melhor ponto viável encontrado "
+         "(motor revisado). A resolução também pode ser cancelada durante o andamento."
+)
+
+# Gap relativo do branch-and-bound (só vale com variáveis inteiras/binárias)
+gap_percentual = st.sidebar.number_input(
+    "📐 **Gap Relativo (%)**",
+    min_value=0.0,
+    max_value=100.0,
+    value=GAP_PADRAO * 100,
+    step=0.01,
+    format="%.2f",
+    help="Com variáveis inteiras ou binárias, a busca para quando a distância entre a melhor "
+         "solução inteira e o limitante cai abaixo deste percentual."
+)
+
+# Pré-resolução (presolve) e escala
+usar_presolve = st.sidebar.checkbox(
+    "🧹 **Pré-resolução e escala**",
+    value=True,
+    help="Remove linhas vazias, duplicadas/paralelas e singulares, fixa variáveis e colunas "
+         "dominadas e equilibra a escala dos coeficientes antes do motor. "
+         "Solução e preços-sombra voltam ao problema original."
+)
+
+# Decomposição em blocos
+usar_decomposicao = st.sidebar.checkbox(
+    "🧩 **Decomposição em blocos**",
+    value=False,
+    help="Procura blocos independentes na matriz de restrições (ou blocos ligados por poucas "
+         "restrições compartilhadas) e resolve cada bloco em paralelo; blocos ligados usam "
+         "Dantzig–Wolfe. Vale para modelos grandes com essa estrutura; sem ela, nada muda."
+)
+
+# Geração preguiçosa de restrições
+usar_geracao = st.sidebar.checkbox(
+    "📉 **Geração de linhas**",
+    value=False,
+    help="Resolve só um conjunto de trabalho das restrições ≤ e acrescenta, em lotes, as que a "
+         "solução viola, reotimizando a partir da base anterior até nenhuma ser violada. Vale para "
+         "modelos com muitas restrições das quais poucas ficam ativas; não mostra o tableau final."
+)
+
+# Perfil de uma única resolução: a opção desliga sozinha depois do envio
+if st.session_state.pop("perfil_usado", False):
+    st.session_state["perfilar"] = False
+perfilar = st.sidebar.checkbox(
+    "🔬 **Perfilar a próxima resolução**",
+    key="perfilar",
+    help="Executa a próxima resolução sob o cProfile (ou o pyinstrument, se instalado) e mostra "
+         "o relatório no painel Desempenho. Vale para um único envio."
 )
 
 st.sidebar.markdown("---")
-st.sidebar.markdown("### 🏷️ **Nomear Variáveis (Opcional)**")
-st.sidebar.caption("Personalize os nomes das variáveis para facilitar a interpretação")
-
-nomes_variaveis = []
-for i in range(10):  # Sempre 10 para cobrir todas as possibilidades
-    if i < num_variables:
-        nome = st.sidebar.text_input(
-            f"Variável x{i+1}",
-            value=f"x{i+1}",
-            key=f"nome_var_{i}",
-            max_chars=15,
-            help=f"Nome personalizado para x{i+1} (máx. 15 caracteres)"
-        )
-        nomes_variaveis.append(nome if nome.strip() else f"x{i+1}")
-    else:
-        nomes_variaveis.append(f"x{i+1}")
+st.sidebar.markdown("### 🏷️ **Variáveis: Nome e Tipo**")
+st.sidebar.caption("Personalize os nomes das variáveis e marque as que só podem assumir valores "
+                   "inteiros (ou 0/1, binárias)")
+
+# Um único editor de nomes e tipos (em vez de um widget por variável)
+nomes_anteriores = st.session_state.get("nomes_variaveis", [])
+tipos_anteriores = st.session_state.get("tipos_variaveis", [])
+rotulos_x = [f"x{j+1}" for j in range(num_variables)]
+base_nomes, versao_nomes = base_editor(
+    "base_nomes", num_variables,
+    lambda: pd.DataFrame({"Nome": nomes_anteriores[:num_variables] + rotulos_x[len(nomes_anteriores):],
+                          "Tipo": redimensionar(tipos_anteriores, num_variables, TIPOS[0])},
+                         index=rotulos_x)
+)
+with st.sidebar:
+    nomes_editados = st.data_editor(
+        base_nomes,
+        key=f"editor_nomes_{versao_nomes}",
+        use_container_width=True,
+        column_config={
+            "Nome": st.column_config.TextColumn("Nome", max_chars=15,
+                                                help="Nome personalizado da variável (máx. 15 caracteres)"),
+            "Tipo": st.column_config.SelectboxColumn("Tipo", options=list(TIPOS), required=True,
+                                                     help="Contínua, Inteira ou Binária (0 ou 1)")
+        }
+    )
+nomes_variaveis = [
+    str(nome).strip() if isinstance(nome, str) and nome.strip() else f"x{j+1}"
+    for j, nome in enumerate(nomes_editados["Nome"])
+]
+tipos_variaveis = nomes_editados["Tipo"].fillna(TIPOS[0]).tolist()
+st.session_state["nomes_variaveis"] = nomes_variaveis
+st.session_state["tipos_variaveis"] = tipos_variaveis
+
+st.sidebar.markdown("---")
+
+# Importação de modelos grandes
+st.sidebar.markdown("### 📂 **Importar Modelo (Opcional)**")
+arquivo_modelo = st.sidebar.file_uploader(
+    "Arquivo MPS, LP ou CSV de triplas",
+    type=["mps", "lp", "csv"],
+    help="Para modelos grandes e esparsos, sem os limites de variáveis/restrições do formulário. "
+         "CSV: cabeçalho linha,coluna,valor (use as colunas especiais rhs, op e a linha obj)."
+)
 
 st.sidebar.markdown("---")
 
@@ -395,100 +689,105 @@ st.sidebar.info(f"""
 
 # ==================== ENTRADA DE DADOS ====================
 
-with st.form(key="ppl_form"):
+@st.fragment
+def entrada_problema(num_variables, num_constraints, nomes_variaveis, tipo_otimizacao):
+    """
+    Grades de coeficientes (c, A, operadores e b) num fragmento: editar uma
+    célula só reexecuta este trecho, não a página inteira. O envio guarda os
+    valores em session_state["envio"] e reexecuta a aplicação para os resultados.
+    """
+    anteriores = st.session_state.get("valores_problema", {})
+    colunas_x = [f"x{j+1}" for j in range(num_variables)]
+    assinatura = (num_variables, num_constraints, tuple(nomes_variaveis))
+    config_x = {
+        col: st.column_config.NumberColumn(nomes_variaveis[j], format="%.2f")
+        for j, col in enumerate(colunas_x)
+    }
     
     # Função Objetivo
     st.markdown('<div class="sub-header">📈 Função Objetivo</div>', unsafe_allow_html=True)
     
     # Monta a equação com os nomes personalizados
-    equacao_obj = " + ".join([f"c{i+1}·{nomes_variaveis[i]}" for i in range(num_variables)])
+    equacao_obj = " + ".join([f"c{subscrito(i+1)}·{nomes_variaveis[i]}" for i in range(min(num_variables, 6))])
+    if num_variables > 6:
+        equacao_obj += f" + ... + c{subscrito(num_variables)}·{nomes_variaveis[-1]}"
     tipo_icone = "⬆️" if tipo_otimizacao == "Maximizar" else "⬇️"
     st.markdown(f"**{tipo_icone} {tipo_otimizacao} Z =** `{equacao_obj}`")
     st.caption("💡 Insira os coeficientes de cada variável na função objetivo")
     
-    funcObj = []
-    cols_obj = st.columns(num_variables)
-    subscripts = ['₁', '₂', '₃', '₄', '₅', '₆', '₇', '₈', '₉', '₁₀']
-    
-    for i in range(num_variables):
-        with cols_obj[i]:
-            coef = st.number_input(
-                f"**c{subscripts[i]}** (coef. de {nomes_variaveis[i]})",
-                key=f"obj_{i}",
-                value=1.0,
-                format="%.2f",
-                help=f"Coeficiente da variável {nomes_variaveis[i]} na função objetivo"
-            )
-            funcObj.append(coef)
+    base_obj, versao_obj = base_editor(
+        "base_objetivo", assinatura,
+        lambda: pd.DataFrame([redimensionar(anteriores.get("funcObj", []), num_variables, 1.0)],
+                             columns=colunas_x, index=["c"])
+    )
+    obj_editado = st.data_editor(
+        base_obj,
+        key=f"editor_objetivo_{versao_obj}",
+        use_container_width=True,
+        column_config=config_x
+    )
 
     st.markdown("<br>", unsafe_allow_html=True)
     
     # Restrições
     st.markdown('<div class="sub-header">🔒 Restrições</div>', unsafe_allow_html=True)
+    st.markdown("**Formato:** uma linha por restrição — coeficientes, operador (≤, ≥ ou =) e lado direito (b)")
+    st.caption("💡 Células vazias valem 0. Cole blocos de valores direto da planilha.")
     
-    # Monta a equação com os nomes personalizados
-    equacao_rest = " + ".join([f"a·{nomes_variaveis[i]}" for i in range(num_variables)])
-    st.markdown(f"**Formato:** `{equacao_rest} ≤ b` (mas você pode escolher ≤, ≥ ou = por restrição)")
-    st.caption("💡 Defina coeficientes, operador e lado direito (b) para cada restrição")
-    
-    restric = []
-    const = []
-    operadores = []
-    
-    for i in range(num_constraints):
-        st.markdown(f"#### Restrição {i+1}:")
-        cols_rest = st.columns(num_variables + 2)
-        row = []
-        
-        for j in range(num_variables):
-            with cols_rest[j]:
-                coef = st.number_input(
-                    f"**{nomes_variaveis[j]}**",
-                    key=f"r{i}_c{j}",
-                    value=1.0,
-                    format="%.2f",
-                    help=f"Coeficiente de {nomes_variaveis[j]} na restrição {i+1}"
-                )
-                row.append(coef)
-        
-        restric.append(row)
-        
-        with cols_rest[num_variables]:
-            operador = st.selectbox(
-                f"Operador (R{i+1})",
-                options=["≤", "=", "≥"],
-                key=f"r{i}_op",
-                help="Escolha o tipo da restrição"
-            )
-            operadores.append(operador)
-        
-        with cols_rest[num_variables+1]:
-            b_val = st.number_input(
-                f"LD b{i+1}",
-                key=f"r{i}_b",
-                value=10.0,
-                format="%.2f",
-                help=f"Lado direito da restrição {i+1} (RHS)"
-            )
-            const.append(b_val)
+    def montar_restricoes():
+        linhas = [redimensionar(r, num_variables, 1.0) for r in anteriores.get("restricoes", [])]
+        df = pd.DataFrame(redimensionar(linhas, num_constraints, [1.0] * num_variables),
+                          columns=colunas_x, index=[f"R{i+1}" for i in range(num_constraints)])
+        df["op"] = redimensionar(anteriores.get("operadores", []), num_constraints, "≤")
+        df["b"] = redimensionar(anteriores.get("constantes", []), num_constraints, 10.0)
+        return df
+    
+    base_rest, versao_rest = base_editor("base_restricoes", assinatura, montar_restricoes)
+    rest_editado = st.data_editor(
+        base_rest,
+        key=f"editor_restricoes_{versao_rest}",
+        use_container_width=True,
+        column_config={
+            **config_x,
+            "op": st.column_config.SelectboxColumn("Operador", options=OPERADORES, required=True),
+            "b": st.column_config.NumberColumn("LD (b)", format="%.2f",
+                                               help="Lado direito da restrição (RHS)"),
+        }
+    )
+    
+    valores = {
+        "funcObj": obj_editado[colunas_x].iloc[0].fillna(0.0).astype(float).tolist(),
+        "restricoes": rest_editado[colunas_x].fillna(0.0).astype(float).values.tolist(),
+        "constantes": rest_editado["b"].fillna(0.0).astype(float).tolist(),
+        "operadores": rest_editado["op"].fillna("≤").tolist(),
+    }
+    st.session_state["valores_problema"] = valores
 
     st.markdown("<br>", unsafe_allow_html=True)
     
-    # Botão de submit com estilo
+    # Botão de envio com estilo
     col_btn1, col_btn2, col_btn3 = st.columns([1, 2, 1])
     with col_btn2:
-        submit_button = st.form_submit_button(
-            label="🚀 Calcular Solução Ótima",
-            use_container_width=True
-        )
+        if st.button("🚀 Calcular Solução Ótima", key="calcular", use_container_width=True):
+            st.session_state["envio"] = valores
+            st.rerun()
+
+
+entrada_problema(num_variables, num_constraints, nomes_variaveis, tipo_otimizacao)
 
 
 # ==================== PROCESSAMENTO E RESULTADOS ====================
 
-if submit_button:
+envio = st.session_state.pop("envio", None)
+
+if envio is not None:
+    funcObj, restric, const, operadores = (envio["funcObj"], envio["restricoes"],
+                                           envio["constantes"], envio["operadores"])
     
     # Validação de entrada
-    erros = validar_entrada(funcObj, restric, const, operadores)
+    medicao_ui = Medicao()
+    with medicao_ui.fase("validação"):
+        erros = validar_entrada(funcObj, restric, const, operadores)
     
     if erros:
         st.markdown('<div class="warning-box">', unsafe_allow_html=True)
@@ -497,100 +796,214 @@ if submit_button:
             st.markdown(f"- {erro}")
         st.markdown('</div>', unsafe_allow_html=True)
     else:
-        # Resolve o problema
-        with st.spinner('🔄 **Resolvendo o problema de programação linear...**'):
-            solucao, valorOtimo, precoSombra, final_tableau = simplex(funcObj, restric, const, operadores, num_variables, tipo_otimizacao)
+        # Arrays contíguos uma única vez: a tarefa, o cache e a análise trabalham sobre eles
+        problema_envio = Problema.criar(funcObj, restric, const, operadores, tipo_otimizacao)
+        funcObj, restric, const = problema_envio.c, problema_envio.A, problema_envio.b
+        envio = {**envio, "funcObj": funcObj, "restricoes": restric, "constantes": const}
 
-        if solucao is not None:
-            
-            # ========== RESULTADOS PRINCIPAIS ==========
-            st.markdown('<div class="sub-header">📊 Resultados da Otimização</div>', unsafe_allow_html=True)
-            
-            # Primeira linha de resultados
-            col1, col2, col3 = st.columns(3)
-            
-            with col1:
-                st.markdown("#### 🎯 **Ponto Ótimo**")
-                
-                # Tabela de solução
-                df_solucao = pd.DataFrame({
-                    'Variável': [nomes_variaveis[i] for i in range(num_variables)],
-                    'Valor': [f'{solucao[i]:.2f}' for i in range(num_variables)]
-                })
-                
-                # Estiliza a tabela
-                st.dataframe(
-                    df_solucao,
-                    use_container_width=True,
-                    hide_index=True,
-                    column_config={
-                        "Variável": st.column_config.TextColumn("Variável", width="medium"),
-                        "Valor": st.column_config.TextColumn("Valor Ótimo", width="medium")
-                    }
-                )
-
-            with col2:
-                rotulo_tipo = "💰 Valor Máximo" if tipo_otimizacao == "Maximizar" else "💵 Valor Mínimo"
-                st.markdown(f"#### {rotulo_tipo}")
-                
-                df_valor = pd.DataFrame({
-                    'Métrica': ['Z*'],
-                    'Valor': [f'{valorOtimo:.2f}']
-                })
-                
-                st.dataframe(
-                    df_valor,
-                    use_container_width=True,
-                    hide_index=True,
-                    column_config={
-                        "Métrica": st.column_config.TextColumn("Métrica", width="medium"),
-                        "Valor": st.column_config.TextColumn("Valor Ótimo", width="medium")
-                    }
-                )
-
-            with col3:
-                st.markdown("#### 🏷️ **Preços-Sombra**")
-                
-                df_sombra = pd.DataFrame({
-                    'Restrição': [f'R{i+1}' for i in range(num_constraints)],
-                    'Preço-Sombra': [f'{abs(precoSombra[i]):.2f}' for i in range(num_constraints)]
-                })
-                
-                st.dataframe(
-                    df_sombra,
-                    use_container_width=True,
-                    hide_index=True,
-                    column_config={
-                        "Restrição": st.column_config.TextColumn("Restrição", width="small"),
-                        "Preço-Sombra": st.column_config.TextColumn("Valor", width="medium")
-                    }
-                )
-            
-            # ========== TABLEAU FINAL ==========
-            st.markdown("---")
-            with st.expander("🔢 **Tableau Final do Simplex** (Visualização Avançada)", expanded=False):
-                st.markdown("### 📐 Tableau Final da Solução")
+        # Partida a quente: se só b ou c mudaram desde o último envio, reaproveita a base ótima
+        estrutura = (tipo_otimizacao, motor, problema_envio.estrutura(), tuple(tipos_variaveis))
+        anterior = st.session_state.get("ultima_base")
+        base_inicial = anterior["base"] if anterior and anterior["estrutura"] == estrutura else None
+        
+        # Resolve em segundo plano: a sessão continua respondendo enquanto isso
+        tarefa_anterior = st.session_state.get("pedido")
+        if tarefa_anterior is not None:
+            tarefa_anterior["tarefa"].cancelar()
+        st.session_state["pedido"] = {
+            "tarefa": gerenciador_global().submeter(
+                simplex, funcObj, restric, const, operadores, num_variables, tipo_otimizacao,
+                motor=motor, base_inicial=base_inicial, presolve=usar_presolve, tipos=tipos_variaveis,
+                gap=gap_percentual / 100, decompor=usar_decomposicao, gerar_linhas=usar_geracao,
+                usar_cache=not perfilar,
+                limite_tempo=limite_tempo, perfilar=perfilar),
+            "envio": envio,
+            "dimensoes": (num_variables, num_constraints),
+            "estrutura": estrutura,
+            "tipos": tipos_variaveis,
+            "medicao_ui": medicao_ui,
+            "base_inicial": base_inicial,
+            "anterior": anterior,
+        }
+        if perfilar:
+            st.session_state["perfil_usado"] = True   # o perfil vale só para este envio
+
+# Pedido de outra configuração (tamanho mudou na barra lateral) não é mais exibível
+pedido = st.session_state.get("pedido")
+if pedido is not None and pedido["dimensoes"] != (num_variables, num_constraints):
+    pedido["tarefa"].cancelar()
+    del st.session_state["pedido"]
+    pedido = None
+
+resultado = None
+desempenho = None
+if pedido is not None and not pedido["tarefa"].aguardar(ESPERA_SINCRONA):
+    acompanhar_tarefa("pedido")
+elif pedido is not None:
+    del st.session_state["pedido"]
+    funcObj, restric, const, operadores = (pedido["envio"]["funcObj"], pedido["envio"]["restricoes"],
+                                           pedido["envio"]["constantes"], pedido["envio"]["operadores"])
+    base_inicial, anterior = pedido["base_inicial"], pedido["anterior"]
+    inteiro = any(t != "Contínua" for t in pedido["tipos"])
+    # Fases na ordem em que aconteceram: validação (interface) e depois as da tarefa
+    medicao = pedido["medicao_ui"]
+    medicao.incorporar(pedido["tarefa"].controle.medicao)
+    encerrar_renderizacao = medicao.iniciar("renderização")
+    try:
+        resultado = pedido["tarefa"].resultado()
+    except Exception as e:
+        st.error(f"❌ **Erro ao resolver o problema:**\n\n{str(e)}")
+    desempenho = (medicao, encerrar_renderizacao, {
+        "origem": "formulário", "motor": pedido["estrutura"][1],
+        "m": num_constraints, "n": num_variables, "inteiras": sum(t != "Contínua" for t in pedido["tipos"]),
+        "status": resultado.status if resultado is not None else "Erro",
+        "do_cache": bool(resultado is not None and resultado.doCache),
+        "metodo": resultado.motor if resultado is not None else None,
+    })
+    
+    if resultado is not None and resultado.status != "Optimal":
+        exibir_falha(resultado, pedido["tarefa"].progresso(), nomes_variaveis, (restric, const, operadores, None))
+        resultado = None
+    
+    if resultado is not None and resultado.base is not None:
+        iteracoes_frio = resultado.iteracoes if base_inicial is None else anterior["iteracoes_frio"]
+        st.session_state["ultima_base"] = {
+            "estrutura": pedido["estrutura"],
+            "base": resultado.base,
+            "iteracoes_frio": iteracoes_frio,
+        }
+
+if resultado is not None:
+    solucao, valorOtimo, precoSombra = resultado.solucao, resultado.valorOtimo, resultado.precoSombra
+    final_tableau = resultado.tableau
+    
+    # ========== RESULTADOS PRINCIPAIS ==========
+    st.markdown('<div class="sub-header">📊 Resultados da Otimização</div>', unsafe_allow_html=True)
+    
+    if resultado.doCache:
+        st.caption("♻️ Resultado recuperado do cache compartilhado (nenhuma resolução necessária)")
+    elif base_inicial is not None and resultado.base is not None:
+        economia = max(iteracoes_frio - resultado.iteracoes, 0)
+        st.caption(f"⚡ Partida a quente a partir da base anterior: {resultado.iteracoes} iterações "
+                   f"({economia} a menos que a última resolução do zero, com {iteracoes_frio})")
+    if resultado.presolve is not None and not resultado.doCache:
+        exibir_presolve(resultado.presolve)
+    if resultado.mip is not None and not resultado.doCache:
+        exibir_mip(resultado.mip)
+    if resultado.decomposicao is not None and not resultado.doCache:
+        exibir_decomposicao(resultado.decomposicao)
+    if resultado.geracao is not None and not resultado.doCache:
+        exibir_geracao(resultado.geracao)
+    if (resultado.barreira is not None or resultado.escolha is not None) and not resultado.doCache:
+        exibir_barreira(resultado.barreira, resultado.escolha)
+    
+    # Primeira linha de resultados
+    col1, col2, col3 = st.columns(3)
+    
+    with col1:
+        st.markdown("#### 🎯 **Ponto Ótimo**")
+        
+        # Tabela de solução (numérica; formatada só na exibição)
+        tabela_x = tabela_solucao(nomes_variaveis, solucao)
+        exibir_tabela("solucao", tabela_x, filtros=[("Só variáveis não nulas", nao_nulas(tabela_x), False)],
+                      arquivo="solucao")
+
+    with col2:
+        rotulo_tipo = "💰 Valor Máximo" if tipo_otimizacao == "Maximizar" else "💵 Valor Mínimo"
+        st.markdown(f"#### {rotulo_tipo}")
+        
+        df_valor = pd.DataFrame({
+            'Métrica': ['Z*'],
+            'Valor': [valorOtimo]
+        })
+        
+        st.dataframe(
+            df_valor,
+            use_container_width=True,
+            hide_index=True,
+            column_config={
+                "Métrica": st.column_config.TextColumn("Métrica", width="medium"),
+                "Valor": st.column_config.NumberColumn("Valor Ótimo", format="%.2f", width="medium")
+            }
+        )
+
+    with col3:
+        st.markdown("#### 🏷️ **Preços-Sombra**")
+        
+        # Exibe restrição e preço-sombra; o download leva também atividade e folga
+        tabela_y = tabela_restricoes(restric, const, solucao, np.abs(precoSombra))
+        exibir_tabela("restricoes", tabela_y, filtros=[("Só restrições ativas", ativas(tabela_y), False)],
+                      visiveis=["Restrição", "Preço-Sombra"], arquivo="restricoes")
+    
+    if inteiro:
+        st.caption("ℹ️ Com variáveis inteiras, os preços-sombra são os da relaxação linear com as "
+                   "inteiras fixadas nos valores ótimos.")
+    
+    # ========== ANÁLISE DE SENSIBILIDADE ==========
+    st.markdown("#### 📏 **Análise de Sensibilidade**")
+    if inteiro:
+        st.info("ℹ️ A análise de sensibilidade por faixas vale só para problemas contínuos "
+                "(sem variáveis inteiras ou binárias).")
+    elif resultado.base is not None:
+        sens = analisar(funcObj, restric, const, operadores, tipo_otimizacao, resultado.base)
+        # Tabelas numéricas, como as de solução e preços-sombra; faixa ilimitada = ±inf
+        tabela_sens_rest, tabela_sens_var = tabelas_sensibilidade(sens, const, funcObj, nomes_variaveis)
+        
+        col_s1, col_s2 = st.columns(2)
+        with col_s1:
+            st.caption("Restrições: folga/excesso e faixa do lado direito (b) em que a base continua ótima")
+            exibir_tabela("sens_restricoes", tabela_sens_rest, arquivo="sensibilidade_restricoes")
+        with col_s2:
+            st.caption("Variáveis: custo reduzido e faixa do coeficiente (c) em que a base continua ótima")
+            exibir_tabela("sens_variaveis", tabela_sens_var, arquivo="sensibilidade_variaveis")
+    else:
+        st.info("ℹ️ A análise de sensibilidade usa a base ótima e está disponível com o motor **revisado** "
+                "(ou **barreira**/**auto** com crossover).")
+    
+    # ========== TABLEAU FINAL ==========
+    # Sem tableau na geração de linhas: ele teria todas as restrições
+    if final_tableau is not None:
+        st.markdown("---")
+        with st.expander("🔢 **Tableau Final do Simplex** (Visualização Avançada)", expanded=False):
+            st.markdown("### 📐 Tableau Final da Solução")
+            if resultado.base is not None:
+                st.caption(f"Tableau após o último pivô ({resultado.iteracoes} iterações) — cada linha corresponde a uma variável básica")
+            else:
                 st.caption("Esta tabela mostra uma representação simplificada do tableau (coluna de folga/sobra por restrição)")
-                
-                subscripts = ['₁', '₂', '₃', '₄', '₅', '₆', '₇', '₈', '₉', '₁₀']
-                headers = [nomes_variaveis[i] for i in range(num_variables)]
-                headers += [f"s{subscripts[i]}" for i in range(num_constraints)]
-                headers.append("LD")
-                
+        
+            headers = [nomes_variaveis[i] for i in range(num_variables)]
+            headers += [f"s{subscrito(i+1)}" for i in range(num_constraints)]
+            headers.append("LD")
+        
+            if resultado.base is not None:
+                # Rótulo de cada linha = variável básica (a{i} = artificial de linha redundante)
+                nomes_colunas = headers[:-1] + [f"a{subscrito(i+1)}" for i in range(num_constraints)]
+                row_labels = [nomes_colunas[j] for j in resultado.base] + ["Z"]
+            else:
                 row_labels = [f"R{i+1}" for i in range(num_constraints)] + ["Z"]
-                
-                df_tableau = pd.DataFrame(
-                    final_tableau,
-                    columns=headers,
-                    index=row_labels
-                )
-                
-                # Formata o tableau
-                st.dataframe(
-                    df_tableau.style.format("{:.2f}"),
-                    use_container_width=True
-                )
-                
+        
+            # Tableau numérico, paginado por linhas
+            exibir_tabela("tableau", tabela_tableau(final_tableau, headers, row_labels), arquivo="tableau")
+        
+            if resultado.base is not None:
+                st.markdown("""
+                **📖 Legenda:**
+                - **Variáveis de decisão:** Com nomes personalizados
+                - **sᵢ:** Folga/sobra da restrição i (coluna nula para =)
+                - **LD:** Valor das variáveis básicas (B⁻¹b)
+                - **Linhas:** Variáveis básicas na solução ótima
+                - **Z:** Custos relativos (zⱼ - cⱼ) e valor ótimo
+                """)
+            
+                if resultado.historico is not None and len(resultado.historico) > 0:
+                    st.markdown("### ⏯️ Passo a Passo")
+                    st.caption("Percorra os pivôs do método (na Fase 1, a linha W é a soma das artificiais)")
+                    exibir_historico(resultado.historico, headers, nomes_colunas)
+                elif resultado.historico is None and resultado.presolve is not None:
+                    # Os pivôs foram dados no problema reduzido, que não tem as mesmas linhas e colunas
+                    st.caption("ℹ️ Passo a passo indisponível: a pré-resolução removeu restrições ou variáveis "
+                               "antes do motor. Desligue **🧹 Pré-resolução e escala** para rever os pivôs.")
+            else:
                 st.markdown("""
                 **📖 Legenda:**
                 - **Variáveis de decisão:** Com nomes personalizados
@@ -599,14 +1012,132 @@ if submit_button:
                 - **Rᵢ:** Linhas das restrições
                 - **Z:** Linha da função objetivo
                 """)
-                
+        
+if desempenho is not None:
+    exibir_desempenho(*desempenho)
+
+# ==================== MODELO IMPORTADO ====================
+
+if arquivo_modelo is not None:
+    st.markdown("---")
+    st.markdown('<div class="sub-header">📂 Modelo Importado</div>', unsafe_allow_html=True)
+    try:
+        problema, estat_leitura = ler_modelo(arquivo_modelo)
+    except (ValueError, KeyError, IndexError, UnicodeDecodeError) as e:
+        st.error(f"❌ **Erro ao ler o modelo:**\n\n{str(e)}")
+        problema = None
+    
+    if problema is not None:
+        m_imp, n_imp = problema.restricoes.shape
+        col_i1, col_i2, col_i3, col_i4 = st.columns(4)
+        col_i1.metric("Restrições", f"{m_imp:,}")
+        col_i2.metric("Variáveis", f"{n_imp:,}")
+        col_i3.metric("Não nulos", f"{estat_leitura.nao_nulos:,}")
+        col_i4.metric("Leitura", f"{estat_leitura.segundos:.2f} s",
+                      help=f"{estat_leitura.mb_por_segundo:.1f} MB/s | "
+                           f"{estat_leitura.nao_nulos_por_segundo:,.0f} não nulos/s")
+        inteiras_imp = sum(t != "Contínua" for t in problema.tipos or [])
+        st.caption(f"{problema.tipo_otimizacao} — o modelo vai direto ao motor, sem passar pelo formulário."
+                   + (f" {inteiras_imp:,} variáveis inteiras/binárias." if inteiras_imp else ""))
+        
+        if st.button("🚀 Resolver Modelo Importado", key="resolver_importado"):
+            tarefa_anterior = st.session_state.get("pedido_importado")
+            if tarefa_anterior is not None:
+                tarefa_anterior["tarefa"].cancelar()
+            st.session_state["pedido_importado"] = {
+                "tarefa": gerenciador_global().submeter(
+                    resolver, problema.funcObj, problema.restricoes, problema.constantes,
+                    problema.operadores, problema.tipo_otimizacao, motor=motor, presolve=usar_presolve,
+                    tipos=problema.tipos, gap=gap_percentual / 100, decompor=usar_decomposicao,
+                    gerar_linhas=usar_geracao,
+                    diagnosticar=True, limite_tempo=limite_tempo, perfilar=perfilar),
+                "arquivo": arquivo_modelo.file_id,
+            }
+            if perfilar:
+                st.session_state["perfil_usado"] = True
+        
+        pedido_imp = st.session_state.get("pedido_importado")
+        if pedido_imp is not None and pedido_imp["arquivo"] != arquivo_modelo.file_id:
+            pedido_imp["tarefa"].cancelar()
+            del st.session_state["pedido_importado"]
+            pedido_imp = None
+        
+        resultado_imp = None
+        desempenho_imp = None
+        if pedido_imp is not None and not pedido_imp["tarefa"].aguardar(ESPERA_SINCRONA):
+            acompanhar_tarefa("pedido_importado")
+        elif pedido_imp is not None:
+            del st.session_state["pedido_importado"]
+            medicao_imp = pedido_imp["tarefa"].controle.medicao
+            encerrar_renderizacao_imp = medicao_imp.iniciar("renderização")
+            try:
+                resultado_imp = pedido_imp["tarefa"].resultado()
+            except Exception as e:
+                st.error(f"❌ **Erro ao resolver o modelo:**\n\n{str(e)}")
+            desempenho_imp = (medicao_imp, encerrar_renderizacao_imp, {
+                "origem": "importado", "motor": motor, "m": m_imp, "n": n_imp,
+                "inteiras": inteiras_imp, "status": resultado_imp.status if resultado_imp is not None else "Erro",
+                "do_cache": False, "metodo": resultado_imp.motor if resultado_imp is not None else None,
+            })
+        
+        if resultado_imp is not None:
+            if resultado_imp.status != "Optimal":
+                exibir_falha(resultado_imp, pedido_imp["tarefa"].progresso(), problema.nomes_variaveis,
+                             (problema.restricoes, problema.constantes, problema.operadores,
+                              problema.nomes_restricoes))
+            else:
+                st.metric("Z*", f"{resultado_imp.valorOtimo:,.4f}")
+                if resultado_imp.presolve is not None:
+                    exibir_presolve(resultado_imp.presolve)
+                if resultado_imp.mip is not None:
+                    exibir_mip(resultado_imp.mip)
+                if resultado_imp.decomposicao is not None:
+                    exibir_decomposicao(resultado_imp.decomposicao)
+                if resultado_imp.geracao is not None:
+                    exibir_geracao(resultado_imp.geracao)
+                if resultado_imp.barreira is not None or resultado_imp.escolha is not None:
+                    exibir_barreira(resultado_imp.barreira, resultado_imp.escolha)
+                tabela_x_imp = tabela_solucao(problema.nomes_variaveis, resultado_imp.solucao)
+                nao_nulas_imp = nao_nulas(tabela_x_imp)
+                st.markdown(f"**Variáveis não nulas:** {int(nao_nulas_imp.sum()):,} de {n_imp:,}")
+                exibir_tabela("solucao_importado", tabela_x_imp, formato=None, arquivo="solucao",
+                              filtros=[("Só variáveis não nulas", nao_nulas_imp, True)])
+                if resultado_imp.precoSombra is not None:
+                    tabela_y_imp = tabela_restricoes(problema.restricoes, problema.constantes,
+                                                     resultado_imp.solucao, resultado_imp.precoSombra,
+                                                     problema.nomes_restricoes)
+                    ativas_imp = ativas(tabela_y_imp)
+                    st.markdown(f"**Restrições ativas:** {int(ativas_imp.sum()):,} de {m_imp:,}")
+                    exibir_tabela("restricoes_importado", tabela_y_imp, formato=None, arquivo="restricoes",
+                                  filtros=[("Só restrições ativas", ativas_imp, True)])
+        
+        if desempenho_imp is not None:
+            exibir_desempenho(*desempenho_imp)
+
+# ==================== CACHE DE SOLUÇÕES ====================
+
+with st.sidebar.expander("🗄️ **Cache de Soluções**"):
+    estat = cache_global().estatisticas()
+    consultas = estat["acertos"] + estat["acertos_disco"] + estat["faltas"]
+    taxa = (estat["acertos"] + estat["acertos_disco"]) / consultas if consultas else 0.0
+    st.markdown(f"""
+    - **Acertos (memória):** {estat['acertos']}
+    - **Acertos (disco):** {estat['acertos_disco']}
+    - **Faltas:** {estat['faltas']}
+    - **Taxa de acerto:** {taxa:.0%}
+    - **Entradas:** {estat['entradas']} ({estat['bytes'] / 1024:.1f} KiB) | **Despejos:** {estat['despejos']}
+    """)
+    if st.button("🧹 Limpar cache", key="limpar_cache"):
+        cache_global().limpar()
+        st.rerun()
+
 # ==================== RODAPÉ ====================
 st.markdown("---")
 st.markdown("""
 <div style='text-align: center; color: #888; padding: 2rem 0;'>
     <p style='font-size: 0.9rem;'>
         <strong>📊 Calculadora de Programação Linear</strong> | 
-        Desenvolvido com Streamlit e PuLP | 
+        Desenvolvido com Streamlit, NumPy e SciPy (motores plugáveis: revisado, HiGHS, PuLP, barreira) | 
         Método Simplex
     </p>
     <p style='font-size: 0.8rem; margin-top: 0.5rem;'>
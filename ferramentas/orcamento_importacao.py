@@ -0,0 +1,72 @@
+"""
+Mede o tempo de importação "a frio" do núcleo ``ppl`` e compara com o orçamento.
+
+Cada instrução é executada em um interpretador novo, várias vezes, e o tempo
+considerado é a mediana. Também verifica que nenhuma dependência pesada da
+interface (SciPy, PuLP, pandas, Streamlit) é carregada só por importar.
+
+Uso:
+    python ferramentas/orcamento_importacao.py [--repeticoes N]
+
+Sai com código 1 se algum orçamento for estourado.
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Instrução -> orçamento em milissegundos
+ORCAMENTO_MS = {
+    "import ppl": 5,
+    "from ppl import validar_entrada": 10,
+    "from ppl import simplex": 250,
+    "from ppl import resolver_lote": 250,
+}
+
+PROIBIDOS = ("scipy", "pulp", "pandas", "streamlit")
+
+_MEDIDOR = """
+import sys, time, json
+t = time.perf_counter()
+{instrucao}
+dt = time.perf_counter() - t
+print(json.dumps({{"ms": dt * 1000, "carregados": [m for m in {proibidos!r} if m in sys.modules]}}))
+"""
+
+
+def medir(instrucao, repeticoes):
+    """Mediana (ms) e módulos pesados carregados pela instrução"""
+    tempos = []
+    carregados = set()
+    for _ in range(repeticoes):
+        codigo = _MEDIDOR.format(instrucao=instrucao, proibidos=PROIBIDOS)
+        saida = subprocess.run([sys.executable, "-c", codigo], cwd=RAIZ,
+                               capture_output=True, text=True, check=True).stdout
+        dados = json.loads(saida)
+        tempos.append(dados["ms"])
+        carregados.update(dados["carregados"])
+    return statistics.median(tempos), sorted(carregados)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeticoes", type=int, default=5)
+    args = parser.parse_args()
+
+    estourou = False
+    for instrucao, orcamento in ORCAMENTO_MS.items():
+        ms, carregados = medir(instrucao, args.repeticoes)
+        ok = ms <= orcamento and not carregados
+        estourou |= not ok
+        extra = f"  (carregou: {', '.join(carregados)})" if carregados else ""
+        print(f"{'OK ' if ok else 'ERRO'}  {ms:8.1f} ms / {orcamento:4d} ms  {instrucao}{extra}")
+    return 1 if estourou else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
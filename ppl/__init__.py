@@ -0,0 +1,43 @@
+"""
+Núcleo de resolução da Calculadora Simplex (sem interface).
+
+Este pacote concentra os motores de resolução e as rotinas auxiliares que não
+dependem do Streamlit, para que possam ser usados pela interface web e por
+scripts ou processos de trabalho.
+
+As importações são preguiçosas: ``import ppl`` não carrega NumPy, SciPy, PuLP,
+pandas nem Streamlit. Cada nome abaixo só importa o seu módulo (e as
+dependências dele) no primeiro acesso.
+"""
+
+import importlib
+
+_EXPORTS = {
+    "validar_entrada": "ppl.validacao",
+    "Problema": "ppl.problema",
+    "simplex": "ppl.resolucao",
+    "Resultado": "ppl.motores",
+    "resolver": "ppl.motores",
+    "MOTORES": "ppl.motores",
+    "resolver_lote": "ppl.lote",
+    "ResultadoLote": "ppl.lote",
+    "analisar": "ppl.sensibilidade",
+    "encontrar_iis": "ppl.inviabilidade",
+    "cache_global": "ppl.cache",
+    "gerenciador_global": "ppl.tarefas",
+}
+
+__all__ = sorted(_EXPORTS)
+
+
+def __getattr__(nome):
+    modulo = _EXPORTS.get(nome)
+    if modulo is None:
+        raise AttributeError(f"module 'ppl' has no attribute {nome!r}")
+    valor = getattr(importlib.import_module(modulo), nome)
+    globals()[nome] = valor
+    return valor
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_EXPORTS))
@@ -0,0 +1,283 @@
+"""
+Motor de pontos interiores (barreira) primal-dual em NumPy, com crossover.
+
+O problema vai à forma padrão min ĉx, Âx = b, x ≥ 0 (uma folga por linha ≤/≥,
+custos trocados de sinal na maximização). Cada iteração do preditor-corretor
+de Mehrotra resolve duas vezes as equações normais (Â D Âᵀ) Δy = r, com
+D = X S⁻¹, reaproveitando uma única fatoração de Cholesky. O número de
+iterações quase não cresce com o tamanho (tipicamente 15 a 40), ao contrário do
+simplex; o custo está em montar e fatorar a matriz m×m, o que compensa em
+modelos grandes (m·n acima de alguns milhares).
+
+O ponto final é interior (não é vértice). Com ``crossover=True`` (padrão), as
+colunas com x_j/(x_j+s_j) maiores, escolhidas por QR com pivoteamento, formam
+uma base que o Simplex Revisado reotimiza (normalmente em poucos pivôs); o
+resultado então tem base, tableau ótimo verdadeiro e preços-sombra de vértice.
+Em vértices muito degenerados o ponto interior fica longe de qualquer base
+dual viável e o crossover pode precisar de muitos pivôs.
+Sem crossover, a solução e os preços-sombra são os do ponto interior.
+
+Perto do ótimo, a matriz Â D Âᵀ fica mal condicionada e os resíduos podem
+voltar a crescer; por isso o método guarda o melhor iterado e para após
+``ESTAGNACAO`` iterações sem melhora, aceitando-o se estiver dentro de
+``TOL_APROXIMADA`` (o crossover termina o serviço).
+
+O método não decide com segurança inviabilidade nem ilimitação: se não
+convergir (limite de iterações, estagnação longe do ótimo ou iterados
+explodindo), o problema vai para o Simplex Revisado, que dá o status
+definitivo; isso fica registrado em ``EstatisticasBarreira.observacao``.
+
+``escolher_metodo`` é a heurística do motor "auto": barreira para modelos
+grandes, simplex para os pequenos (e para os muito altos e esparsos).
+"""
+
+import time
+from typing import NamedTuple, Optional
+
+import numpy as np
+from scipy.linalg import LinAlgError, cho_factor, cho_solve, qr
+
+from ppl.desempenho import medir
+from ppl.motores import Resultado
+from ppl.problema import sentidos
+
+TOL = 1e-9
+TOL_CONVERGENCIA = 1e-8     # resíduos e gap relativos
+TOL_APROXIMADA = 1e-6       # aceita o melhor iterado quando a convergência estagna
+MAX_ITERACOES = 100
+ESTAGNACAO = 5              # iterações sem melhorar o melhor iterado (3× longe do ótimo)
+FRACAO_PASSO = 0.995        # fração do passo até a fronteira
+LIMITE_DIVERGENCIA = 1e12
+REGULARIZACAO = 1e-12       # relativa à diagonal das equações normais
+
+# Heurística do motor "auto". O Simplex Revisado daqui trabalha com matrizes
+# densas, então a esparsidade não o favorece; ela só pesa contra a barreira
+# quando a matriz m×m das equações normais (sempre densa) fica grande demais.
+LIMIAR_ELEMENTOS = 20_000   # m·n a partir do qual a barreira compensa
+LIMIAR_LINHAS = 4_000       # acima disso, A esparsa fica com o simplex
+LIMIAR_DENSIDADE = 0.05     # fração de coeficientes não nulos
+
+
+class EstatisticasBarreira(NamedTuple):
+    """Andamento do método de pontos interiores e do crossover"""
+    iteracoes: int
+    iteracoes_crossover: int
+    residuo_primal: float       # ‖b - Âx‖ / (1 + ‖b‖)
+    residuo_dual: float         # ‖ĉ - Âᵀy - s‖ / (1 + ‖ĉ‖)
+    gap: float                  # |ĉx - bᵀy| / (1 + |ĉx|)
+    crossover: bool
+    segundos_barreira: float
+    segundos_crossover: float
+    observacao: Optional[str] = None
+
+
+class EscolhaMetodo(NamedTuple):
+    """Método escolhido pelo motor "auto" e por quê"""
+    metodo: str                 # "barreira" ou "revisado"
+    motivo: str
+    elementos: int              # m·n
+    densidade: float
+
+
+def escolher_metodo(m, n, nao_nulos):
+    """Barreira a partir de LIMIAR_ELEMENTOS coeficientes, salvo muitas linhas com A esparsa; senão simplex"""
+    elementos = m * n
+    densidade = nao_nulos / elementos if elementos else 0.0
+    if elementos < LIMIAR_ELEMENTOS:
+        motivo = f"{elementos:,} coeficientes (< {LIMIAR_ELEMENTOS:,}): simplex resolve em poucas iterações"
+        return EscolhaMetodo("revisado", motivo, elementos, densidade)
+    if m > LIMIAR_LINHAS and densidade < LIMIAR_DENSIDADE:
+        motivo = (f"{m:,} linhas com densidade {densidade:.1%}: a matriz {m}×{m} das equações normais "
+                  f"seria densa e cara demais")
+        return EscolhaMetodo("revisado", motivo, elementos, densidade)
+    motivo = f"{elementos:,} coeficientes com densidade {densidade:.1%}: poucas iterações de barreira"
+    return EscolhaMetodo("barreira", motivo, elementos, densidade)
+
+
+def _passo(v, dv):
+    """Maior α ∈ [0, 1] com v + α·dv ≥ 0"""
+    negativos = dv < 0
+    if not negativos.any():
+        return 1.0
+    return min(1.0, float(np.min(-v[negativos] / dv[negativos])))
+
+
+def _fatorar(M):
+    """Cholesky de M, com regularização crescente se M for (quase) singular (linhas dependentes)"""
+    diagonal = np.abs(np.diag(M)).max(initial=1.0)
+    delta = REGULARIZACAO * diagonal
+    for _ in range(8):
+        try:
+            return cho_factor(M + delta * np.eye(len(M)), check_finite=False)
+        except LinAlgError:
+            delta *= 100.0
+    raise LinAlgError("equações normais singulares")
+
+
+class _PontosInteriores:
+    """Preditor-corretor de Mehrotra sobre min ĉx, Âx = b, x ≥ 0"""
+
+    def __init__(self, A, b, c, controle=None):
+        self.A, self.b, self.c = A, b, c
+        self.controle = controle
+        self.iteracoes = 0
+        self.norma_b = 1.0 + np.linalg.norm(b)
+        self.norma_c = 1.0 + np.linalg.norm(c)
+
+    def _inicio(self):
+        """Ponto inicial de Mehrotra: mínimos quadrados deslocados para o interior"""
+        A, b, c = self.A, self.b, self.c
+        fator = _fatorar(A @ A.T)
+        x = A.T @ cho_solve(fator, b)
+        y = cho_solve(fator, A @ c)
+        s = c - A.T @ y
+        x += max(-1.5 * x.min(initial=0.0), 0.0)
+        s += max(-1.5 * s.min(initial=0.0), 0.0)
+        xs = x @ s
+        if xs <= 0:
+            return np.ones_like(x), y, np.ones_like(s)
+        return x + 0.5 * xs / s.sum(), y, s + 0.5 * xs / x.sum()
+
+    def residuos(self, x, y, s):
+        rp = self.b - self.A @ x
+        rd = self.c - self.A.T @ y - s
+        primal, dual = self.c @ x, self.b @ y
+        return (rp, rd, np.linalg.norm(rp) / self.norma_b, np.linalg.norm(rd) / self.norma_c,
+                abs(primal - dual) / (1.0 + abs(primal)))
+
+    def executar(self):
+        """(status, x, y, s): "Optimal", "Not Solved" (interrompido) ou "Falhou" (sem convergência)"""
+        A = self.A
+        x, y, s = self._inicio()
+        N = len(x)
+        melhor, erro_melhor, sem_melhora = (x, y, s), np.inf, 0
+        while True:
+            rp, rd, erro_p, erro_d, gap = self.residuos(x, y, s)
+            erro = max(erro_p, erro_d, gap)
+            if erro <= TOL_CONVERGENCIA:
+                return "Optimal", x, y, s
+            if erro < erro_melhor:
+                melhor, erro_melhor, sem_melhora = (x, y, s), erro, 0
+            else:
+                sem_melhora += 1
+            # Longe do ótimo os resíduos podem oscilar antes de cair; perto dele, não
+            paciencia = ESTAGNACAO if erro_melhor <= TOL_APROXIMADA else 3 * ESTAGNACAO
+            if (sem_melhora >= paciencia or self.iteracoes >= MAX_ITERACOES
+                    or max(np.abs(x).max(), np.abs(y).max(initial=0.0)) > LIMITE_DIVERGENCIA):
+                return ("Optimal" if erro_melhor <= TOL_APROXIMADA else "Falhou"), *melhor
+            if self.controle is not None:
+                self.controle.registrar(self.iteracoes, "Barreira", float(self.c @ x), None, gap)
+                if self.controle.interromper():
+                    return "Not Solved", x, y, s
+            self.iteracoes += 1
+
+            d = x / s
+            try:
+                fator = _fatorar((A * d) @ A.T)
+            except LinAlgError:
+                return "Falhou", x, y, s
+
+            def direcao(rc):
+                # S Δx + X Δs = rc; Âᵀ Δy + Δs = rd; Â Δx = rp
+                dy = cho_solve(fator, rp + A @ (d * rd - rc / s))
+                ds = rd - A.T @ dy
+                return (rc - x * ds) / s, dy, ds
+
+            mu = x @ s / N
+            # Preditor (afim) e corretor de Mehrotra com centralização σ = (μ_afim/μ)³
+            dx_a, _, ds_a = direcao(-x * s)
+            mu_afim = (x + _passo(x, dx_a) * dx_a) @ (s + _passo(s, ds_a) * ds_a) / N
+            sigma = (mu_afim / mu) ** 3
+            dx, dy, ds = direcao(-x * s - dx_a * ds_a + sigma * mu)
+
+            alfa_p = min(1.0, FRACAO_PASSO * _passo(x, dx))
+            alfa_d = min(1.0, FRACAO_PASSO * _passo(s, ds))
+            x = x + alfa_p * dx
+            y = y + alfa_d * dy
+            s = s + alfa_d * ds
+
+
+def _forma_padrao(A, operadores):
+    """Â = [A | folgas das linhas ≤/≥] e o índice, em [x | s] do revisado, de cada coluna de Â"""
+    m, n = A.shape
+    sinais = sentidos(operadores).astype(float)
+    com_folga = np.flatnonzero(sinais != 0)
+    folgas = np.zeros((m, len(com_folga)))
+    folgas[com_folga, np.arange(len(com_folga))] = sinais[com_folga]
+    return np.hstack([A, folgas]), np.concatenate([np.arange(n), n + com_folga])
+
+
+def _base_crossover(A_padrao, x, s):
+    """m colunas linearmente independentes, preferindo as de x_j/(x_j+s_j) grande (None se não houver)"""
+    m = A_padrao.shape[0]
+    peso = x / (x + s)
+    candidatas = np.argsort(-peso, kind="stable")[:min(len(peso), 2 * m)]
+    colunas = A_padrao[:, candidatas]
+    normas = np.linalg.norm(colunas, axis=0)
+    normas[normas == 0] = 1.0
+    _, R, pivos = qr(colunas * (peso[candidatas] / normas), mode="economic", pivoting=True, check_finite=False)
+    diagonal = np.abs(np.diag(R))
+    if len(diagonal) < m or diagonal[m - 1] <= 1e-10 * diagonal[0]:
+        return None
+    return candidatas[pivos[:m]]
+
+
+def resolver_barreira(c, A, b, operadores, maximizar, base_inicial=None, controle=None, crossover=True):
+    """
+    Resolve o PPL por pontos interiores (Mehrotra) e, com ``crossover``, leva o
+    ponto a uma base ótima com o Simplex Revisado. ``base_inicial`` é ignorada
+    (o método não parte de bases). Devolve um Resultado com ``barreira``
+    preenchido (ver EstatisticasBarreira).
+    """
+    from ppl.revisado import resolver_revisado
+
+    A = A.toarray() if hasattr(A, "toarray") else np.asarray(A, dtype=float)
+    m, n = A.shape
+    inicio = time.perf_counter()
+    if m == 0:
+        resultado = resolver_revisado(c, A, b, operadores, maximizar, controle=controle)
+        return resultado._replace(motor="barreira", barreira=EstatisticasBarreira(
+            0, resultado.iteracoes, 0.0, 0.0, 0.0, True, 0.0, time.perf_counter() - inicio))
+
+    with medir(controle, "montagem"):
+        A_padrao, indices = _forma_padrao(A, operadores)
+        custo = np.concatenate([-c if maximizar else c, np.zeros(A_padrao.shape[1] - n)])
+        metodo = _PontosInteriores(A_padrao, np.asarray(b, dtype=float), custo, controle)
+    with medir(controle, "barreira"):
+        status, x, y, s = metodo.executar()
+    _, _, erro_p, erro_d, gap = metodo.residuos(x, y, s)
+    meio = time.perf_counter()
+
+    def estatisticas(iteracoes_crossover=0, usou_crossover=False, observacao=None):
+        return EstatisticasBarreira(metodo.iteracoes, iteracoes_crossover, float(erro_p), float(erro_d), float(gap),
+                                    usou_crossover, meio - inicio, time.perf_counter() - meio, observacao)
+
+    if status == "Not Solved":
+        return Resultado("Not Solved", iteracoes=metodo.iteracoes, motor="barreira", barreira=estatisticas())
+    if status == "Falhou":
+        # Sem convergência (provável inviável/ilimitado): o simplex dá o status definitivo
+        resultado = resolver_revisado(c, A, b, operadores, maximizar, controle=controle)
+        return resultado._replace(
+            motor="barreira", iteracoes=metodo.iteracoes + resultado.iteracoes,
+            barreira=estatisticas(resultado.iteracoes, True,
+                                  f"sem convergência em {metodo.iteracoes} iterações; resolvido pelo simplex"))
+
+    if crossover:
+        # O simplex mede as próprias fases (partida a quente, extração)
+        with medir(controle, "crossover"):
+            base = _base_crossover(A_padrao, x, s)
+        resultado = resolver_revisado(c, A, b, operadores, maximizar,
+                                      base_inicial=None if base is None else indices[base], controle=controle)
+        observacao = None if base is not None else "sem base independente no ponto interior; simplex do zero"
+        return resultado._replace(motor="barreira", iteracoes=metodo.iteracoes + resultado.iteracoes,
+                                  barreira=estatisticas(resultado.iteracoes, True, observacao))
+
+    with medir(controle, "extração"):
+        solucao = x[:n].copy()
+        solucao[np.abs(solucao) < TOL_CONVERGENCIA * (1 + np.abs(solucao).max())] = 0.0
+        precoSombra = -y if maximizar else y.copy()
+        precoSombra[np.abs(precoSombra) < TOL] = 0.0
+        custosReduzidos = c - A.T @ precoSombra
+        custosReduzidos[np.abs(custosReduzidos) < TOL_CONVERGENCIA * (1 + np.abs(c).max(initial=0.0))] = 0.0
+    return Resultado("Optimal", solucao, float(c @ solucao), precoSombra, custosReduzidos=custosReduzidos,
+                     iteracoes=metodo.iteracoes, motor="barreira", barreira=estatisticas())
@@ -0,0 +1,212 @@
+"""
+Cache de soluções endereçado por conteúdo.
+
+A chave é um hash SHA-256 da forma canônica do problema: tipo de otimização,
+motor, c e as linhas (operador, a_i, b_i) ordenadas lexicograficamente, com os
+números normalizados (12 algarismos significativos e sem -0.0). Assim,
+problemas idênticos ou que diferem só na ordem das restrições compartilham a
+mesma entrada; o resultado guardado fica na ordem canônica e é reordenado para
+a ordem de cada pedido. Em problemas com variáveis inteiras, os tipos das
+variáveis e o gap também entram na chave, assim como os modos de resolução
+ligados (pré-resolução, decomposição, geração de linhas): eles mudam o que o
+Resultado traz (tableau, histórico, estatísticas), não só a solução.
+
+O armazenamento é um LRU em memória limitado em bytes, compartilhado por todo o
+processo (todas as sessões do Streamlit), com uma camada opcional em disco
+(variável de ambiente ``SIMPLEX_CACHE_DIR``).
+"""
+
+import os
+import pickle
+import tempfile
+import threading
+from collections import OrderedDict
+
+import numpy as np
+
+from ppl.desempenho import medir
+from ppl.motores import motor_padrao, resolver
+from ppl.problema import Problema
+
+LIMITE_BYTES_PADRAO = 64 * 1024 * 1024
+
+
+def chave_canonica(funcObj, restricoes, constantes, operadores, tipo_otimizacao, motor, tipos=None, gap=None,
+                   modos=()):
+    """
+    Devolve (chave, ordem): o hash do problema canônico e a permutação de linhas
+    usada, em que a linha canônica i é a linha ``ordem[i]`` do pedido
+    (ver Problema.chave). ``modos``: nomes dos modos de resolução ligados.
+    """
+    return Problema.criar(funcObj, restricoes, constantes, operadores, tipo_otimizacao).chave(motor, tipos, gap, modos)
+
+
+def _modos(presolve, decompor, gerar_linhas):
+    """Modos de resolução ligados, na ordem fixa em que entram na chave"""
+    return tuple(nome for nome, ligado in (("presolve", presolve), ("decompor", decompor),
+                                            ("gerar_linhas", gerar_linhas)) if ligado)
+
+
+def _permutar_linhas(resultado, ordem, n):
+    """Reordena as restrições do resultado: a nova linha i é a linha ordem[i]"""
+    if resultado.status != "Optimal":
+        # Inviável: só o raio de Farkas (semente do IIS) é indexado por restrição
+        if resultado.farkas is not None:
+            return resultado._replace(farkas=resultado.farkas[ordem])
+        return resultado
+    m = len(ordem)
+    inversa = np.empty(m, dtype=int)
+    inversa[ordem] = np.arange(m)
+
+    trocas = {"precoSombra": resultado.precoSombra[ordem]}
+    if resultado.tableau is not None and resultado.tableau.shape[1] == n + m + 1:
+        tableau = resultado.tableau.copy()
+        tableau[:, n:n + m] = resultado.tableau[:, n + ordem]
+        if resultado.base is None:
+            # Tableau simplificado: as linhas também são as restrições
+            tableau[:m] = tableau[ordem]
+        trocas["tableau"] = tableau
+    if resultado.base is not None:
+        base = resultado.base.copy()
+        folga = (base >= n) & (base < n + m)
+        artificial = base >= n + m
+        base[folga] = n + inversa[base[folga] - n]
+        base[artificial] = n + m + inversa[base[artificial] - n - m]
+        trocas["base"] = base
+    if resultado.historico is not None:
+        trocas["historico"] = resultado.historico.permutar(ordem)
+    return resultado._replace(**trocas)
+
+
+def _tamanho(resultado):
+    """Estimativa do espaço ocupado por um resultado (bytes)"""
+    historico = resultado.historico.nbytes if resultado.historico is not None else 0
+    return 256 + historico + sum(v.nbytes for v in resultado if isinstance(v, np.ndarray))
+
+
+class CacheSolucoes:
+    """LRU de resultados, limitado em bytes, seguro para várias threads"""
+
+    def __init__(self, limite_bytes=LIMITE_BYTES_PADRAO, diretorio=None):
+        self.limite_bytes = limite_bytes
+        self.diretorio = diretorio
+        self._itens = OrderedDict()
+        self._bytes = 0
+        self._trava = threading.Lock()
+        self.acertos = 0
+        self.acertos_disco = 0
+        self.faltas = 0
+        self.despejos = 0
+        if diretorio:
+            os.makedirs(diretorio, exist_ok=True)
+
+    def __len__(self):
+        return len(self._itens)
+
+    def estatisticas(self):
+        """Contadores para exibição"""
+        with self._trava:
+            return {
+                "acertos": self.acertos,
+                "acertos_disco": self.acertos_disco,
+                "faltas": self.faltas,
+                "despejos": self.despejos,
+                "entradas": len(self._itens),
+                "bytes": self._bytes,
+            }
+
+    def limpar(self):
+        with self._trava:
+            self._itens.clear()
+            self._bytes = 0
+
+    def obter(self, chave):
+        with self._trava:
+            resultado = self._itens.get(chave)
+            if resultado is not None:
+                self._itens.move_to_end(chave)
+                self.acertos += 1
+                return resultado
+        resultado = self._ler_disco(chave)
+        with self._trava:
+            if resultado is not None:
+                self.acertos_disco += 1
+                self._inserir(chave, resultado)
+            else:
+                self.faltas += 1
+        return resultado
+
+    def guardar(self, chave, resultado):
+        with self._trava:
+            self._inserir(chave, resultado)
+        self._gravar_disco(chave, resultado)
+
+    def _inserir(self, chave, resultado):
+        if chave in self._itens:
+            self._bytes -= _tamanho(self._itens.pop(chave))
+        self._itens[chave] = resultado
+        self._bytes += _tamanho(resultado)
+        while self._bytes > self.limite_bytes and len(self._itens) > 1:
+            _, antigo = self._itens.popitem(last=False)
+            self._bytes -= _tamanho(antigo)
+            self.despejos += 1
+
+    def _caminho(self, chave):
+        return os.path.join(self.diretorio, f"{chave}.pkl")
+
+    def _ler_disco(self, chave):
+        if not self.diretorio:
+            return None
+        try:
+            with open(self._caminho(chave), "rb") as f:
+                return pickle.load(f)
+        except (OSError, pickle.UnpicklingError, EOFError):
+            return None
+
+    def _gravar_disco(self, chave, resultado):
+        if not self.diretorio:
+            return
+        fd, temporario = tempfile.mkstemp(dir=self.diretorio, suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            pickle.dump(resultado, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temporario, self._caminho(chave))
+
+    def resolver(self, funcObj, restricoes, constantes, operadores, tipo_otimizacao,
+                 motor=None, base_inicial=None, controle=None, presolve=False, tipos=None, gap=None,
+                 decompor=False, gerar_linhas=False):
+        """
+        Resolve passando pelo cache. O resultado volta na ordem de restrições
+        do pedido, com ``doCache=True`` quando veio do cache.
+        Resoluções interrompidas ("Not Solved") não são guardadas.
+        """
+        motor = motor or motor_padrao()
+        n = len(funcObj)
+        with medir(controle, "cache"):
+            chave, ordem = chave_canonica(funcObj, restricoes, constantes, operadores, tipo_otimizacao, motor,
+                                          tipos, gap, _modos(presolve, decompor, gerar_linhas))
+            guardado = self.obter(chave)
+        if guardado is not None:
+            inversa = np.empty(len(ordem), dtype=int)
+            inversa[ordem] = np.arange(len(ordem))
+            return _permutar_linhas(guardado, inversa, n)._replace(doCache=True)
+
+        resultado = resolver(funcObj, restricoes, constantes, operadores, tipo_otimizacao,
+                             motor=motor, base_inicial=base_inicial, controle=controle, presolve=presolve,
+                             tipos=tipos, gap=gap, decompor=decompor, gerar_linhas=gerar_linhas)
+        if resultado.status != "Not Solved":
+            with medir(controle, "cache"):
+                self.guardar(chave, _permutar_linhas(resultado, ordem, n))
+        return resultado
+
+
+_cache_global = None
+_trava_global = threading.Lock()
+
+
+def cache_global():
+    """Cache único do processo, compartilhado por todas as sessões"""
+    global _cache_global
+    with _trava_global:
+        if _cache_global is None:
+            _cache_global = CacheSolucoes(diretorio=os.environ.get("SIMPLEX_CACHE_DIR") or None)
+        return _cache_global
@@ -0,0 +1,315 @@
+"""
+Execução de muitos cenários (c e/ou b) sobre um mesmo modelo, em fluxo contínuo.
+
+Uso:
+    python -m ppl.cenarios modelo.mps cenarios.parquet saida/ [--motor revisado]
+        [--linhas-por-bloco 10000] [--processos 4] [--sem-solucao] [--sem-duais]
+
+O modelo (MPS, LP ou CSV, ver ppl.leitura) fixa A, os operadores e os valores
+padrão de c e b. Cada linha do arquivo de cenários (CSV ou Parquet) é um
+cenário; as colunas ``c:<variável>`` e ``b:<restrição>`` substituem os valores
+do modelo, e uma coluna ``id`` opcional identifica o cenário na saída (sem
+ela, vale o número da linha).
+
+O processamento é uma sequência de geradores, com memória limitada:
+
+1. ``ler_blocos`` lê o arquivo de cenários em blocos de ``--linhas-por-bloco``;
+2. ``resolver_blocos`` manda cada bloco a um processo do pool (no máximo
+   ``EM_VOO_POR_PROCESSO`` blocos por processo ao mesmo tempo), que resolve os
+   cenários em sequência com partida a quente (ver ppl.lote);
+3. ``executar`` grava cada bloco resolvido como ``parte-NNNNNN.parquet`` em
+   ``saida/`` e registra o bloco em ``checkpoint.json``.
+
+Interrompida, a execução é retomada com o mesmo comando: os blocos já
+registrados no checkpoint são pulados. O andamento (cenários/s) é relatado no
+stderr a cada ``--intervalo`` segundos, e o resumo final sai no stdout.
+O Parquet (entrada e saída) requer o pyarrow.
+"""
+
+import hashlib
+import json
+import os
+import sys
+import time
+from collections import Counter
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+import numpy as np
+
+LINHAS_POR_BLOCO = 10_000
+EM_VOO_POR_PROCESSO = 2
+INTERVALO_RELATORIO = 5.0
+CHECKPOINT = "checkpoint.json"
+# Motores que trabalham com A densa ("auto" escolhe entre revisado e barreira): A esparsa é
+# convertida uma vez no modelo, e não a cada cenário; os demais recebem a CSR como está
+MOTORES_DENSOS = ("revisado", "barreira", "auto")
+
+_modelo_trabalhador = None
+
+
+class Modelo:
+    """Parte fixa dos cenários: A (densa só para os MOTORES_DENSOS), operadores, c e b padrão e os nomes"""
+
+    def __init__(self, problema, motor):
+        self.A = problema.restricoes
+        if motor in MOTORES_DENSOS and hasattr(self.A, "toarray"):
+            self.A = self.A.toarray()
+        self.operadores = list(problema.operadores)
+        self.tipo_otimizacao = problema.tipo_otimizacao
+        self.c = np.asarray(problema.funcObj, dtype=float)
+        self.b = np.asarray(problema.constantes, dtype=float)
+        self.nomes_variaveis = list(problema.nomes_variaveis)
+        self.nomes_restricoes = list(problema.nomes_restricoes)
+        self.tipos = problema.tipos if problema.tipos and any(t != "Contínua" for t in problema.tipos) else None
+        self.motor = motor
+        self._coluna_c = {nome: j for j, nome in enumerate(self.nomes_variaveis)}
+        self._coluna_b = {nome: i for i, nome in enumerate(self.nomes_restricoes)}
+
+    def matrizes(self, colunas):
+        """Cenários (k linhas, dicionário coluna → array) como C (k×n) e B (k×m)"""
+        k = len(next(iter(colunas.values()))) if colunas else 0
+        C = np.broadcast_to(self.c, (k, len(self.c))).copy()
+        B = np.broadcast_to(self.b, (k, len(self.b))).copy()
+        for nome, valores in colunas.items():
+            prefixo, _, alvo = nome.partition(":")
+            if nome == "id":
+                continue
+            if prefixo == "c" and alvo in self._coluna_c:
+                C[:, self._coluna_c[alvo]] = valores
+            elif prefixo == "b" and alvo in self._coluna_b:
+                B[:, self._coluna_b[alvo]] = valores
+            else:
+                raise ValueError(f"Coluna de cenário desconhecida: {nome!r} "
+                                 "(use id, c:<variável> ou b:<restrição> do modelo)")
+        return C, B
+
+    def resolver(self, C, B):
+        """Resolve os cenários em sequência; devolve (status, x, valor, y, iterações)"""
+        if self.motor == "revisado" and self.tipos is None:
+            from ppl.lote import _resolver_bloco
+
+            return _resolver_bloco(self.A, self.operadores, self.tipo_otimizacao == "Maximizar", C, B)
+
+        from ppl.motores import resolver
+
+        k, n = C.shape
+        status = np.empty(k, dtype=object)
+        solucoes = np.full((k, n), np.nan)
+        valores = np.full(k, np.nan)
+        precos = np.full((k, len(self.b)), np.nan)
+        iteracoes = np.zeros(k, dtype=int)
+        for i in range(k):
+            r = resolver(C[i], self.A, B[i], self.operadores, self.tipo_otimizacao, motor=self.motor,
+                         tipos=self.tipos)
+            status[i], iteracoes[i] = r.status, r.iteracoes
+            if r.status == "Optimal":
+                solucoes[i], valores[i], precos[i] = r.solucao, r.valorOtimo, r.precoSombra
+        return status, solucoes, valores, precos, iteracoes
+
+
+def _iniciar_trabalhador(modelo):
+    global _modelo_trabalhador
+    _modelo_trabalhador = modelo
+
+
+def _resolver_no_trabalhador(C, B):
+    return _modelo_trabalhador.resolver(C, B)
+
+
+def ler_blocos(caminho, linhas_por_bloco=LINHAS_POR_BLOCO):
+    """Gera (índice do bloco, primeira linha, {coluna: array}) lendo CSV ou Parquet aos poucos"""
+    if caminho.lower().endswith(".parquet"):
+        import pyarrow.parquet as pq
+
+        lotes = ({nome: lote.column(nome).to_numpy(zero_copy_only=False) for nome in lote.schema.names}
+                 for lote in pq.ParquetFile(caminho).iter_batches(batch_size=linhas_por_bloco))
+    else:
+        import pandas as pd
+
+        lotes = ({nome: parte[nome].to_numpy() for nome in parte.columns}
+                 for parte in pd.read_csv(caminho, chunksize=linhas_por_bloco))
+    inicio = 0
+    for indice, colunas in enumerate(lotes):
+        yield indice, inicio, colunas
+        inicio += len(next(iter(colunas.values())))
+
+
+def resolver_blocos(blocos, modelo, processos, pular=frozenset(), **campos):
+    """
+    Gera (índice, tabela) de cada bloco resolvido, na ordem em que terminam.
+    Lê do gerador ``blocos`` só quando há vaga: no máximo EM_VOO_POR_PROCESSO
+    blocos por processo em andamento. Blocos em ``pular`` não são resolvidos.
+    ``campos``: solucao/duais, repassados a ``tabela_saida``.
+    """
+    def preparar(indice, inicio, colunas):
+        C, B = modelo.matrizes(colunas)
+        ids = colunas["id"] if "id" in colunas else np.arange(inicio, inicio + len(C))
+        return ids, C, B
+
+    if processos == 1:
+        for indice, inicio, colunas in blocos:
+            if indice in pular:
+                continue
+            ids, C, B = preparar(indice, inicio, colunas)
+            yield indice, tabela_saida(modelo, ids, modelo.resolver(C, B), **campos)
+        return
+
+    limite = EM_VOO_POR_PROCESSO * processos
+    em_voo = {}
+    with ProcessPoolExecutor(max_workers=processos, initializer=_iniciar_trabalhador,
+                             initargs=(modelo,)) as pool:
+        try:
+            for indice, inicio, colunas in blocos:
+                if indice in pular:
+                    continue
+                ids, C, B = preparar(indice, inicio, colunas)
+                em_voo[pool.submit(_resolver_no_trabalhador, C, B)] = (indice, ids)
+                while len(em_voo) >= limite:
+                    yield from _concluidos(em_voo, modelo, campos)
+            while em_voo:
+                yield from _concluidos(em_voo, modelo, campos)
+        finally:
+            for futuro in em_voo:
+                futuro.cancel()
+
+
+def _concluidos(em_voo, modelo, campos):
+    prontos, _ = wait(em_voo, return_when=FIRST_COMPLETED)
+    for futuro in prontos:
+        indice, ids = em_voo.pop(futuro)
+        yield indice, tabela_saida(modelo, ids, futuro.result(), **campos)
+
+
+def tabela_saida(modelo, ids, partes, solucao=True, duais=True):
+    """Colunas de saída de um bloco: id, status, valor ótimo, iterações, x:<var> e y:<restr>"""
+    status, solucoes, valores, precos, iteracoes = partes
+    tabela = {"id": np.asarray(ids), "status": status.astype(str), "valor_otimo": valores,
+              "iteracoes": iteracoes.astype(np.int64)}
+    if solucao:
+        tabela.update({f"x:{nome}": solucoes[:, j] for j, nome in enumerate(modelo.nomes_variaveis)})
+    if duais:
+        tabela.update({f"y:{nome}": precos[:, i] for i, nome in enumerate(modelo.nomes_restricoes)})
+    return tabela
+
+
+def _assinatura(caminho_modelo, caminho_cenarios, motor, linhas_por_bloco):
+    """Identifica a execução: conteúdo do modelo, arquivo de cenários (tamanho e data), motor e bloco"""
+    h = hashlib.sha256()
+    with open(caminho_modelo, "rb") as f:
+        for parte in iter(lambda: f.read(1 << 20), b""):
+            h.update(parte)
+    info = os.stat(caminho_cenarios)
+    return {"modelo": h.hexdigest(), "cenarios": os.path.abspath(caminho_cenarios),
+            "tamanho": info.st_size, "modificado": info.st_mtime_ns, "motor": motor,
+            "linhas_por_bloco": linhas_por_bloco}
+
+
+def _gravar_atomico(caminho, escrever):
+    temporario = caminho + ".tmp"
+    escrever(temporario)
+    os.replace(temporario, caminho)
+
+
+def executar(caminho_modelo, caminho_cenarios, saida, motor="revisado", linhas_por_bloco=LINHAS_POR_BLOCO,
+             processos=None, solucao=True, duais=True, intervalo=INTERVALO_RELATORIO, relatorio=sys.stderr):
+    """
+    Resolve todos os cenários e grava a saída em partes Parquet, retomando de um
+    checkpoint compatível em ``saida``. Devolve o resumo da execução (dicionário).
+    """
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    from ppl.leitura import ler_modelo
+
+    problema, _ = ler_modelo(caminho_modelo)
+    modelo = Modelo(problema, motor)
+    processos = processos or os.cpu_count() or 1
+
+    os.makedirs(saida, exist_ok=True)
+    caminho_checkpoint = os.path.join(saida, CHECKPOINT)
+    assinatura = _assinatura(caminho_modelo, caminho_cenarios, motor, linhas_por_bloco)
+    concluidos = {}
+    if os.path.exists(caminho_checkpoint):
+        with open(caminho_checkpoint, encoding="utf-8") as f:
+            anterior = json.load(f)
+        if anterior["assinatura"] != assinatura:
+            raise ValueError(f"{caminho_checkpoint} é de outra execução (modelo, cenários, motor ou "
+                             "tamanho de bloco diferentes); use outra pasta de saída")
+        concluidos = {int(indice): linhas for indice, linhas in anterior["concluidos"].items()}
+
+    def gravar_checkpoint(caminho):
+        with open(caminho, "w", encoding="utf-8") as f:
+            json.dump({"assinatura": assinatura, "concluidos": concluidos}, f)
+
+    inicio = ultimo_relatorio = time.perf_counter()
+    resolvidos = 0
+    contagem = Counter()
+    blocos = ler_blocos(caminho_cenarios, linhas_por_bloco)
+    for indice, tabela in resolver_blocos(blocos, modelo, processos, pular=frozenset(concluidos),
+                                          solucao=solucao, duais=duais):
+        tabela_arrow = pa.table(tabela)
+        _gravar_atomico(os.path.join(saida, f"parte-{indice:06d}.parquet"),
+                        lambda caminho: pq.write_table(tabela_arrow, caminho))
+        concluidos[indice] = len(tabela["id"])
+        _gravar_atomico(caminho_checkpoint, gravar_checkpoint)
+
+        resolvidos += len(tabela["id"])
+        contagem.update(tabela["status"].tolist())
+        agora = time.perf_counter()
+        if relatorio is not None and agora - ultimo_relatorio >= intervalo:
+            ultimo_relatorio = agora
+            print(f"[{agora - inicio:7.1f} s] {resolvidos:,} cenários nesta execução "
+                  f"({resolvidos / (agora - inicio):,.0f}/s) | {len(concluidos):,} blocos concluídos",
+                  file=relatorio, flush=True)
+
+    segundos = time.perf_counter() - inicio
+    return {"cenarios_resolvidos": resolvidos, "cenarios_total": sum(concluidos.values()),
+            "blocos": len(concluidos), "segundos": segundos,
+            "cenarios_por_s": resolvidos / segundos if segundos else None,
+            "status": dict(contagem), "processos": processos, "motor": motor}
+
+
+def main(argv=None):
+    import argparse
+
+    from ppl.motores import MOTORES
+
+    parser = argparse.ArgumentParser(description="Resolve cenários (c e/ou b) de um modelo, em fluxo contínuo")
+    parser.add_argument("modelo", help="modelo base (MPS, LP ou CSV)")
+    parser.add_argument("cenarios", help="cenários em CSV ou Parquet (colunas id, c:<variável>, b:<restrição>)")
+    parser.add_argument("saida", help="pasta das partes Parquet e do checkpoint")
+    parser.add_argument("--motor", default="revisado", choices=list(MOTORES))
+    parser.add_argument("--linhas-por-bloco", type=int, default=LINHAS_POR_BLOCO)
+    parser.add_argument("--processos", type=int, default=None, help="tamanho do pool (padrão: núcleos)")
+    parser.add_argument("--sem-solucao", action="store_true", help="não grava as colunas x:<variável>")
+    parser.add_argument("--sem-duais", action="store_true", help="não grava as colunas y:<restrição>")
+    parser.add_argument("--intervalo", type=float, default=INTERVALO_RELATORIO,
+                        help="segundos entre relatórios de andamento")
+    parser.add_argument("--json", action="store_true", help="resumo final como JSON")
+    args = parser.parse_args(argv)
+
+    try:
+        resumo = executar(args.modelo, args.cenarios, args.saida, motor=args.motor,
+                          linhas_por_bloco=args.linhas_por_bloco, processos=args.processos,
+                          solucao=not args.sem_solucao, duais=not args.sem_duais, intervalo=args.intervalo)
+    except KeyboardInterrupt:
+        print("Interrompido: os blocos concluídos estão no checkpoint; rode o mesmo comando para retomar.",
+              file=sys.stderr)
+        return 130
+    except (ValueError, OSError) as erro:
+        print(f"Erro: {erro}", file=sys.stderr)
+        return 2
+
+    if args.json:
+        print(json.dumps(resumo, ensure_ascii=False))
+    else:
+        status = ", ".join(f"{nome}: {quantidade:,}" for nome, quantidade in sorted(resumo["status"].items()))
+        print(f"{resumo['cenarios_resolvidos']:,} cenários em {resumo['segundos']:.1f} s "
+              f"({resumo['cenarios_por_s'] or 0:,.0f} cenários/s, {resumo['processos']} processos, "
+              f"motor {resumo['motor']})")
+        print(f"Saída: {resumo['blocos']:,} partes com {resumo['cenarios_total']:,} cenários | {status or '—'}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
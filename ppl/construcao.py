@@ -0,0 +1,60 @@
+"""
+Montagem vetorizada do modelo PuLP a partir de arrays (c, A, b, operadores).
+
+Em vez de somar ``restricoes[i][j] * vars[j]`` termo a termo (o que cria um
+``LpAffineExpression`` intermediário por coeficiente, inclusive os nulos), a
+matriz é percorrida em formato CSR e cada linha vira uma única expressão,
+criada de uma vez a partir dos pares (variável, coeficiente) não nulos.
+Variáveis marcadas como "Inteira" ou "Binária" (ver ppl.inteiro) são criadas
+com a categoria correspondente do PuLP.
+"""
+
+import numpy as np
+
+from ppl.problema import sentidos
+
+
+def _como_csr(A, m, n):
+    from scipy.sparse import csr_matrix
+
+    if hasattr(A, "tocsr"):
+        return A.tocsr()
+    return csr_matrix(np.asarray(A, dtype=float).reshape(m, n))
+
+
+def montar_pulp(c, A, b, operadores, maximizar, tipos=None):
+    """
+    Monta o LpProblem em bloco, pulando coeficientes nulos.
+    ``operadores``: texto ("≤", "≥", "=") ou o vetor int8 de sentidos (ver ppl.problema).
+    ``tipos``: "Contínua", "Inteira" ou "Binária" por variável (padrão: todas contínuas).
+    Devolve (prob, vars); as restrições se chamam Restricao_1, Restricao_2, ...
+    """
+    from pulp import (LpAffineExpression, LpBinary, LpConstraint, LpConstraintEQ, LpConstraintGE,
+                      LpConstraintLE, LpContinuous, LpInteger, LpMaximize, LpMinimize, LpProblem,
+                      LpVariable)
+
+    c = np.asarray(c, dtype=float)
+    b = np.asarray(b, dtype=float)
+    m, n = len(b), len(c)
+    A = _como_csr(A, m, n)
+    A.eliminate_zeros()
+
+    prob = LpProblem("PPL", LpMaximize if maximizar else LpMinimize)
+    categorias = {"Contínua": LpContinuous, "Inteira": LpInteger, "Binária": LpBinary}
+    tipos = tipos if tipos is not None else ["Contínua"] * n
+    vars = [LpVariable(f"x{j+1}", lowBound=0, cat=categorias[t]) for j, t in enumerate(tipos)]
+
+    nz = np.flatnonzero(c)
+    prob.setObjective(LpAffineExpression(zip([vars[j] for j in nz], c[nz].tolist()),
+                                         name="FuncaoObjetivo"))
+
+    por_sentido = {1: LpConstraintLE, -1: LpConstraintGE, 0: LpConstraintEQ}
+    indptr = A.indptr.tolist()
+    colunas = A.indices.tolist()
+    valores = A.data.tolist()
+    rhs = b.tolist()
+    for i, sentido in enumerate(sentidos(operadores).tolist()):
+        ini, fim = indptr[i], indptr[i + 1]
+        expr = LpAffineExpression(zip(map(vars.__getitem__, colunas[ini:fim]), valores[ini:fim]))
+        prob.addConstraint(LpConstraint(expr, por_sentido[sentido], name=f"Restricao_{i+1}", rhs=rhs[i]))
+    return prob, vars
@@ -0,0 +1,505 @@
+"""
+Detecção de estrutura em blocos e resolução por decomposição.
+
+Muitos modelos são vários subproblemas independentes (uma fábrica, um produto)
+ligados, no máximo, por poucas restrições de capacidade compartilhada. A
+matriz A é vista como um grafo bipartido linhas × colunas: cada componente
+conexa é um bloco. Se houver um só componente, as linhas mais densas são
+candidatas a ligantes (a "borda"); procura-se o menor número delas cuja
+remoção separa o modelo em dois ou mais blocos.
+
+- Bloco-diagonal (sem ligantes): cada bloco é resolvido em um processo do pool
+  e as soluções e preços-sombra são juntados num único Resultado.
+- Com borda (ligantes): Dantzig–Wolfe. O problema mestre tem as linhas
+  ligantes, uma linha de convexidade por bloco e uma coluna λ por ponto
+  extremo proposto pelos blocos; a cada rodada os blocos são precificados em
+  paralelo com o custo c_k - D_kᵀπ (π: preços-sombra das ligantes no mestre),
+  partindo da base da rodada anterior. Colunas que só aparecem nas ligantes
+  entram direto no mestre. A Fase 1 do mestre (artificiais nas ligantes) só
+  roda se as primeiras propostas violarem as ligantes. O limitante de
+  Lagrange (mestre + custos reduzidos dos blocos) dá o gap a cada rodada.
+
+Os preços-sombra das linhas de cada bloco são os do bloco na última rodada,
+que, junto com π, formam uma solução dual ótima do problema inteiro. Quando
+a decomposição não se aplica (um bloco precificado ilimitado, que exigiria
+raios extremos, ou sem convergência em ``MAX_RODADAS``), o problema é resolvido
+inteiro pelo motor e o motivo fica em ``EstatisticasDecomposicao.observacao``.
+"""
+
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import NamedTuple, Optional
+
+import numpy as np
+from scipy.sparse import bmat, csr_matrix
+from scipy.sparse.csgraph import connected_components
+
+from ppl.desempenho import medir
+from ppl.problema import sentidos
+
+TOL = 1e-9
+TOL_VIAVEL = 1e-7
+TOL_GAP = 1e-7              # gap relativo em que o Dantzig–Wolfe para
+FRACAO_LIGANTES = 0.1       # no máximo esta fração das linhas vira borda
+MAX_LIGANTES = 64
+BLOCOS_POR_PROCESSO = 4     # blocos pequenos são agrupados até este número por processo
+MAX_RODADAS = 500
+
+
+class Estrutura(NamedTuple):
+    """Blocos de A (linhas e colunas de cada um) e o que fica fora deles"""
+    blocos: list                  # [(linhas, colunas)]
+    ligantes: np.ndarray          # linhas que ligam os blocos (borda)
+    linhas_vazias: np.ndarray     # linhas sem coeficiente (0 op b)
+    colunas_mestre: np.ndarray    # colunas fora dos blocos (só nas ligantes ou em nenhuma linha)
+
+    @property
+    def tipo(self):
+        if len(self.blocos) <= 1:
+            return "monolítico"
+        return "bordas" if len(self.ligantes) else "bloco-diagonal"
+
+
+class EstatisticasDecomposicao(NamedTuple):
+    """O que a decomposição encontrou e quanto custou"""
+    tipo: str                     # "monolítico", "bloco-diagonal" ou "bordas"
+    blocos: int
+    ligantes: int
+    rodadas: int                  # rodadas do Dantzig–Wolfe (1 sem ligantes)
+    colunas: int                  # propostas geradas pelos blocos
+    processos: int
+    segundos_deteccao: float
+    segundos_resolucao: float
+    observacao: Optional[str] = None
+
+
+# --- Detecção -------------------------------------------------------------------
+
+def _componentes(A, linhas):
+    """Blocos (linhas, colunas) do grafo bipartido formado só pelas ``linhas`` de A"""
+    sub = A[linhas]
+    r, n = sub.shape
+    grafo = bmat([[None, sub], [sub.T, None]], format="csr")
+    _, rotulos = connected_components(grafo, directed=False)
+    rot_linhas, rot_colunas = rotulos[:r], rotulos[r:]
+    presentes = np.unique(rot_linhas)
+    # Componentes só de colunas (colunas fora dessas linhas) não formam bloco
+    ordem_linhas = np.argsort(rot_linhas, kind="stable")
+    cortes_linhas = np.searchsorted(rot_linhas[ordem_linhas], presentes)
+    grupos_linhas = np.split(linhas[ordem_linhas], cortes_linhas[1:])
+    colunas_por_rotulo = {rotulo: [] for rotulo in presentes.tolist()}
+    no_bloco = np.isin(rot_colunas, presentes)
+    for j in np.flatnonzero(no_bloco):
+        colunas_por_rotulo[int(rot_colunas[j])].append(j)
+    blocos = [(grupo, np.array(colunas_por_rotulo[rotulo], dtype=int))
+              for rotulo, grupo in zip(presentes.tolist(), grupos_linhas)]
+    return blocos, np.flatnonzero(~no_bloco)
+
+
+def detectar_estrutura(A, max_ligantes=None):
+    """
+    Estrutura em blocos de A (densa ou esparsa): componentes conexas e, se só
+    houver uma, a menor borda (linhas mais densas primeiro) que separa dois ou
+    mais blocos. ``max_ligantes``: limite de linhas na borda (padrão:
+    ``FRACAO_LIGANTES`` das linhas, até ``MAX_LIGANTES``).
+    """
+    A = csr_matrix(A)
+    A.eliminate_zeros()
+    m = A.shape[0]
+    por_linha = np.diff(A.indptr)
+    linhas_vazias = np.flatnonzero(por_linha == 0)
+    cheias = np.flatnonzero(por_linha > 0)
+
+    blocos, fora = _componentes(A, cheias)
+    if len(blocos) > 1 or len(cheias) < 3:
+        return Estrutura(blocos, np.zeros(0, dtype=int), linhas_vazias, fora)
+
+    if max_ligantes is None:
+        max_ligantes = min(MAX_LIGANTES, int(FRACAO_LIGANTES * m))
+    candidatas = cheias[np.argsort(-por_linha[cheias], kind="stable")][:max_ligantes]
+
+    # Busca binária pelo menor prefixo de candidatas que separa o modelo
+    # (tirar mais linhas só separa mais, a não ser em casos degenerados)
+    def separar(k):
+        restantes = np.setdiff1d(cheias, candidatas[:k], assume_unique=True)
+        blocos, fora = _componentes(A, restantes)
+        return (blocos, fora) if len(blocos) > 1 else None
+
+    if len(candidatas) == 0 or separar(len(candidatas)) is None:
+        return Estrutura(blocos, np.zeros(0, dtype=int), linhas_vazias, fora)
+    baixo, alto = 0, len(candidatas)          # separar(alto) funciona; separar(baixo) não
+    while alto - baixo > 1:
+        meio = (baixo + alto) // 2
+        if separar(meio) is None:
+            baixo = meio
+        else:
+            alto = meio
+    blocos, fora = separar(alto)
+    return Estrutura(blocos, np.sort(candidatas[:alto]), linhas_vazias, fora)
+
+
+def agrupar(blocos, grupos):
+    """Junta blocos pequenos em até ``grupos`` grupos de tamanho parecido (maior primeiro)"""
+    if len(blocos) <= grupos:
+        return blocos
+    tamanhos = [len(linhas) * len(colunas) for linhas, colunas in blocos]
+    cargas = np.zeros(grupos)
+    membros = [[] for _ in range(grupos)]
+    for i in np.argsort(tamanhos, kind="stable")[::-1]:
+        g = int(np.argmin(cargas))
+        cargas[g] += tamanhos[i]
+        membros[g].append(blocos[i])
+    return [(np.sort(np.concatenate([l for l, _ in grupo])), np.sort(np.concatenate([c for _, c in grupo])))
+            for grupo in membros if grupo]
+
+
+# --- Blocos no pool -------------------------------------------------------------
+
+class _Bloco(NamedTuple):
+    A: object           # linhas e colunas do bloco (densa ou esparsa, como a original)
+    b: np.ndarray
+    operadores: list
+
+
+def _resolver_bloco(nome, maximizar, bloco, custos, base, controle=None):
+    from ppl.motores import MOTORES
+
+    resultado = MOTORES[nome](custos, bloco.A, bloco.b, bloco.operadores, maximizar,
+                              base_inicial=base, controle=controle)
+    # Só o necessário volta ao processo principal
+    return resultado._replace(tableau=None, historico=None)
+
+
+_blocos_trabalhador = None
+
+
+def _iniciar_trabalhador(nome, blocos):
+    global _blocos_trabalhador
+    _blocos_trabalhador = (nome, blocos)
+
+
+def _resolver_no_trabalhador(k, custos, maximizar, base):
+    nome, blocos = _blocos_trabalhador
+    return _resolver_bloco(nome, maximizar, blocos[k], custos, base)
+
+
+class _Executor:
+    """Resolve blocos (com custos dados) em série ou no pool, guardando a base de cada um"""
+
+    def __init__(self, nome, blocos, processos, controle):
+        self.nome = nome
+        self.blocos = blocos
+        self.controle = controle
+        self.processos = processos
+        self.bases = [None] * len(blocos)
+        self.iteracoes = 0
+        self._pool = None
+        if processos > 1:
+            self._pool = ProcessPoolExecutor(max_workers=processos, initializer=_iniciar_trabalhador,
+                                             initargs=(nome, blocos))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *erro):
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+
+    def resolver(self, custos, maximizar):
+        """Resultados dos blocos, na ordem, para os vetores de custo ``custos`` (um por bloco)"""
+        if self._pool is None:
+            resultados = [_resolver_bloco(self.nome, maximizar, bloco, c, base, self.controle)
+                          for bloco, c, base in zip(self.blocos, custos, self.bases)]
+        else:
+            futuros = [self._pool.submit(_resolver_no_trabalhador, k, c, maximizar, base)
+                       for k, (c, base) in enumerate(zip(custos, self.bases))]
+            resultados = [futuro.result() for futuro in futuros]
+        for k, (bloco, resultado) in enumerate(zip(self.blocos, resultados)):
+            self.iteracoes += resultado.iteracoes
+            # Só muda o custo entre rodadas: a base ótima anterior continua viável
+            m, n = bloco.A.shape
+            if resultado.base is not None and (resultado.base < n + m).all():
+                self.bases[k] = resultado.base
+        return resultados
+
+
+# --- Resolução ------------------------------------------------------------------
+
+def _pior_status(resultados):
+    for status in ("Infeasible", "Unbounded", "Not Solved"):
+        if any(r.status == status for r in resultados):
+            return status
+    return "Optimal"
+
+
+def _viavel_vazia(b, operadores):
+    """As linhas vazias (0 op b) são satisfeitas?"""
+    # sentido·b ≥ 0 nas desigualdades; b = 0 nas igualdades
+    s = sentidos(operadores)
+    return bool(np.where(s == 0, np.abs(b) <= TOL_VIAVEL, s * b >= -TOL_VIAVEL).all())
+
+
+class _Decomposicao:
+    """Dados do PPL repartidos segundo a estrutura, e a montagem do Resultado final"""
+
+    def __init__(self, nome, c, A, b, operadores, maximizar, estrutura, processos):
+        self.nome = nome
+        self.c, self.A, self.b = c, A, b
+        self.operadores = operadores
+        self.maximizar = maximizar
+        self.sentido = 1.0 if maximizar else -1.0
+        self.estrutura = estrutura
+        self.A_csr = csr_matrix(A)
+        denso = not hasattr(A, "tocsr")
+        self.blocos = []
+        for linhas, colunas in estrutura.blocos:
+            A_k = A[np.ix_(linhas, colunas)] if denso else self.A_csr[linhas][:, colunas]
+            self.blocos.append(_Bloco(A_k, b[linhas], [operadores[i] for i in linhas]))
+        self.processos = max(1, min(processos, len(self.blocos)))
+
+    def resultado(self, status, x, y, iteracoes):
+        from ppl.motores import Resultado
+
+        if status != "Optimal":
+            return Resultado(status, iteracoes=iteracoes, motor=self.nome)
+        y[np.abs(y) < TOL] = 0.0
+        custos_reduzidos = self.c - self.A_csr.T @ y
+        return Resultado("Optimal", x, float(self.c @ x), y, custosReduzidos=custos_reduzidos,
+                         iteracoes=iteracoes, motor=self.nome)
+
+    def checar_fora(self):
+        """Status imposto pelas linhas vazias e colunas sem nenhum coeficiente (None se nenhum)"""
+        vazias = self.estrutura.linhas_vazias
+        if len(vazias) and not _viavel_vazia(self.b[vazias], [self.operadores[i] for i in vazias]):
+            return "Infeasible"
+        return None
+
+    def independentes(self, executor):
+        """Blocos sem ligantes: uma resolução por bloco, juntadas"""
+        n, m = len(self.c), len(self.b)
+        resultados = executor.resolver([self.c[colunas] for _, colunas in self.estrutura.blocos], self.maximizar)
+        status = _pior_status(resultados)
+        livres = self.estrutura.colunas_mestre
+        if status == "Optimal" and (self.sentido * self.c[livres] > TOL).any():
+            status = "Unbounded"      # coluna sem restrição que melhora o objetivo
+        if status != "Optimal":
+            return self.resultado(status, None, None, executor.iteracoes)
+        x, y = np.zeros(n), np.zeros(m)
+        for (linhas, colunas), r in zip(self.estrutura.blocos, resultados):
+            x[colunas] = r.solucao
+            y[linhas] = r.precoSombra
+        return self.resultado("Optimal", x, y, executor.iteracoes)
+
+
+class _DantzigWolfe:
+    """Geração de colunas sobre os blocos, com as ligantes no problema mestre"""
+
+    def __init__(self, dec, executor, controle):
+        self.dec = dec
+        self.executor = executor
+        self.controle = controle
+        L = dec.estrutura.ligantes
+        self.L = L
+        self.b_L = dec.b[L]
+        self.operadores_L = [dec.operadores[i] for i in L]
+        A_L = dec.A_csr[L]
+        self.D = [A_L[:, colunas] for _, colunas in dec.estrutura.blocos]
+        self.mestre = dec.estrutura.colunas_mestre
+        self.D_mestre = A_L[:, self.mestre].toarray()
+        # Colunas λ do mestre: bloco, ponto proposto, custo c_k·x e coeficientes D_k·x
+        self.bloco_coluna, self.pontos, self.custos, self.coeficientes = [], [], [], []
+        self.rodadas = 0
+        self.iteracoes_mestre = 0
+        self.ultimos = None
+
+    def _adicionar(self, k, x):
+        # O mesmo ponto de novo não muda o mestre (evita laço por tolerância)
+        for j in np.flatnonzero(np.array(self.bloco_coluna) == k):
+            if np.allclose(self.pontos[j], x, rtol=0.0, atol=TOL_VIAVEL):
+                return False
+        colunas = self.dec.estrutura.blocos[k][1]
+        self.bloco_coluna.append(k)
+        self.pontos.append(np.asarray(x, dtype=float))
+        self.custos.append(float(self.dec.c[colunas] @ x))
+        self.coeficientes.append(self.D[k] @ x)
+        return True
+
+    def _artificiais(self):
+        """Colunas artificiais da Fase 1: uma por ligante, no sentido que reduz a violação"""
+        s = sentidos(self.operadores_L)
+        # "≤" recebe -1 e "≥" +1 (o oposto do sentido); "=" recebe as duas
+        linhas = np.concatenate([np.flatnonzero(s != 0), np.flatnonzero(s == 0), np.flatnonzero(s == 0)])
+        valores = np.concatenate([-s[s != 0].astype(float), np.ones((s == 0).sum()), -np.ones((s == 0).sum())])
+        colunas = np.zeros((len(self.L), len(linhas)))
+        colunas[linhas, np.arange(len(linhas))] = valores
+        return colunas
+
+    def _resolver_mestre(self, fase):
+        from ppl.motores import MOTORES
+
+        K = len(self.D)
+        nL = len(self.L)
+        k_col = np.array(self.bloco_coluna)
+        convexidade = (np.arange(K)[:, None] == k_col[None, :]).astype(float)
+        lambdas = np.vstack([np.column_stack(self.coeficientes), convexidade])
+        extras = np.vstack([self.D_mestre, np.zeros((K, len(self.mestre)))])
+        if fase == "Fase 1":
+            artificiais = self._artificiais()
+            artificiais = np.vstack([artificiais, np.zeros((K, artificiais.shape[1]))])
+            A_m = np.hstack([lambdas, extras, artificiais])
+            custos = np.concatenate([np.zeros(lambdas.shape[1] + extras.shape[1]), np.ones(artificiais.shape[1])])
+            maximizar = False
+        else:
+            A_m = np.hstack([lambdas, extras])
+            custos = np.concatenate([self.custos, self.dec.c[self.mestre]])
+            maximizar = self.dec.maximizar
+        b_m = np.concatenate([self.b_L, np.ones(K)])
+        operadores_m = self.operadores_L + ["="] * K
+        resultado = MOTORES[self.dec.nome](custos, A_m, b_m, operadores_m, maximizar)
+        self.iteracoes_mestre += resultado.iteracoes
+        return resultado, maximizar, nL
+
+    def _precificar(self, fase, pi, maximizar):
+        custos = []
+        for (_, colunas), D_k in zip(self.dec.estrutura.blocos, self.D):
+            base = np.zeros(len(colunas)) if fase == "Fase 1" else self.dec.c[colunas]
+            custos.append(base - D_k.T @ pi)
+        return self.executor.resolver(custos, maximizar)
+
+    def _registrar(self, fase, objetivo, limitante):
+        if self.controle is None:
+            return
+        gap = abs(limitante - objetivo) / max(1.0, abs(objetivo)) if limitante is not None else None
+        self.controle.registrar(self.executor.iteracoes + self.iteracoes_mestre,
+                                f"Dantzig–Wolfe: {fase}, rodada {self.rodadas}", objetivo, limitante, gap)
+
+    def executar(self):
+        """(status, x, y) ou None quando a decomposição não se aplica (ver ``observacao``)"""
+        dec = self.dec
+        self.observacao = None
+
+        # Propostas iniciais: o ótimo de cada bloco com o seu próprio custo (ou um
+        # vértice qualquer, se o bloco sozinho for ilimitado)
+        iniciais = self.executor.resolver([dec.c[colunas] for _, colunas in dec.estrutura.blocos], dec.maximizar)
+        if any(r.status == "Infeasible" for r in iniciais):
+            return "Infeasible", None, None
+        ilimitados = [k for k, r in enumerate(iniciais) if r.status == "Unbounded"]
+        if ilimitados:
+            refeitos = self.executor.resolver([np.zeros(len(colunas)) for _, colunas in dec.estrutura.blocos],
+                                              dec.maximizar)
+            for k in ilimitados:
+                iniciais[k] = refeitos[k]
+        if any(r.status != "Optimal" for r in iniciais):
+            return "Not Solved", None, None
+        for k, r in enumerate(iniciais):
+            self._adicionar(k, r.solucao)
+
+        atividade = sum(self.coeficientes)
+        s = sentidos(self.operadores_L)
+        folga = np.where(s == 0, -np.abs(atividade - self.b_L), s * (self.b_L - atividade))
+        viavel = bool((folga >= -TOL_VIAVEL * (1 + np.abs(self.b_L))).all())
+
+        for fase in (("Fase 2",) if viavel else ("Fase 1", "Fase 2")):
+            while True:
+                if self.rodadas >= MAX_RODADAS:
+                    self.observacao = f"sem convergência em {MAX_RODADAS} rodadas"
+                    return None
+                if self.controle is not None and self.controle.interromper():
+                    return "Not Solved", None, None
+                self.rodadas += 1
+
+                mestre, maximizar, nL = self._resolver_mestre(fase)
+                if mestre.status == "Unbounded" and fase == "Fase 2":
+                    return "Unbounded", None, None   # coluna só das ligantes que melhora sem limite
+                if mestre.status != "Optimal":
+                    self.observacao = f"mestre da {fase} terminou com status {mestre.status}"
+                    return None
+                pi, mu = mestre.precoSombra[:nL], mestre.precoSombra[nL:]
+                objetivo = mestre.valorOtimo
+                if fase == "Fase 1" and objetivo <= TOL_VIAVEL * (1 + np.abs(self.b_L).max(initial=0.0)):
+                    break
+
+                precificados = self._precificar(fase, pi, maximizar)
+                if any(r.status == "Unbounded" for r in precificados):
+                    self.observacao = "bloco ilimitado na precificação (exigiria raios extremos)"
+                    return None
+                if any(r.status != "Optimal" for r in precificados):
+                    return _pior_status(precificados), None, None
+                sentido = 1.0 if maximizar else -1.0
+                reduzidos = np.array([r.valorOtimo for r in precificados]) - mu
+                melhora = np.maximum(sentido * reduzidos, 0.0)
+                limitante = objetivo + sentido * melhora.sum()
+                self._registrar(fase, objetivo, limitante)
+
+                tolerancia = TOL_GAP * max(1.0, abs(objetivo))
+                novas = [self._adicionar(k, r.solucao) for k, r in enumerate(precificados) if melhora[k] > tolerancia]
+                if not any(novas):
+                    if fase == "Fase 1":
+                        return "Infeasible", None, None
+                    self.ultimos = precificados
+                    break
+
+        # Solução: combinação convexa das propostas de cada bloco + colunas do mestre
+        n, m = len(dec.c), len(dec.b)
+        lambdas = mestre.solucao[:len(self.pontos)]
+        x, y = np.zeros(n), np.zeros(m)
+        for k_col, ponto, lam in zip(self.bloco_coluna, self.pontos, lambdas):
+            x[dec.estrutura.blocos[k_col][1]] += lam * ponto
+        x[self.mestre] = mestre.solucao[len(self.pontos):len(self.pontos) + len(self.mestre)]
+        x[np.abs(x) < TOL] = 0.0
+        y[self.L] = pi
+        for (linhas, _), r in zip(dec.estrutura.blocos, self.ultimos):
+            y[linhas] = r.precoSombra
+        return "Optimal", x, y
+
+
+def resolver_decomposto(nome, c, A, b, operadores, maximizar, base_inicial=None, controle=None, processos=None):
+    """
+    Resolve o PPL pela estrutura em blocos de A, com o motor ``nome`` em cada
+    bloco (e no mestre do Dantzig–Wolfe). Sem estrutura aproveitável, vai
+    direto ao motor. ``base_inicial`` só é usada nesse caso (a base de um
+    problema decomposto não vale para o problema inteiro).
+    ``processos``: tamanho do pool (padrão: os.cpu_count()); 1 resolve no
+    próprio processo. O Resultado traz ``decomposicao`` (EstatisticasDecomposicao).
+    """
+    from ppl.motores import MOTORES, Resultado
+
+    processos = processos or os.cpu_count() or 1
+    inicio = time.perf_counter()
+    with medir(controle, "detecção de blocos"):
+        estrutura = detectar_estrutura(A)
+        if not len(estrutura.ligantes):
+            estrutura = estrutura._replace(blocos=agrupar(estrutura.blocos, BLOCOS_POR_PROCESSO * processos))
+    meio = time.perf_counter()
+
+    def estatisticas(rodadas=0, colunas=0, usados=1, observacao=None):
+        return EstatisticasDecomposicao(estrutura.tipo, len(estrutura.blocos), len(estrutura.ligantes), rodadas,
+                                        colunas, usados, meio - inicio, time.perf_counter() - meio, observacao)
+
+    if estrutura.tipo == "monolítico":
+        resultado = MOTORES[nome](c, A, b, operadores, maximizar, base_inicial=base_inicial, controle=controle)
+        return resultado._replace(decomposicao=estatisticas())
+
+    dec = _Decomposicao(nome, c, A, b, operadores, maximizar, estrutura, processos)
+    status = dec.checar_fora()
+    if status is not None:
+        return Resultado(status, motor=nome, decomposicao=estatisticas())
+
+    with medir(controle, "blocos"), \
+            _Executor(nome, dec.blocos, dec.processos, controle) as executor:
+        if estrutura.tipo == "bloco-diagonal":
+            resultado = dec.independentes(executor)
+            return resultado._replace(decomposicao=estatisticas(1, len(dec.blocos), dec.processos))
+
+        dw = _DantzigWolfe(dec, executor, controle)
+        saida = dw.executar()
+
+    if saida is None:
+        # Decomposição não se aplica: resolve o problema inteiro
+        resultado = MOTORES[nome](c, A, b, operadores, maximizar, controle=controle)
+        return resultado._replace(decomposicao=estatisticas(dw.rodadas, len(dw.pontos), dec.processos,
+                                                            dw.observacao + "; resolvido inteiro"))
+    status, x, y = saida
+    resultado = dec.resultado(status, x, y, executor.iteracoes + dw.iteracoes_mestre)
+    return resultado._replace(decomposicao=estatisticas(dw.rodadas, len(dw.pontos), dec.processos))
@@ -0,0 +1,181 @@
+"""
+Instrumentação das resoluções: tempo por fase, saldo de alocações, contadores
+e perfil opcional.
+
+Cada ``Controle`` (ver ppl.tarefas) carrega uma ``Medicao``. Os trechos quentes
+marcam as suas fases com ``medir(controle, "nome")``; sem controle, a marcação
+não custa nada além de uma comparação. As fases não se aninham: cada uma cobre
+um trecho distinto (validação, cache, pré-resolução, montagem, solver, duais,
+tableau, renderização...), de modo que a soma delas explica o tempo total.
+
+Para cada fase ficam o tempo (``time.perf_counter``), o número de chamadas e o
+saldo de blocos de memória alocados (``sys.getallocatedblocks``, do processo
+inteiro: é um indicador barato de alocação, não uma medida exata por thread).
+
+``emitir`` grava a medição como uma linha JSON no logger ``ppl.desempenho`` e,
+se a variável de ambiente ``SIMPLEX_LOG_DESEMPENHO`` apontar para um arquivo,
+acrescenta a linha a ele. ``perfilar`` executa uma função sob o pyinstrument
+(se instalado) ou o cProfile e devolve um relatório em texto. O pico de memória
+do relatório vem do tracemalloc, que é do processo inteiro: perfis simultâneos
+(tarefas em segundo plano, sessões do Streamlit) compartilham o rastreamento,
+contado por referência, e o pico de cada um passa a incluir as alocações dos
+outros; o relatório avisa quando isso acontece.
+"""
+
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+
+# json, logging e datetime só são importados ao emitir (fora do caminho de
+# importação dos motores, que tem orçamento: ver ferramentas/orcamento_importacao.py)
+
+LINHAS_PERFIL = 30
+
+_trava_arquivo = threading.Lock()
+_trava_perfil = threading.Lock()
+_perfis = {"ativos": 0, "inicios": 0, "ligou": False}   # tracemalloc compartilhado entre perfis
+_nada = nullcontext()
+
+
+class Medicao:
+    """Tempos, chamadas e saldo de blocos alocados por fase, mais contadores"""
+
+    def __init__(self):
+        self.fases = {}        # nome -> [segundos, blocos, chamadas], na ordem da primeira vez
+        self.contadores = {}
+        self.perfil = None     # relatório de ``perfilar``, se houve
+
+    def iniciar(self, nome):
+        """Abre a fase e devolve a função que a fecha (para trechos longos, sem ``with``)"""
+        blocos = sys.getallocatedblocks()
+        inicio = time.perf_counter()
+
+        def encerrar():
+            fase = self.fases.setdefault(nome, [0.0, 0, 0])
+            fase[0] += time.perf_counter() - inicio
+            fase[1] += sys.getallocatedblocks() - blocos
+            fase[2] += 1
+        return encerrar
+
+    @contextmanager
+    def fase(self, nome):
+        encerrar = self.iniciar(nome)
+        try:
+            yield
+        finally:
+            encerrar()
+
+    def contar(self, nome, quantidade=1):
+        self.contadores[nome] = self.contadores.get(nome, 0) + quantidade
+
+    def incorporar(self, outra):
+        """Soma as fases, contadores e o perfil de outra medição (ex.: a da tarefa)"""
+        for nome, (segundos, blocos, chamadas) in outra.fases.items():
+            fase = self.fases.setdefault(nome, [0.0, 0, 0])
+            fase[0] += segundos
+            fase[1] += blocos
+            fase[2] += chamadas
+        for nome, valor in outra.contadores.items():
+            self.contar(nome, valor)
+        if self.perfil is None:
+            self.perfil = outra.perfil
+
+    def total(self):
+        return sum(fase[0] for fase in self.fases.values())
+
+    def registro(self, **extras):
+        """Dicionário serializável em JSON com a medição e os campos extras"""
+        from datetime import datetime, timezone
+
+        return {
+            "momento": datetime.now(timezone.utc).isoformat(timespec="milliseconds"),
+            **extras,
+            "total_s": round(self.total(), 6),
+            "fases": {nome: {"segundos": round(segundos, 6), "blocos": blocos, "chamadas": chamadas}
+                      for nome, (segundos, blocos, chamadas) in self.fases.items()},
+            "contadores": dict(self.contadores),
+            "perfilado": self.perfil is not None,
+        }
+
+
+def medir(controle, nome):
+    """Contexto que cronometra a fase ``nome`` na medição do controle (se houver)"""
+    if controle is None or controle.medicao is None:
+        return _nada
+    return controle.medicao.fase(nome)
+
+
+def emitir(registro):
+    """Emite o registro como uma linha JSON (logger e, se configurado, arquivo)"""
+    import json
+    import logging
+
+    linha = json.dumps(registro, ensure_ascii=False, default=str)
+    logging.getLogger("ppl.desempenho").info(linha)
+    caminho = os.environ.get("SIMPLEX_LOG_DESEMPENHO")
+    if caminho:
+        with _trava_arquivo, open(caminho, "a", encoding="utf-8") as f:
+            f.write(linha + "\n")
+    return linha
+
+
+def perfilar(funcao):
+    """
+    Executa ``funcao()`` sob o pyinstrument (se instalado) ou o cProfile, na
+    thread atual, com o tracemalloc ligado para o pico de memória (do processo
+    inteiro: aproximado se outro perfil rodar ao mesmo tempo).
+    Devolve (valor, relatório em texto); exceções de ``funcao`` são repassadas.
+    """
+    import tracemalloc
+
+    with _trava_perfil:
+        if _perfis["ativos"] == 0:
+            # Só o primeiro perfil liga o rastreamento (se ninguém mais ligou) e zera o pico
+            _perfis["ligou"] = not tracemalloc.is_tracing()
+            if _perfis["ligou"]:
+                tracemalloc.start()
+            tracemalloc.reset_peak()
+        _perfis["ativos"] += 1
+        _perfis["inicios"] += 1
+        inicio, simultaneo = _perfis["inicios"], _perfis["ativos"] > 1
+    try:
+        try:
+            from pyinstrument import Profiler
+        except ImportError:
+            valor, texto = _perfilar_cprofile(funcao)
+        else:
+            perfilador = Profiler()
+            perfilador.start()
+            try:
+                valor = funcao()
+            finally:
+                perfilador.stop()
+            texto = "pyinstrument\n" + perfilador.output_text(unicode=True, color=False)
+        _, pico = tracemalloc.get_traced_memory()
+        simultaneo = simultaneo or _perfis["inicios"] != inicio
+    finally:
+        with _trava_perfil:
+            # O último perfil a terminar desliga o rastreamento que o primeiro ligou
+            _perfis["ativos"] -= 1
+            if _perfis["ativos"] == 0 and _perfis["ligou"]:
+                tracemalloc.stop()
+    aviso = " (aproximado: outro perfil rodou ao mesmo tempo)" if simultaneo else ""
+    return valor, f"Pico de memória rastreada: {pico / 1024 / 1024:.2f} MiB{aviso}\n{texto}"
+
+
+def _perfilar_cprofile(funcao):
+    import cProfile
+    import io
+    import pstats
+
+    perfilador = cProfile.Profile()
+    perfilador.enable()
+    try:
+        valor = funcao()
+    finally:
+        perfilador.disable()
+    saida = io.StringIO()
+    pstats.Stats(perfilador, stream=saida).sort_stats("cumulative").print_stats(LINHAS_PERFIL)
+    return valor, "cProfile (tempo acumulado)\n" + saida.getvalue().strip()
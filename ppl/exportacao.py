@@ -0,0 +1,201 @@
+"""
+Tabelas de resultados como arrays numéricos: filtros, paginação e exportação.
+
+Uma tabela é um dicionário (ordenado) nome da coluna → array 1-D, todos com o
+mesmo comprimento. Os valores ficam numéricos até o fim: quem exibe converte
+para DataFrame só a página visível (``pagina``) e formata na apresentação.
+
+As exportações percorrem a tabela em blocos de ``LINHAS_POR_BLOCO`` linhas e
+escrevem num arquivo temporário que fica em memória até ``LIMITE_MEMORIA``
+bytes e depois passa para o disco; nada é montado como um texto único. Com o
+pyarrow (opcional) instalado, o CSV sai pelo escritor do Arrow, bem mais rápido
+que o módulo csv, e o Parquet fica disponível, com um grupo de linhas por bloco.
+"""
+
+import csv
+import io
+import tempfile
+
+import numpy as np
+
+TOL = 1e-9
+LINHAS_POR_BLOCO = 50_000
+LIMITE_MEMORIA = 8 * 1024 * 1024
+MAX_TERMOS = 12          # termos mostrados por expressão na tabela do IIS
+FORMATOS = {"csv": "text/csv", "parquet": "application/vnd.apache.parquet"}
+
+
+def tabela_solucao(nomes, solucao, custos_reduzidos=None):
+    """Variáveis com o valor ótimo (e o custo reduzido, se houver)"""
+    tabela = {"Variável": np.asarray(nomes, dtype=object), "Valor": np.asarray(solucao, dtype=float)}
+    if custos_reduzidos is not None:
+        tabela["Custo Reduzido"] = np.asarray(custos_reduzidos, dtype=float)
+    return tabela
+
+
+def tabela_restricoes(restricoes, constantes, solucao, preco_sombra, nomes=None):
+    """
+    Restrições com atividade (a·x), lado direito, folga/excesso |b - a·x| e
+    preço-sombra. ``restricoes`` pode ser densa ou esparsa (SciPy).
+    """
+    b = np.asarray(constantes, dtype=float)
+    if hasattr(restricoes, "tocsr"):
+        atividade = restricoes @ np.asarray(solucao, dtype=float)
+    else:
+        atividade = np.asarray(restricoes, dtype=float).reshape(len(b), -1) @ np.asarray(solucao, dtype=float)
+    if nomes is None:
+        nomes = np.char.add("R", np.arange(1, len(b) + 1).astype(str)).astype(object)
+    return {
+        "Restrição": np.asarray(nomes, dtype=object),
+        "Atividade": atividade,
+        "LD (b)": b,
+        "Folga/Excesso": np.abs(b - atividade),
+        "Preço-Sombra": np.asarray(preco_sombra, dtype=float),
+    }
+
+
+def tabelas_sensibilidade(sensibilidade, constantes, funcObj, nomes_variaveis):
+    """
+    Análise de sensibilidade (ver ppl.sensibilidade) como duas tabelas,
+    (restrições, variáveis): folga e faixa de b, custo reduzido e faixa de c.
+    Limites ilimitados ficam ±inf.
+    """
+    b = np.asarray(constantes, dtype=float)
+    restricoes = {
+        "Restrição": np.char.add("R", np.arange(1, len(b) + 1).astype(str)).astype(object),
+        "Folga/Excesso": np.asarray(sensibilidade.folgas, dtype=float),
+        "b mínimo": np.asarray(sensibilidade.ladoDireitoMin, dtype=float),
+        "b atual": b,
+        "b máximo": np.asarray(sensibilidade.ladoDireitoMax, dtype=float),
+    }
+    variaveis = {
+        "Variável": np.asarray(nomes_variaveis, dtype=object),
+        "Custo Reduzido": np.asarray(sensibilidade.custosReduzidos, dtype=float),
+        "c mínimo": np.asarray(sensibilidade.custoMin, dtype=float),
+        "c atual": np.asarray(funcObj, dtype=float),
+        "c máximo": np.asarray(sensibilidade.custoMax, dtype=float),
+    }
+    return restricoes, variaveis
+
+
+def tabela_iis(linhas, restricoes, constantes, operadores, nomes_variaveis, nomes=None):
+    """
+    Restrições de um conflito mínimo (ver ppl.inviabilidade) escritas por
+    extenso: nome (Restricao_i, se não houver outro), expressão, sentido e LD.
+    """
+    linhas = np.asarray(linhas, dtype=int)
+    b = np.asarray(constantes, dtype=float)
+    if hasattr(restricoes, "tocsr"):
+        A = restricoes.tocsr()[linhas].toarray()
+    else:
+        A = np.asarray(restricoes, dtype=float).reshape(len(b), -1)[linhas]
+    expressoes = []
+    for linha in A:
+        colunas = np.flatnonzero(linha)
+        texto = ""
+        for j in colunas[:MAX_TERMOS]:
+            coef = linha[j]
+            sinal = ("- " if coef < 0 else "") if not texto else (" - " if coef < 0 else " + ")
+            texto += sinal + ("" if abs(coef) == 1 else f"{abs(coef):g}·") + str(nomes_variaveis[j])
+        if len(colunas) > MAX_TERMOS:
+            texto += f" … (+{len(colunas) - MAX_TERMOS} termos)"
+        expressoes.append(texto or "0")
+    return {
+        "Restrição": np.array([nomes[i] if nomes is not None else f"Restricao_{i + 1}" for i in linhas], dtype=object),
+        "Expressão": np.array(expressoes, dtype=object),
+        "Sentido": np.array([operadores[i] for i in linhas], dtype=object),
+        "LD (b)": b[linhas],
+    }
+
+
+def ativas(tabela):
+    """Máscara das restrições ativas (folga nula, na tolerância relativa ao lado direito)"""
+    return tabela["Folga/Excesso"] <= 1e-7 * (1.0 + np.abs(tabela["LD (b)"]))
+
+
+def nao_nulas(tabela, coluna="Valor"):
+    return np.abs(tabela[coluna]) > TOL
+
+
+def linhas(tabela):
+    return len(next(iter(tabela.values()))) if tabela else 0
+
+
+def filtrar(tabela, mascara):
+    """Só as linhas em que ``mascara`` é verdadeira"""
+    indices = np.flatnonzero(mascara)
+    return {nome: valores[indices] for nome, valores in tabela.items()}
+
+
+def pagina(tabela, inicio, tamanho):
+    """Fatia [inicio, inicio + tamanho) de cada coluna (visões, sem cópia)"""
+    return {nome: valores[inicio:inicio + tamanho] for nome, valores in tabela.items()}
+
+
+def _esquema(tabela):
+    import pyarrow as pa
+
+    return pa.schema([(nome, pa.string() if valores.dtype == object else pa.from_numpy_dtype(valores.dtype))
+                      for nome, valores in tabela.items()])
+
+
+def _blocos_arrow(tabela, esquema, linhas_por_bloco):
+    import pyarrow as pa
+
+    for inicio in range(0, max(linhas(tabela), 1), linhas_por_bloco):
+        bloco = pagina(tabela, inicio, linhas_por_bloco)
+        yield pa.table({nome: pa.array(valores, type=esquema.field(nome).type)
+                        for nome, valores in bloco.items()}, schema=esquema)
+
+
+def escrever_csv(tabela, destino, linhas_por_bloco=LINHAS_POR_BLOCO):
+    """Escreve a tabela em CSV (UTF-8) no arquivo binário ``destino``, bloco a bloco"""
+    try:
+        import pyarrow.csv as pa_csv
+    except ImportError:
+        pa_csv = None
+    if pa_csv is not None:
+        esquema = _esquema(tabela)
+        with pa_csv.CSVWriter(destino, esquema) as escritor:
+            for bloco in _blocos_arrow(tabela, esquema, linhas_por_bloco):
+                escritor.write_table(bloco)
+        return
+
+    texto = io.TextIOWrapper(destino, encoding="utf-8", newline="", write_through=True)
+    escritor = csv.writer(texto)
+    escritor.writerow(list(tabela))
+    for inicio in range(0, linhas(tabela), linhas_por_bloco):
+        bloco = pagina(tabela, inicio, linhas_por_bloco)
+        escritor.writerows(zip(*(valores.tolist() for valores in bloco.values())))
+    texto.detach()   # devolve o arquivo sem fechá-lo
+
+
+def escrever_parquet(tabela, destino, linhas_por_bloco=LINHAS_POR_BLOCO):
+    """Escreve a tabela em Parquet no arquivo binário ``destino``, um grupo de linhas por bloco"""
+    import pyarrow.parquet as pq
+
+    esquema = _esquema(tabela)
+    with pq.ParquetWriter(destino, esquema) as escritor:
+        for bloco in _blocos_arrow(tabela, esquema, linhas_por_bloco):
+            escritor.write_table(bloco)
+
+
+def parquet_disponivel():
+    try:
+        import pyarrow.parquet  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def exportar(tabela, formato):
+    """Arquivo temporário (posicionado no início) com a tabela em "csv" ou "parquet" """
+    destino = tempfile.SpooledTemporaryFile(max_size=LIMITE_MEMORIA)
+    if formato == "csv":
+        escrever_csv(tabela, destino)
+    elif formato == "parquet":
+        escrever_parquet(tabela, destino)
+    else:
+        raise ValueError(f"Formato desconhecido: {formato!r} (disponíveis: {', '.join(FORMATOS)})")
+    destino.seek(0)
+    return destino
@@ -0,0 +1,214 @@
+"""
+Geração preguiçosa de restrições (linhas) para modelos com muitas linhas "≤".
+
+Em formulações com centenas de milhares de restrições "≤", só algumas centenas
+costumam estar ativas no ótimo. Em vez de montar o modelo inteiro, o motor
+resolve um conjunto de trabalho W de linhas e acrescenta o resto sob demanda:
+
+1. W começa com todas as linhas "≥" e "=" e com as linhas "≤" que primeiro
+   barram a direção de melhora do objetivo a partir da origem (menor
+   bᵢ / aᵢ·d, d = parte positiva de ±c), mais a mais justa de cada variável
+   que melhora o objetivo, para que o modelo reduzido já nasça limitado.
+   Com ``base_inicial`` (base ótima de uma resolução anterior do problema
+   inteiro), W são as linhas cuja folga não é básica nela: as ativas de antes.
+2. Resolve-se o modelo só com W. Uma única varredura vetorizada (A x - b,
+   um produto matriz-vetor sobre todas as linhas) encontra as linhas "≤" de
+   fora de W violadas por x; as ``lote`` mais violadas (distância ao
+   hiperplano, |aᵢx - bᵢ| / ‖aᵢ‖) entram em W.
+3. As novas linhas entram no fim de W com a folga básica: a base anterior
+   continua uma base (dual viável) do modelo maior, e o motor reotimiza a
+   partir dela pelo simplex dual, em poucos pivôs. Motores sem base (highs,
+   pulp) resolvem cada rodada do zero, mas sobre o modelo reduzido.
+4. Sem violações, x é ótimo para o problema inteiro: as linhas fora de W têm
+   preço-sombra zero e folga básica, e a base volta completa (no espaço do
+   problema inteiro), servindo para a análise de sensibilidade e para a
+   próxima partida a quente.
+
+W só cresce, então o laço termina (no pior caso com todas as linhas). Um
+modelo reduzido ilimitado faz W crescer pela ordem do passo 1 (dobrando de
+tamanho a cada rodada) até deixar de sê-lo ou conter todas as linhas; um
+inviável prova a inviabilidade do problema inteiro, e o raio de Farkas volta
+nas posições originais. O tableau do modelo reduzido não é o do problema
+inteiro e não é devolvido.
+"""
+
+import time
+from typing import NamedTuple
+
+import numpy as np
+
+from ppl.desempenho import medir
+from ppl.problema import sentidos
+
+TOL = 1e-9
+TOL_VIOLACAO = 1e-7         # violação relativa a 1 + |bᵢ| considerada zero
+LOTE_MINIMO = 50            # lote padrão: max(LOTE_MINIMO, n) linhas por rodada
+BLOCO_LINHAS = 8192         # linhas por bloco ao procurar a mais justa de cada coluna (A densa)
+
+
+class EstatisticasGeracao(NamedTuple):
+    """Tamanho do conjunto de trabalho e custo da geração de linhas"""
+    linhas: int                   # restrições do problema inteiro
+    iniciais: int                 # linhas no conjunto de trabalho inicial
+    ativas: int                   # linhas no conjunto de trabalho final
+    rodadas: int                  # resoluções do modelo reduzido
+    lote: int                     # máximo de linhas acrescentadas por rodada
+    quentes: int                  # rodadas que partiram da base da anterior
+    segundos_varredura: float     # escolha do conjunto inicial e varreduras de violação
+    segundos_resolucao: float
+
+
+def _mais_justas(A, b, menores, d):
+    """Para cada coluna com dⱼ > 0, a linha "≤" de menor bᵢ / aᵢⱼ (aᵢⱼ > 0)"""
+    colunas = np.flatnonzero(d > 0)
+    if not len(colunas) or not len(menores):
+        return np.zeros(0, dtype=int)
+    if hasattr(A, "tocsr"):
+        sub = A[menores][:, colunas].tocoo()
+        ok = sub.data > TOL
+        linhas, cols = sub.row[ok], sub.col[ok]
+        razao = b[menores][linhas] / sub.data[ok]
+        ordem = np.lexsort((razao, cols))
+        primeira = np.r_[True, np.diff(cols[ordem]) != 0] if len(ordem) else np.zeros(0, dtype=bool)
+        return menores[linhas[ordem][primeira]]
+
+    melhor = np.full(len(colunas), np.inf)
+    linha = np.full(len(colunas), -1)
+    for inicio in range(0, len(menores), BLOCO_LINHAS):
+        indices = menores[inicio:inicio + BLOCO_LINHAS]
+        bloco = A[np.ix_(indices, colunas)]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            razao = np.where(bloco > TOL, b[indices, None] / bloco, np.inf)
+        k = razao.argmin(axis=0)
+        valor = razao[k, np.arange(len(colunas))]
+        troca = valor < melhor
+        melhor[troca], linha[troca] = valor[troca], indices[k[troca]]
+    return linha[linha >= 0]
+
+
+def _ordem_inicial(A, b, c, menores, maximizar):
+    """Linhas "≤" na ordem em que barram a direção de melhora d a partir da origem"""
+    d = np.maximum(c if maximizar else -c, 0.0)
+    ad = (A @ d)[menores]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        passo = np.where(ad > TOL, b[menores] / ad, np.inf)
+    return menores[np.argsort(passo, kind="stable")], d
+
+
+def _normas(A):
+    """‖aᵢ‖ de cada linha (1 nas linhas nulas)"""
+    if hasattr(A, "tocsr"):
+        normas = np.sqrt(np.asarray(A.multiply(A).sum(axis=1)).ravel())
+    else:
+        normas = np.sqrt(np.einsum("ij,ij->i", A, A))
+    return np.where(normas > 0, normas, 1.0)
+
+
+def _base_reduzida(base, W, n, m):
+    """Base do problema inteiro levada a [x | s_W]; None se alguma linha fora de W não tiver folga básica"""
+    posicao = np.full(m, -1)
+    posicao[W] = np.arange(len(W))
+    base = np.asarray(base, dtype=int)
+    folgas = base[(base >= n) & (base < n + m)] - n
+    local = np.concatenate([base[base < n], n + posicao[folgas[posicao[folgas] >= 0]]])
+    return local if len(local) == len(W) else None
+
+
+def _base_completa(base, W, n, m):
+    """Base de [x | s_W | a_W] levada ao problema inteiro (linhas fora de W com a folga básica)"""
+    mW = len(W)
+    base = np.asarray(base, dtype=int)
+    completa = np.where(base < n, base, np.where(base < n + mW, n + W[np.clip(base - n, 0, mW - 1)],
+                                                  n + m + W[np.clip(base - n - mW, 0, mW - 1)]))
+    fora = np.ones(m, dtype=bool)
+    fora[W] = False
+    return np.concatenate([completa, n + np.flatnonzero(fora)])
+
+
+def resolver_por_linhas(motor, c, A, b, operadores, maximizar, base_inicial=None, controle=None, lote=None):
+    """
+    Resolve o PPL por geração de linhas (ver o docstring do módulo): ``motor``
+    (uma função de ppl.motores.MOTORES, ou composta com a decomposição) resolve
+    cada modelo reduzido. ``lote``: máximo de linhas acrescentadas por rodada
+    (padrão max(LOTE_MINIMO, n)). O Resultado traz ``geracao`` (EstatisticasGeracao).
+    """
+    from ppl.motores import Resultado
+
+    inicio = time.perf_counter()
+    m, n = A.shape
+    sinais = sentidos(operadores)
+    operadores = np.asarray(operadores, dtype=object)
+    lote = lote or max(LOTE_MINIMO, n)
+    segundos_varredura = 0.0
+
+    with medir(controle, "varredura de linhas"):
+        menores = np.flatnonzero(sinais == 1)
+        fixas = np.flatnonzero(sinais != 1)
+        normas = _normas(A)
+        tolerancia = TOL_VIOLACAO * (1.0 + np.abs(b))
+        base = None
+        if base_inicial is not None:
+            # Linhas ativas na base anterior: folga fora da base
+            base_inicial = np.asarray(base_inicial, dtype=int)
+            basica = np.zeros(m, dtype=bool)
+            folgas = base_inicial[(base_inicial >= n) & (base_inicial < n + m)] - n
+            basica[folgas] = True
+            W = np.union1d(fixas, np.flatnonzero(~basica))
+            base = _base_reduzida(base_inicial, W, n, m)
+        ordem, d = _ordem_inicial(A, b, c, menores, maximizar)
+        if base is None:
+            W = np.union1d(np.union1d(fixas, ordem[:lote]), _mais_justas(A, b, menores, d))
+        em_w = np.zeros(m, dtype=bool)
+        em_w[W] = True
+    segundos_varredura += time.perf_counter() - inicio
+    iniciais, rodadas, quentes, iteracoes = len(W), 0, 0, 0
+
+    def estatisticas():
+        return EstatisticasGeracao(m, iniciais, len(W), rodadas, lote, quentes, segundos_varredura,
+                                   time.perf_counter() - inicio - segundos_varredura)
+
+    while True:
+        if controle is not None and controle.interromper():
+            return Resultado("Not Solved", iteracoes=iteracoes, geracao=estatisticas())
+        if controle is not None:
+            controle.registrar(iteracoes, f"Geração de linhas: rodada {rodadas + 1} com {len(W):,} de {m:,} linhas")
+        reduzido = motor(c, A[W], b[W], operadores[W].tolist(), maximizar, base_inicial=base, controle=controle)
+        rodadas += 1
+        quentes += base is not None
+        iteracoes += reduzido.iteracoes
+
+        if reduzido.status == "Unbounded" and not em_w[menores].all():
+            # Faltam linhas para limitar o modelo: W dobra, na ordem do conjunto inicial
+            novas = ordem[~em_w[ordem]][:max(lote, len(W))]
+            base = None
+        elif reduzido.status != "Optimal":
+            farkas = None
+            if reduzido.farkas is not None:
+                farkas = np.zeros(m)
+                farkas[W] = reduzido.farkas
+            return reduzido._replace(solucao=None, tableau=None, base=None, historico=None, farkas=farkas,
+                                     iteracoes=iteracoes, geracao=estatisticas())
+        else:
+            marco = time.perf_counter()
+            with medir(controle, "varredura de linhas"):
+                violacao = A @ reduzido.solucao - b
+                violadas = np.flatnonzero((violacao > tolerancia) & ~em_w)
+                if len(violadas) > lote:
+                    distancia = violacao[violadas] / normas[violadas]
+                    violadas = violadas[np.argpartition(-distancia, lote - 1)[:lote]]
+            segundos_varredura += time.perf_counter() - marco
+            if not len(violadas):
+                break
+            novas = np.sort(violadas)
+            # Novas linhas no fim de W, com a folga básica: a base anterior segue válida
+            base = None if reduzido.base is None else np.concatenate([
+                np.where(reduzido.base < n + len(W), reduzido.base, reduzido.base + len(novas)),
+                n + len(W) + np.arange(len(novas))])
+        em_w[novas] = True
+        W = np.concatenate([W, novas])
+
+    precoSombra = np.zeros(m)
+    precoSombra[W] = reduzido.precoSombra
+    base = None if reduzido.base is None else _base_completa(reduzido.base, W, n, m)
+    return reduzido._replace(precoSombra=precoSombra, base=base, tableau=None, historico=None, iteracoes=iteracoes,
+                             geracao=estatisticas())
@@ -0,0 +1,201 @@
+"""
+Histórico compacto dos pivôs do Simplex Revisado, para rever o método passo a passo.
+
+Guardar o tableau inteiro, (m+1)×(n+m+1), a cada iteração não cabe em
+resoluções longas. Cada pivô é registrado só com a linha, a variável que entra,
+a que sai, a fase e o vetor eta d = B⁻¹a_q, em arrays pré-alocados com
+capacidade limitada por ``MEMORIA_HISTORICO`` (pivôs além dela são contados em
+``descartados``, mas não guardados).
+
+Qualquer tableau intermediário é reconstruído sob demanda: a base após k pivôs
+sai dos índices registrados e, a partir do último tableau reconstruído, cada
+eta leva ao seguinte (ou, invertido, ao anterior) em O(m·(n+m)). Saltos longos
+refatoram a base diretamente.
+
+O início da Fase 2 fica marcado (``inicio_fase2``): dali em diante, inclusive
+no tableau final quando a Fase 2 não pivota, a última linha é a Z, não a W.
+"""
+
+import copy
+from typing import NamedTuple, Optional
+
+import numpy as np
+from scipy.linalg import lu_factor, lu_solve
+
+TOL = 1e-9
+MEMORIA_HISTORICO = 32 * 1024 * 1024   # bytes para os vetores eta
+PASSOS_ETA = 32   # até quantos etas andar a partir do último tableau antes de refatorar
+
+
+class Passo(NamedTuple):
+    """Estado do método após k pivôs, no formato do tableau final"""
+    tableau: np.ndarray          # (m+1)×(n+m+1): B⁻¹[A | S] | B⁻¹b e linha Z (ou W, na Fase 1)
+    base: np.ndarray
+    fase: str
+    entrou: Optional[int]        # variável que entrou no pivô k (None no tableau inicial)
+    saiu: Optional[int]
+    linha_custo: str             # "W" (Fase 1, soma das artificiais) ou "Z"
+
+
+class HistoricoPivos:
+    """Pivôs de uma resolução (linha, entra, sai, fase e eta) e reconstrução dos tableaus"""
+
+    def __init__(self, M, b, base, n, objetivo, artificiais, capacidade):
+        m = len(b)
+        self.M = M                   # forma padrão [A | S | artificiais] usada pelo método
+        self.b = b
+        self.n = n
+        self.objetivo = objetivo     # custo no sentido original, com zeros nas folgas/artificiais
+        self.artificiais = artificiais
+        self.base_inicial = np.array(base, dtype=int)
+        capacidade = max(min(capacidade, MEMORIA_HISTORICO // (8 * max(m, 1))), 0)
+        self.linhas = np.empty(capacidade, dtype=np.int32)
+        self.entrando = np.empty(capacidade, dtype=np.int32)
+        self.saindo = np.empty(capacidade, dtype=np.int32)
+        self.fases = np.empty(capacidade, dtype=np.int8)
+        self.etas = np.empty((capacidade, m))
+        self.nomes_fases = []
+        self.total = 0
+        self.descartados = 0
+        self.inicio_fase2 = None     # pivôs feitos até o fim da Fase 1 (None sem Fase 1)
+        self._cursor = None          # (k, B_k⁻¹[M | b]) da última reconstrução
+
+    def __len__(self):
+        return self.total
+
+    def __getstate__(self):
+        estado = self.__dict__.copy()
+        estado["_cursor"] = None
+        return estado
+
+    def __setstate__(self, estado):
+        estado.setdefault("inicio_fase2", None)   # históricos gravados antes da marca
+        self.__dict__.update(estado)
+
+    @property
+    def nbytes(self):
+        return sum(v.nbytes for v in (self.M, self.b, self.objetivo, self.artificiais, self.base_inicial,
+                                      self.linhas, self.entrando, self.saindo, self.fases, self.etas))
+
+    def registrar(self, r, q, sai, d, fase):
+        """Registra o pivô na linha r (entra q, sai ``sai``) com a coluna d = B⁻¹a_q"""
+        k = self.total
+        if k >= len(self.linhas):
+            self.descartados += 1
+            return
+        if fase not in self.nomes_fases:
+            self.nomes_fases.append(fase)
+        self.linhas[k], self.entrando[k], self.saindo[k] = r, q, sai
+        self.fases[k] = self.nomes_fases.index(fase)
+        self.etas[k] = d
+        self.total = k + 1
+
+    def marcar_fase2(self):
+        """Marca o fim da Fase 1: os passos a partir daqui usam a linha Z"""
+        self.inicio_fase2 = self.total
+
+    def compactar(self):
+        """Libera a capacidade não usada (ao fim da resolução)"""
+        k = self.total
+        self.linhas, self.entrando, self.saindo = self.linhas[:k].copy(), self.entrando[:k].copy(), self.saindo[:k].copy()
+        self.fases, self.etas = self.fases[:k].copy(), self.etas[:k].copy()
+        return self
+
+    def permutar(self, ordem):
+        """Cópia com as restrições reordenadas (a nova linha i é a linha ordem[i]), como no cache"""
+        m = len(ordem)
+        inversa = np.empty(m, dtype=int)
+        inversa[ordem] = np.arange(m)
+        # Posições da base e etas não mudam; só os índices de folgas e artificiais
+        mapa = np.concatenate([np.arange(self.n), self.n + inversa, self.n + m + inversa])
+        novo = copy.copy(self)
+        novo.M = np.empty_like(self.M)
+        novo.M[:, mapa] = self.M[ordem]
+        novo.b = self.b[ordem]
+        novo.artificiais = np.empty_like(self.artificiais)
+        novo.artificiais[mapa] = self.artificiais
+        novo.base_inicial = mapa[self.base_inicial]
+        novo.entrando, novo.saindo = mapa[self.entrando].astype(np.int32), mapa[self.saindo].astype(np.int32)
+        novo._cursor = None
+        return novo
+
+    def desescalar(self, R):
+        """
+        Cópia para o problema antes da escala de linhas (restrição i multiplicada
+        por R[i], como na pré-resolução). Folgas e artificiais acompanham a linha:
+        M_escalada = R·M·D, com D = 1 nas colunas de x e 1/Rᵢ nas de folga e
+        artificial da linha i; logo B⁻¹ muda para D_B·B⁻¹·R⁻¹ e cada eta d = B⁻¹a_q
+        vira D_B·d / D_q, com a base de antes do pivô.
+        """
+        R = np.asarray(R, dtype=float)
+        D = np.concatenate([np.ones(self.n), 1.0 / R, 1.0 / R])
+        novo = copy.copy(self)
+        novo.M = self.M / R[:, None] / D
+        novo.b = self.b / R
+        novo.etas = self.etas.copy()
+        base = self.base_inicial.copy()
+        for k in range(self.total):
+            novo.etas[k] = D[base] * self.etas[k] / D[self.entrando[k]]
+            base[self.linhas[k]] = self.entrando[k]
+        novo._cursor = None
+        return novo
+
+    def base(self, k):
+        """Base após os k primeiros pivôs"""
+        base = self.base_inicial.copy()
+        for j in range(k):
+            base[self.linhas[j]] = self.entrando[j]
+        return base
+
+    def _corpo(self, k):
+        """B_k⁻¹[M | b], andando pelos etas a partir da última reconstrução quando ela está perto"""
+        cursor = self._cursor
+        if cursor is not None and abs(cursor[0] - k) <= PASSOS_ETA:
+            atual, T = cursor
+        else:
+            base = self.base(k)
+            T = lu_solve(lu_factor(self.M[:, base], check_finite=False),
+                         np.column_stack([self.M, self.b]), check_finite=False)
+            atual = k
+        # Cada passo cria um array novo: o tableau do cursor nunca é alterado no lugar
+        while atual < k:
+            r, d = self.linhas[atual], self.etas[atual]
+            linha = T[r] / d[r]
+            T = T - np.outer(d, linha)
+            T[r] = linha
+            atual += 1
+        while atual > k:
+            atual -= 1
+            r, d = self.linhas[atual], self.etas[atual]
+            linha = T[r].copy()
+            T = T + np.outer(d, linha)
+            T[r] = linha * d[r]
+        self._cursor = (k, T)
+        return T
+
+    def passo(self, k):
+        """Tableau, base e pivô após k pivôs (0 ≤ k ≤ len(self))"""
+        if not 0 <= k <= self.total:
+            raise IndexError(f"pivô {k} fora do histórico (0 a {self.total})")
+        m, n = len(self.b), self.n
+        T = self._corpo(k)
+        base = self.base(k)
+        # Fase do pivô k (Fase 2 a partir da marca); o tableau inicial usa o custo da fase do primeiro pivô
+        if self.inicio_fase2 is not None and k >= self.inicio_fase2:
+            fase = "Fase 2"
+        else:
+            fase = self.nomes_fases[self.fases[max(k - 1, 0)]] if self.total else "Inicial"
+
+        # Linha Z (zⱼ - cⱼ) com o custo da fase: soma das artificiais na Fase 1
+        linha_custo = "W" if fase == "Fase 1" else "Z"
+        custo = self.artificiais.astype(float) if linha_custo == "W" else self.objetivo
+        tableau = np.zeros((m + 1, n + m + 1))
+        tableau[:m, :n + m] = T[:, :n + m]
+        tableau[:m, -1] = T[:, -1]
+        tableau[-1, :n + m] = custo[base] @ T[:, :n + m] - custo[:n + m]
+        tableau[-1, -1] = custo[base] @ T[:, -1]
+        tableau[np.abs(tableau) < TOL] = 0.0
+
+        if k == 0:
+            return Passo(tableau, base, "Inicial", None, None, linha_custo)
+        return Passo(tableau, base, fase, int(self.entrando[k - 1]), int(self.saindo[k - 1]), linha_custo)
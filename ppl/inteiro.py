@@ -0,0 +1,396 @@
+"""
+Programação linear inteira mista (variáveis inteiras e binárias) por
+branch-and-bound.
+
+A relaxação linear de cada nó é resolvida por um dos motores de ppl.motores.
+Ramificar em x_j = v (fracionário) cria dois filhos, cada um com uma restrição
+a mais: x_j ≤ ⌊v⌋ ou x_j ≥ ⌈v⌉. Binárias são inteiras com x_j ≤ 1 já na raiz.
+
+- Partida a quente: o filho é o pai com uma linha nova, então a base ótima do
+  pai mais a folga dessa linha é uma base dual viável do filho. Com o motor
+  "revisado", o nó parte dela (simplex dual) em vez de resolver do zero.
+- Paralelismo: com ``processos > 1``, os nós abertos são resolvidos num pool
+  de processos; o subproblema (c, A, b) é enviado uma única vez a cada
+  processo, na criação do pool, e cada nó viaja só com as suas restrições de
+  ramificação e a base do pai.
+- Busca: mergulho em profundidade até a primeira solução inteira; depois,
+  sempre o nó de melhor limitante. Cada relaxação também é arredondada para
+  tentar uma solução inteira viável (heurística barata).
+- Parada: árvore esgotada, gap relativo entre incumbente e limitante ≤ ``gap``,
+  ou tempo/cancelamento do ``controle`` (ver ppl.tarefas), que também recebe
+  incumbente, limitante, gap e nós resolvidos a cada passo.
+
+Os preços-sombra e custos reduzidos devolvidos são os da relaxação linear com
+as variáveis inteiras fixadas nos valores da solução (como no CBC).
+"""
+
+import heapq
+import itertools
+import os
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from typing import NamedTuple, Optional
+
+import numpy as np
+
+from ppl.desempenho import medir
+
+TIPOS = ("Contínua", "Inteira", "Binária")
+GAP_PADRAO = 1e-4
+TOL_INTEIRO = 1e-6
+TOL_VIAVEL = 1e-7
+NOS_POR_PROCESSO = 2     # nós em andamento por processo do pool
+ESPERA_MAXIMA = 0.2      # s entre consultas ao controle enquanto espera os nós
+
+
+class EstatisticasMIP(NamedTuple):
+    """Andamento final do branch-and-bound"""
+    nos: int                   # relaxações resolvidas (inclui a raiz)
+    nos_abertos: int           # nós que ficaram sem explorar (parada antecipada)
+    incumbente: Optional[float]
+    limitante: Optional[float]
+    gap: Optional[float]
+    segundos: float
+    processos: int
+    iteracoes_raiz: int
+    iteracoes_lp: int          # soma das iterações de todas as relaxações
+    partidas_quentes: int      # nós que partiram da base do pai
+
+    @property
+    def nos_por_segundo(self):
+        return self.nos / self.segundos if self.segundos else float("inf")
+
+
+def gap_relativo(incumbente, limitante):
+    """|incumbente - limitante| / max(|incumbente|, 1); None sem incumbente"""
+    if incumbente is None or limitante is None:
+        return None
+    return abs(incumbente - limitante) / max(abs(incumbente), 1.0)
+
+
+class _Subproblema:
+    """Relaxação da raiz (com x ≤ 1 das binárias) e o motor que resolve os nós"""
+
+    def __init__(self, nome, c, A, b, operadores, maximizar, binarias):
+        self.nome = nome
+        self.c = c
+        self.maximizar = maximizar
+        self.n = len(c)
+        extras = np.flatnonzero(binarias)
+        self.A = self._empilhar(A, extras)
+        self.b = np.concatenate([b, np.ones(len(extras))])
+        self.operadores = list(operadores) + ["≤"] * len(extras)
+        self.m = len(self.b)
+
+    def _empilhar(self, A, colunas):
+        """A com uma linha e_j a mais para cada j em ``colunas``"""
+        if len(colunas) == 0:
+            return A
+        linhas = np.zeros((len(colunas), self.n))
+        linhas[np.arange(len(colunas)), colunas] = 1.0
+        if hasattr(A, "tocsr"):
+            from scipy.sparse import csr_matrix, vstack
+            return vstack([A, csr_matrix(linhas)]).tocsr()
+        return np.vstack([A, linhas])
+
+    def resolver(self, cortes, base=None, controle=None):
+        """
+        Relaxação do nó: a raiz mais as restrições ``cortes`` [(j, op, valor)].
+        ``base`` é a base ótima do pai (que tem todos os cortes menos o último).
+        """
+        from ppl.motores import MOTORES
+
+        A, b, operadores = self.A, self.b, self.operadores
+        if cortes:
+            js, ops, valores = zip(*cortes)
+            A = self._empilhar(A, np.array(js))
+            b = np.concatenate([b, valores])
+            operadores = operadores + list(ops)
+
+        base_inicial = None
+        if base is not None:
+            # Folga da linha nova entra na base; artificiais do pai impedem o reaproveitamento
+            m_pai = len(b) - 1
+            if len(base) == m_pai and (base < self.n + m_pai).all():
+                base_inicial = np.append(base, self.n + m_pai)
+
+        resultado = MOTORES[self.nome](self.c, A, b, operadores, self.maximizar,
+                                       base_inicial=base_inicial, controle=controle)
+        # Só o necessário volta ao processo principal (o tableau não viaja)
+        return resultado._replace(tableau=None, historico=None), base_inicial is not None
+
+
+_subproblema_trabalhador = None
+
+
+def _iniciar_trabalhador(subproblema):
+    global _subproblema_trabalhador
+    _subproblema_trabalhador = subproblema
+
+
+def _resolver_no_trabalhador(cortes, base):
+    return _subproblema_trabalhador.resolver(cortes, base)
+
+
+class _No(NamedTuple):
+    limite: float        # valor (minimização interna) da relaxação do pai
+    profundidade: int
+    cortes: tuple
+    base: Optional[np.ndarray]
+
+
+class _BranchAndBound:
+    """Estado da busca: nós abertos, incumbente e estatísticas"""
+
+    def __init__(self, subproblema, inteiras, gap, controle, processos):
+        self.sub = subproblema
+        self.inteiras = inteiras
+        self.gap = gap
+        self.controle = controle
+        self.processos = processos
+        self.sentido = -1.0 if subproblema.maximizar else 1.0
+        self.custo = self.sentido * subproblema.c
+        # Custos inteiros só em variáveis inteiras: todo valor inteiro viável é
+        # inteiro, e o limite de um nó pode ser arredondado para cima
+        custo_int = self.custo[inteiras]
+        self.objetivo_inteiro = (not self.custo[~inteiras].any()
+                                 and np.allclose(custo_int, np.round(custo_int), rtol=0.0, atol=1e-12))
+
+        self.abertos = []                 # heap de (chave, contador, nó)
+        self.contador = itertools.count()
+        self.em_andamento = {}            # futuro -> nó (no pool)
+        self.incumbente = None            # valor interno (minimização)
+        self.solucao = None
+        self.nos = 0
+        self.iteracoes_lp = 0
+        self.partidas_quentes = 0
+        self.incompleto = False           # algum nó não foi resolvido até o fim
+        self.inicio = time.monotonic()
+
+    # ---------- fila de nós ----------
+
+    def _chave(self, no):
+        # Sem incumbente, mergulha (mais fundo primeiro); depois, melhor limitante
+        if self.incumbente is None:
+            return (-no.profundidade, no.limite)
+        return (no.limite, -no.profundidade)
+
+    def _empurrar(self, no):
+        heapq.heappush(self.abertos, (self._chave(no), next(self.contador), no))
+
+    def _reordenar(self):
+        self.abertos = [(self._chave(no), k, no) for _, k, no in self.abertos]
+        heapq.heapify(self.abertos)
+
+    def _proximo(self):
+        """Próximo nó que ainda pode melhorar o incumbente (None se acabaram)"""
+        while self.abertos:
+            no = heapq.heappop(self.abertos)[2]
+            if not self._podar(no.limite):
+                return no
+        return None
+
+    # ---------- limitantes ----------
+
+    def _podar(self, limite):
+        if self.incumbente is None:
+            return False
+        return limite >= self.incumbente - TOL_VIAVEL * max(abs(self.incumbente), 1.0)
+
+    def limitante(self):
+        """Menor limite entre nós abertos e em andamento (o incumbente, se não houver)"""
+        if self.incumbente is not None:
+            # Com incumbente, o heap já está ordenado pelo limite
+            limites = [self.abertos[0][2].limite] if self.abertos else []
+        else:
+            limites = [no.limite for _, _, no in self.abertos]
+        limites += [no.limite for no in self.em_andamento.values()]
+        if self.incumbente is not None:
+            limites.append(self.incumbente)
+        return min(limites) if limites else None
+
+    def gap_atual(self):
+        return gap_relativo(self.incumbente, self.limitante())
+
+    def _externo(self, valor):
+        return None if valor is None else self.sentido * valor
+
+    def registrar(self):
+        if self.controle is not None:
+            self.controle.registrar(self.nos, "Branch-and-bound", self._externo(self.incumbente),
+                                    limitante=self._externo(self.limitante()), gap=self.gap_atual())
+
+    def parar(self):
+        if self.controle is not None and self.controle.interromper():
+            return True
+        gap = self.gap_atual()
+        return gap is not None and gap <= self.gap
+
+    # ---------- processamento de um nó resolvido ----------
+
+    def _novo_incumbente(self, x):
+        valor = float(self.custo @ x)
+        if self.incumbente is None or valor < self.incumbente - TOL_VIAVEL * max(abs(valor), 1.0):
+            primeira = self.incumbente is None
+            self.incumbente, self.solucao = valor, x
+            if primeira:
+                self._reordenar()
+
+    def _arredondar(self, x):
+        """Heurística: arredonda as inteiras e testa a viabilidade do ponto"""
+        x = x.copy()
+        x[self.inteiras] = np.round(x[self.inteiras])
+        if (x < 0).any():
+            return
+        ax = self.sub.A @ x
+        folga = TOL_VIAVEL * (1.0 + np.abs(self.sub.b))
+        ops = np.asarray(self.sub.operadores)
+        viavel = np.where(ops == "≤", ax <= self.sub.b + folga,
+                          np.where(ops == "≥", ax >= self.sub.b - folga, np.abs(ax - self.sub.b) <= folga))
+        if viavel.all():
+            self._novo_incumbente(x)
+
+    def processar(self, no, resposta):
+        resultado, quente = resposta
+        self.nos += 1
+        self.iteracoes_lp += resultado.iteracoes
+        self.partidas_quentes += quente
+        if resultado.status == "Infeasible":
+            return
+        if resultado.status != "Optimal":
+            self.incompleto = True
+            return
+
+        x = resultado.solucao
+        valor = float(self.custo @ x)
+        if self.objetivo_inteiro:
+            valor = float(np.ceil(valor - TOL_INTEIRO * max(abs(valor), 1.0)))
+        if self._podar(valor):
+            return
+        fracao = np.abs(x - np.round(x))
+        fracionarias = np.flatnonzero(self.inteiras & (fracao > TOL_INTEIRO))
+        if len(fracionarias) == 0:
+            x = x.copy()
+            x[self.inteiras] = np.round(x[self.inteiras])
+            self._novo_incumbente(x)
+            return
+        self._arredondar(x)
+
+        # Ramifica na variável mais fracionária (parte fracionária mais perto de 0,5)
+        j = int(fracionarias[np.argmax(fracao[fracionarias])])
+        base = resultado.base
+        for op, valor_corte in (("≤", np.floor(x[j])), ("≥", np.ceil(x[j]))):
+            self._empurrar(_No(valor, no.profundidade + 1, no.cortes + ((j, op, float(valor_corte)),), base))
+
+    # ---------- laço principal ----------
+
+    def executar(self):
+        """Explora a árvore (em série ou no pool) até esgotar ou parar"""
+        if self.processos <= 1:
+            while not self.parar():
+                no = self._proximo()
+                if no is None:
+                    break
+                self.processar(no, self.sub.resolver(no.cortes, no.base))
+                self.registrar()
+            return
+
+        pool = ProcessPoolExecutor(max_workers=self.processos, initializer=_iniciar_trabalhador,
+                                   initargs=(self.sub,))
+        try:
+            while not self.parar():
+                while len(self.em_andamento) < NOS_POR_PROCESSO * self.processos:
+                    no = self._proximo()
+                    if no is None:
+                        break
+                    self.em_andamento[pool.submit(_resolver_no_trabalhador, no.cortes, no.base)] = no
+                if not self.em_andamento:
+                    break
+                prontos, _ = wait(self.em_andamento, timeout=ESPERA_MAXIMA, return_when=FIRST_COMPLETED)
+                for futuro in prontos:
+                    self.processar(self.em_andamento.pop(futuro), futuro.result())
+                self.registrar()
+        finally:
+            # Nós ainda em andamento voltam à fila (contam como abertos ao parar)
+            for no in self.em_andamento.values():
+                self._empurrar(no)
+            self.em_andamento.clear()
+            pool.shutdown(wait=False, cancel_futures=True)
+
+    def estatisticas(self, iteracoes_raiz):
+        limitante = self.limitante()
+        abertos = sum(not self._podar(no.limite) for _, _, no in self.abertos)
+        return EstatisticasMIP(self.nos, abertos, self._externo(self.incumbente),
+                               self._externo(limitante), gap_relativo(self.incumbente, limitante),
+                               time.monotonic() - self.inicio, self.processos, iteracoes_raiz,
+                               self.iteracoes_lp, self.partidas_quentes)
+
+
+def _relaxacao_fixada(sub, inteiras, x):
+    """Relaxação com as inteiras fixadas em x: fornece preços-sombra e custos reduzidos"""
+    from ppl.motores import MOTORES
+
+    js = np.flatnonzero(inteiras)
+    A = sub._empilhar(sub.A, js)
+    b = np.concatenate([sub.b, x[js]])
+    operadores = sub.operadores + ["="] * len(js)
+    return MOTORES[sub.nome](sub.c, A, b, operadores, sub.maximizar)
+
+
+def resolver_inteiro(nome, c, A, b, operadores, maximizar, tipos, controle=None, gap=None, processos=None):
+    """
+    Resolve o PPL com as variáveis de ``tipos`` ("Contínua", "Inteira" ou
+    "Binária", uma por variável) por branch-and-bound sobre o motor ``nome``.
+
+    ``gap``: gap relativo em que a busca para (padrão GAP_PADRAO).
+    ``processos``: tamanho do pool de nós (padrão: os.cpu_count()); 1 resolve
+    tudo no próprio processo.
+    Devolve um Resultado com ``mip`` preenchido (ver EstatisticasMIP). Parado
+    por tempo ou cancelamento, o status é "Not Solved", com o incumbente (se houver).
+    """
+    from ppl.motores import Resultado
+
+    tipos = np.asarray(tipos)
+    if len(tipos) != len(c) or not np.isin(tipos, TIPOS).all():
+        raise ValueError(f"tipos deve ter um valor por variável, entre {', '.join(TIPOS)}")
+    inteiras = tipos != "Contínua"
+    gap = GAP_PADRAO if gap is None else gap
+    processos = processos or os.cpu_count() or 1
+
+    sub = _Subproblema(nome, c, A, b, operadores, maximizar, tipos == "Binária")
+    busca = _BranchAndBound(sub, inteiras, gap, controle, processos)
+
+    # Raiz no próprio processo, com o acompanhamento do motor
+    raiz, _ = sub.resolver((), None, controle)
+    if raiz.status != "Optimal":
+        # O ponto de uma relaxação interrompida não é inteiro: não serve de incumbente
+        return Resultado(raiz.status, iteracoes=raiz.iteracoes, motor=nome,
+                         mip=busca.estatisticas(raiz.iteracoes))
+    busca.processar(_No(-np.inf, 0, (), None), (raiz, False))
+    busca.registrar()
+    # Pool só vale a pena se a raiz não resolveu o problema
+    busca.processos = processos if busca.abertos else 1
+    with medir(controle, "branch-and-bound"):
+        busca.executar()
+    if controle is not None:
+        controle.medicao.contar("nos", busca.nos)
+
+    estatisticas = busca.estatisticas(raiz.iteracoes)
+    iteracoes = busca.iteracoes_lp
+    esgotada = not busca.abertos and not busca.incompleto
+    otimo = esgotada or (estatisticas.gap is not None and estatisticas.gap <= gap)
+
+    if busca.solucao is None:
+        status = "Infeasible" if esgotada else "Not Solved"
+        return Resultado(status, iteracoes=iteracoes, motor=nome, mip=estatisticas)
+    if not otimo:
+        return Resultado("Not Solved", busca.solucao, float(c @ busca.solucao), iteracoes=iteracoes,
+                         motor=nome, mip=estatisticas)
+
+    with medir(controle, "duais"):
+        fixada = _relaxacao_fixada(sub, inteiras, busca.solucao)
+    m = len(b)
+    precoSombra = fixada.precoSombra[:m] if fixada.status == "Optimal" else np.zeros(m)
+    custosReduzidos = fixada.custosReduzidos if fixada.status == "Optimal" else None
+    return Resultado("Optimal", busca.solucao, float(c @ busca.solucao), precoSombra,
+                     custosReduzidos=custosReduzidos, iteracoes=iteracoes, motor=nome, mip=estatisticas)
@@ -0,0 +1,170 @@
+"""
+Diagnóstico de inviabilidade: subsistema irredutível inviável (IIS).
+
+Um IIS é um conjunto de restrições que, junto com x ≥ 0, não tem solução, mas
+que passa a ter se qualquer uma delas sair. É o "conflito mínimo" a mostrar ao
+usuário no lugar de um simples "Infeasible".
+
+1. Semente (raio de Farkas): se a resolução já terminou na Fase 1 do Simplex
+   Revisado, os duais dela (``Resultado.farkas``) dão a semente de graça. Sem
+   eles, resolve-se o problema elástico de Fase 1
+
+       min Σ wᵢ·(pᵢ + qᵢ)   s.a.  Aᵢx + pᵢ − qᵢ (opᵢ) bᵢ,  x, p, q ≥ 0
+
+   (p só nas linhas ≥/=, q só nas ≤/=) mede a violação total. Com ótimo > 0, os
+   duais y formam um certificado de Farkas (Aᵀy ≤ 0, bᵀy > 0 no suporte), e as
+   linhas com yᵢ ≠ 0 já são um subsistema inviável, em geral pequeno.
+2. Filtro de remoção: só as linhas da semente e as colunas que aparecem nelas
+   seguem para um modelo elástico reduzido. Cada linha candidata sai (wᵢ = 0)
+   e o modelo é reotimizado; se continuar inviável, ela sai de vez e o suporte
+   dos novos duais descarta de uma só vez as demais que deixaram de ser
+   necessárias; se ficar viável, ela é essencial. Como a matriz não muda (só os
+   custos), cada re-resolução parte da base anterior, que continua primal
+   viável, e costuma levar poucos pivôs.
+
+``encontrar_iis`` devolve None quando o problema contínuo é viável (por
+exemplo, um PPL inteiro cuja inviabilidade vem só da integralidade).
+``diagnosticar`` anexa o IIS a um Resultado inviável (``resultado.iis``).
+"""
+
+import time
+from typing import NamedTuple
+
+import numpy as np
+
+from ppl.desempenho import medir
+from ppl.problema import Problema, sentidos
+
+TOL_DUAL = 1e-9          # |yᵢ| abaixo disto (relativo ao maior) não entra no suporte
+TOL_VIOLACAO = 1e-7      # violação total relativa a 1 + max|b| considerada zero
+
+
+class IIS(NamedTuple):
+    """Subsistema irredutível inviável e o custo para encontrá-lo"""
+    linhas: np.ndarray       # índices (base 0) das restrições do conflito
+    semente: int             # linhas no suporte do raio de Farkas inicial
+    resolucoes: int          # re-resoluções do filtro de remoção
+    iteracoes: int           # pivôs somados (semente + filtro)
+    segundos: float
+    minimo: bool             # False se interrompido antes de testar todas as linhas
+
+
+def _elastico(A, operadores):
+    """[A | E]: uma coluna de violação por sentido possível de cada linha; e a linha de cada coluna"""
+    m = A.shape[0]
+    s = sentidos(operadores)
+    abaixo = np.flatnonzero(s != 1)      # pᵢ: Aᵢx abaixo de bᵢ (linhas ≥ e =)
+    acima = np.flatnonzero(s != -1)      # qᵢ: Aᵢx acima de bᵢ (linhas ≤ e =)
+    linhas = np.concatenate([abaixo, acima])
+    E = np.zeros((m, len(linhas)))
+    E[abaixo, np.arange(len(abaixo))] = 1.0
+    E[acima, len(abaixo) + np.arange(len(acima))] = -1.0
+    if hasattr(A, "tocsr"):
+        from scipy.sparse import csr_matrix, hstack
+
+        return hstack([A, csr_matrix(E)]).tocsr(), linhas
+    return np.hstack([A, E]), linhas
+
+
+def _suporte(y):
+    y = np.abs(y)
+    return y > TOL_DUAL * max(y.max(initial=0.0), 1.0)
+
+
+def _semente_elastica(A, b, operadores, motor, tolerancia, controle):
+    """(pesos das linhas no raio de Farkas do problema elástico, pivôs); None se viável"""
+    from ppl.motores import MOTORES
+
+    with medir(controle, "semente do IIS"):
+        A_elastico, linha_da_coluna = _elastico(A, operadores)
+        custo = np.concatenate([np.zeros(A.shape[1]), np.ones(len(linha_da_coluna))])
+        semente = MOTORES[motor](custo, A_elastico, b, operadores, False)
+    if semente.status != "Optimal" or semente.valorOtimo <= tolerancia:
+        return None
+    return semente.precoSombra, semente.iteracoes
+
+
+def encontrar_iis(A, b, operadores, motor="highs", controle=None, raio=None):
+    """
+    IIS das restrições ``A x (operadores) b`` com x ≥ 0 (ver o docstring do
+    módulo). ``raio``: duais da Fase 1 que provaram a inviabilidade, se houver;
+    senão (ou se não servirem), ``motor`` resolve a semente elástica. O filtro
+    usa sempre o Simplex Revisado, pela partida a quente. ``controle`` permite
+    interromper, e então o conjunto devolvido é inviável mas pode não ser mínimo.
+    """
+    from ppl.revisado import resolver_revisado
+
+    inicio = time.perf_counter()
+    b = np.asarray(b, dtype=float)
+    operadores = list(operadores)
+    m, n = A.shape
+    tolerancia = TOL_VIOLACAO * (1.0 + np.abs(b).max(initial=0.0))
+
+    if raio is not None and len(raio) == m and _suporte(raio).any():
+        pesos, iteracoes = np.abs(raio), 0
+    else:
+        semente = _semente_elastica(A, b, operadores, motor, tolerancia, controle)
+        if semente is None:
+            return None
+        pesos, iteracoes = np.abs(semente[0]), semente[1]
+    linhas = np.flatnonzero(_suporte(pesos))
+
+    # ---------- Filtro de remoção no modelo elástico reduzido à semente ----------
+    A_semente = A[linhas]
+    A_semente = A_semente.toarray() if hasattr(A_semente, "toarray") else np.asarray(A_semente, dtype=float)
+    colunas = np.flatnonzero(np.abs(A_semente).sum(axis=0) > 0)
+    operadores_semente = [operadores[i] for i in linhas]
+    A_reduzido, linha_da_coluna = _elastico(A_semente[:, colunas], operadores_semente)
+    b_reduzido = b[linhas]
+
+    ativas = np.ones(len(linhas), dtype=bool)
+    essenciais = np.zeros(len(linhas), dtype=bool)
+    base, resolucoes, minimo = None, 0, True
+
+    def resolver_ativas():
+        custo = np.concatenate([np.zeros(len(colunas)), ativas[linha_da_coluna].astype(float)])
+        return resolver_revisado(custo, A_reduzido, b_reduzido, operadores_semente, False, base_inicial=base)
+
+    with medir(controle, "filtro do IIS"):
+        # A semente tem de ser inviável sozinha; um raio numérico ruim cai na semente elástica
+        resultado = resolver_ativas()
+        resolucoes, iteracoes = 1, iteracoes + resultado.iteracoes
+        if resultado.status != "Optimal" or resultado.valorOtimo <= tolerancia:
+            if raio is None:
+                return None
+            return encontrar_iis(A, b, operadores, motor=motor, controle=controle)
+        base = resultado.base
+        ativas &= _suporte(resultado.precoSombra)
+
+        # Linhas de menor peso no certificado primeiro: são as que mais costumam sobrar
+        for i in np.argsort(pesos[linhas], kind="stable"):
+            if not ativas[i]:
+                continue
+            if controle is not None and controle.interromper():
+                minimo = False
+                break
+            ativas[i] = False
+            resultado = resolver_ativas()
+            resolucoes += 1
+            iteracoes += resultado.iteracoes
+            if resultado.status != "Optimal":
+                # Não deveria ocorrer (o elástico é sempre viável e limitado): mantém a linha
+                ativas[i] = essenciais[i] = True
+                continue
+            base = resultado.base
+            if resultado.valorOtimo > tolerancia:
+                # Continua inviável sem a linha i: o suporte dos novos duais basta
+                ativas &= _suporte(resultado.precoSombra) | essenciais
+            else:
+                ativas[i] = essenciais[i] = True
+
+    return IIS(linhas[ativas], len(linhas), resolucoes, iteracoes, time.perf_counter() - inicio, minimo)
+
+
+def diagnosticar(resultado, restricoes, constantes, operadores, controle=None):
+    """O Resultado com ``iis`` preenchido se for inviável (restrições em lista, array ou esparsas)"""
+    if resultado.status != "Infeasible" or resultado.iis is not None:
+        return resultado
+    problema = Problema.criar(np.zeros(np.shape(restricoes)[1]), restricoes, constantes, operadores)
+    return resultado._replace(iis=encontrar_iis(problema.A, problema.b, problema.operadores, controle=controle,
+                                                raio=resultado.farkas))
@@ -0,0 +1,487 @@
+"""
+Leitura de modelos grandes a partir de arquivos MPS, CPLEX-LP ou CSV de triplas.
+
+Os arquivos são lidos linha a linha e os coeficientes não nulos vão para
+arrays tipados (``array``: 16 bytes por coeficiente, sem um objeto Python por
+valor); só no fim eles viram uma matriz esparsa CSR. Nenhuma expressão do PuLP
+é criada: o problema segue direto para os motores (ver ``ppl.motores``).
+
+Variáveis continuam não-negativas, como na calculadora: limites superiores,
+inferiores positivos e fixações viram restrições extras; variáveis livres ou
+com limite inferior negativo não são suportadas. Variáveis inteiras (marcadores
+INTORG/INTEND e limites BV/UI/LI do MPS, seções General e Binary do LP) vêm em
+``tipos`` como "Inteira" ou "Binária" (ver ppl.inteiro).
+
+Formato CSV de triplas (cabeçalho ``linha,coluna,valor``)::
+
+    linha,coluna,valor
+    obj,sentido,max
+    obj,x1,100
+    R1,x1,2
+    R1,op,<=
+    R1,rhs,40
+
+Uso pela linha de comando::
+
+    python -m ppl.leitura modelo.mps [--motor highs]
+"""
+
+import csv
+import io
+import os
+import re
+import time
+from array import array
+from contextlib import closing
+from typing import NamedTuple, Optional
+
+import numpy as np
+
+_OPERADORES = {"L": "≤", "G": "≥", "E": "=", "<=": "≤", "=<": "≤", "<": "≤",
+               ">=": "≥", "=>": "≥", ">": "≥", "=": "=", "≤": "≤", "≥": "≥"}
+
+
+class ProblemaEsparso(NamedTuple):
+    """PPL lido de arquivo, com a matriz de restrições em CSR"""
+    funcObj: np.ndarray
+    restricoes: object          # scipy.sparse.csr_matrix (m, n)
+    constantes: np.ndarray
+    operadores: list
+    tipo_otimizacao: str
+    nomes_variaveis: list
+    nomes_restricoes: list
+    tipos: Optional[list] = None   # "Contínua"/"Inteira"/"Binária" por variável; None se todas contínuas
+
+
+class EstatisticasLeitura(NamedTuple):
+    """Vazão da leitura"""
+    bytes: int
+    linhas: int
+    nao_nulos: int
+    segundos: float
+
+    @property
+    def mb_por_segundo(self):
+        return self.bytes / 1e6 / self.segundos if self.segundos else float("inf")
+
+    @property
+    def nao_nulos_por_segundo(self):
+        return self.nao_nulos / self.segundos if self.segundos else float("inf")
+
+
+class _Montador:
+    """Acumula linhas, colunas e coeficientes em arrays tipados"""
+
+    def __init__(self):
+        self.colunas = {}
+        self.linhas = {}
+        self.operadores = []
+        self.rhs = array("d")
+        self.obj = array("d")
+        self.ii = array("l")
+        self.jj = array("l")
+        self.vv = array("d")
+        self.maximizar = False
+        self.tipos = {}
+
+    def coluna(self, nome):
+        j = self.colunas.get(nome)
+        if j is None:
+            j = self.colunas[nome] = len(self.colunas)
+            self.obj.append(0.0)
+        return j
+
+    def linha(self, nome, operador):
+        if nome in self.linhas:
+            raise ValueError(f"Restrição duplicada: {nome}")
+        i = self.linhas[nome] = len(self.operadores)
+        self.operadores.append(operador)
+        self.rhs.append(0.0)
+        return i
+
+    def coeficiente(self, i, j, valor):
+        if valor != 0.0:
+            self.ii.append(i)
+            self.jj.append(j)
+            self.vv.append(valor)
+
+    def marcar(self, nome, tipo):
+        """Marca a variável como "Inteira" ou "Binária" (binária não é rebaixada)"""
+        j = self.coluna(nome)
+        if self.tipos.get(j) != "Binária":
+            self.tipos[j] = tipo
+
+    def limite(self, nome, tipo, valor):
+        """Converte um limite de variável em restrição (x ≥ 0 já é implícito)"""
+        j = self.coluna(nome)
+        operador = {"UP": "≤", "LO": "≥", "FX": "="}.get(tipo, tipo)
+        if operador not in ("≤", "≥", "="):
+            raise ValueError(f"Tipo de limite não suportado: {tipo} ({nome})")
+        if operador == "≥" and valor <= 0.0:
+            if valor < 0.0:
+                raise ValueError(f"Limite inferior negativo não suportado ({nome} ≥ {valor})")
+            return
+        if operador == "≤" and valor == float("inf"):
+            return
+        i = self.linha(f"limite_{nome}_{len(self.operadores)}", operador)
+        self.coeficiente(i, j, 1.0)
+        self.rhs[i] = valor
+
+    def montar(self):
+        from scipy.sparse import coo_matrix
+
+        m, n = len(self.operadores), len(self.colunas)
+        A = coo_matrix(
+            (np.frombuffer(self.vv, dtype=float),
+             (np.frombuffer(self.ii, dtype=np.int_), np.frombuffer(self.jj, dtype=np.int_))),
+            shape=(m, n),
+        ).tocsr()
+        A.sum_duplicates()
+        tipos = [self.tipos.get(j, "Contínua") for j in range(n)] if self.tipos else None
+        return ProblemaEsparso(
+            np.array(self.obj, dtype=float), A, np.array(self.rhs, dtype=float), self.operadores,
+            "Maximizar" if self.maximizar else "Minimizar", list(self.colunas), list(self.linhas), tipos,
+        )
+
+
+def _linhas_texto(origem):
+    """Itera as linhas de um caminho ou arquivo (texto ou binário)"""
+    if isinstance(origem, (str, os.PathLike)):
+        with open(origem, encoding="utf-8") as f:
+            yield from f
+    elif isinstance(origem.read(0), bytes):
+        texto = io.TextIOWrapper(origem, encoding="utf-8")
+        try:
+            # Sem "yield from": ele repassaria close() ao wrapper e fecharia o arquivo
+            for linha in texto:
+                yield linha
+        finally:
+            texto.detach()  # não fecha o arquivo de quem chamou
+    else:
+        yield from origem
+
+
+def _ler(origem, analisar):
+    """Executa o analisador linha a linha e mede a vazão"""
+    inicio = time.perf_counter()
+    contador = {"bytes": 0, "linhas": 0}
+
+    def linhas(fonte):
+        for linha in fonte:
+            contador["bytes"] += len(linha)
+            contador["linhas"] += 1
+            yield linha
+
+    montador = _Montador()
+    # closing: o analisador pode parar antes do fim (ENDATA/End) e o arquivo
+    # precisa ser liberado na hora, não quando o coletor de lixo passar
+    with closing(_linhas_texto(origem)) as fonte:
+        analisar(linhas(fonte), montador)
+    problema = montador.montar()
+    estat = EstatisticasLeitura(contador["bytes"], contador["linhas"], problema.restricoes.nnz,
+                                time.perf_counter() - inicio)
+    return problema, estat
+
+
+# ==================== MPS ====================
+
+def _analisar_mps(linhas, mt):
+    secao = None
+    objetivo = None
+    inteiras = False
+    for linha in linhas:
+        if not linha.strip() or linha.startswith("*"):
+            continue
+        campos = linha.split()
+        if not linha[0].isspace():
+            secao = campos[0].upper()
+            if secao == "OBJSENSE" and len(campos) > 1:
+                mt.maximizar = campos[1].upper().startswith("MAX")
+            elif secao == "ENDATA":
+                break
+            elif secao == "RANGES":
+                raise ValueError("Seção RANGES não suportada")
+            continue
+
+        if secao == "OBJSENSE":
+            mt.maximizar = campos[0].upper().startswith("MAX")
+        elif secao == "ROWS":
+            tipo, nome = campos[0].upper(), campos[1]
+            if tipo == "N":
+                objetivo = objetivo or nome
+            else:
+                mt.linha(nome, _OPERADORES[tipo])
+        elif secao == "COLUMNS":
+            if len(campos) > 2 and campos[1].strip("'").upper() == "MARKER":
+                inteiras = campos[2].strip("'").upper() == "INTORG"
+                continue
+            j = mt.coluna(campos[0])
+            if inteiras:
+                mt.marcar(campos[0], "Inteira")
+            for nome, valor in zip(campos[1::2], campos[2::2]):
+                if nome == objetivo:
+                    mt.obj[j] = float(valor)
+                elif nome in mt.linhas:
+                    mt.coeficiente(mt.linhas[nome], j, float(valor))
+        elif secao == "RHS":
+            pares = campos[1:] if len(campos) % 2 else campos
+            for nome, valor in zip(pares[0::2], pares[1::2]):
+                if nome in mt.linhas:
+                    mt.rhs[mt.linhas[nome]] = float(valor)
+        elif secao == "BOUNDS":
+            tipo = campos[0].upper()
+            # O nome do conjunto de limites é opcional no MPS livre
+            sem_valor = tipo in ("MI", "FR", "PL", "BV") and len(campos) == 3
+            nome_var = campos[2] if len(campos) > 3 or sem_valor else campos[1]
+            if tipo in ("MI", "FR"):
+                raise ValueError(f"Variáveis livres não suportadas ({nome_var})")
+            if tipo == "PL":
+                continue
+            if tipo == "BV":
+                mt.marcar(nome_var, "Binária")   # x ≤ 1 fica por conta do motor de PLI
+                continue
+            if tipo in ("UI", "LI"):
+                mt.marcar(nome_var, "Inteira")
+                tipo = "UP" if tipo == "UI" else "LO"
+            mt.limite(nome_var, tipo, float(campos[-1]))
+
+
+def ler_mps(origem):
+    """Lê um arquivo MPS (fixo ou livre). Devolve (ProblemaEsparso, EstatisticasLeitura)"""
+    return _ler(origem, _analisar_mps)
+
+
+# ==================== CPLEX-LP ====================
+
+_TOKEN = re.compile(
+    r"\s*(<=|>=|=<|=>|[<>=:+\-]|"
+    r"(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?|"
+    r"[A-Za-z_!\"#$%&()/,;?@'`{}|~][\w!\"#$%&()/,.;?@'`{}|~\[\]]*)"
+)
+_SECOES_LP = [
+    (re.compile(r"^(maximi[sz]e|maximum|max)\b", re.I), "max"),
+    (re.compile(r"^(minimi[sz]e|minimum|min)\b", re.I), "min"),
+    (re.compile(r"^(subject\s+to|such\s+that|s\.?t\.?)(?=\s|:|$)", re.I), "st"),
+    (re.compile(r"^bounds?\b", re.I), "bounds"),
+    (re.compile(r"^(generals?|integers?)\b", re.I), "Inteira"),
+    (re.compile(r"^(binary|binaries|bin)\b", re.I), "Binária"),
+    (re.compile(r"^(semi-continuous|semis)\b", re.I), "semicontinuas"),
+    (re.compile(r"^end\b", re.I), "end"),
+]
+
+
+def _tokens(texto):
+    pos = 0
+    texto = texto.split("\\", 1)[0]
+    while pos < len(texto):
+        if texto[pos:].strip() == "":
+            return
+        m = _TOKEN.match(texto, pos)
+        if not m:
+            raise ValueError(f"Token inválido perto de: {texto[pos:pos + 20]!r}")
+        yield m.group(1)
+        pos = m.end()
+
+
+def _eh_numero(token):
+    return token[0].isdigit() or token[0] == "."
+
+
+class _Expressao:
+    """Analisa "nome: ± coef var ± ... op rhs" token a token"""
+
+    def __init__(self):
+        self.reiniciar()
+
+    def reiniciar(self):
+        self.nome = None
+        self.termos = []
+        self.sinal = 1.0
+        self.coef = None
+        self.operador = None
+        self.anterior = None
+        self.rhs = 0.0
+
+    def alimentar(self, token):
+        """Devolve True quando a restrição termina (após o lado direito)"""
+        if token == ":" and self.anterior is not None and not self.termos and self.coef is None:
+            self.nome = self.anterior
+            self.anterior = None
+            return False
+        if self.anterior is not None:
+            self.termos.append((self.anterior, self.sinal * (1.0 if self.coef is None else self.coef)))
+            self.sinal, self.coef, self.anterior = 1.0, None, None
+        if token in ("+", "-"):
+            self.sinal *= -1.0 if token == "-" else 1.0
+        elif _eh_numero(token):
+            if self.operador is not None:
+                self.rhs = self.sinal * float(token)
+                return True
+            self.coef = float(token) if self.coef is None else self.coef * float(token)
+        elif token in _OPERADORES:
+            self.operador = _OPERADORES[token]
+            self.sinal = 1.0
+        elif token != ":":
+            self.anterior = token
+        return False
+
+    def finalizar(self):
+        if self.anterior is not None:
+            self.termos.append((self.anterior, self.sinal * (1.0 if self.coef is None else self.coef)))
+            self.anterior = None
+
+
+def _analisar_lp(linhas, mt):
+    secao = None
+    expr = _Expressao()
+    for linha in linhas:
+        texto = linha.strip()
+        if not texto or texto.startswith("\\"):
+            continue
+        for padrao, nome in _SECOES_LP:
+            m = padrao.match(texto)
+            if m:
+                if secao in ("max", "min"):
+                    expr.finalizar()
+                    for var, coef in expr.termos:
+                        mt.obj[mt.coluna(var)] += coef
+                    expr.reiniciar()
+                secao = nome
+                texto = texto[m.end():]
+                if nome in ("max", "min"):
+                    mt.maximizar = nome == "max"
+                if nome == "semicontinuas":
+                    raise ValueError("Variáveis semicontínuas não são suportadas")
+                break
+        if secao == "end":
+            break
+
+        if secao in ("max", "min"):
+            for token in _tokens(texto):
+                expr.alimentar(token)
+        elif secao == "st":
+            for token in _tokens(texto):
+                if expr.alimentar(token):
+                    nome = expr.nome or f"R{len(mt.operadores) + 1}"
+                    i = mt.linha(nome, expr.operador)
+                    for var, coef in expr.termos:
+                        mt.coeficiente(i, mt.coluna(var), coef)
+                    mt.rhs[i] = expr.rhs
+                    expr.reiniciar()
+        elif secao == "bounds" and texto.strip():
+            _limite_lp(list(_tokens(texto)), texto, mt)
+        elif secao in ("Inteira", "Binária"):
+            for nome_var in texto.split():
+                mt.marcar(nome_var, secao)
+
+
+def _limite_lp(tokens, texto, mt):
+    """Trata "x <= u", "x >= l", "l <= x <= u", "x = v" e rejeita "x free" """
+    if len(tokens) >= 2 and tokens[-1].lower() == "free":
+        raise ValueError(f"Variáveis livres não suportadas ({tokens[0]})")
+
+    def numero(pos):
+        sinal = -1.0 if tokens[pos] == "-" else 1.0
+        pos += tokens[pos] in "+-"
+        valor = tokens[pos]
+        return sinal * (float("inf") if valor.lower() in ("inf", "infinity") else float(valor)), pos + 1
+
+    if _eh_numero(tokens[0]) or tokens[0] in "+-" or tokens[0].lower() in ("inf", "infinity"):
+        inferior, pos = numero(0)
+        op, var = _OPERADORES[tokens[pos]], tokens[pos + 1]
+        if op == "≤":
+            mt.limite(var, "≥", inferior)
+        elif op == "≥":
+            mt.limite(var, "≤", inferior)
+        else:
+            mt.limite(var, "=", inferior)
+        pos += 2
+        if pos < len(tokens):
+            superior, _ = numero(pos + 1)
+            mt.limite(var, _OPERADORES[tokens[pos]], superior)
+    else:
+        valor, _ = numero(2)
+        mt.limite(tokens[0], _OPERADORES[tokens[1]], valor)
+
+
+def ler_lp(origem):
+    """Lê um arquivo no formato CPLEX-LP. Devolve (ProblemaEsparso, EstatisticasLeitura)"""
+    return _ler(origem, _analisar_lp)
+
+
+# ==================== CSV de triplas ====================
+
+def _analisar_csv(linhas, mt):
+    leitor = csv.reader(linhas)
+    cabecalho = [c.strip().lower() for c in next(leitor)]
+    if cabecalho[:3] != ["linha", "coluna", "valor"]:
+        raise ValueError("O CSV deve ter o cabeçalho linha,coluna,valor")
+    for registro in leitor:
+        if not registro:
+            continue
+        linha, coluna, valor = (campo.strip() for campo in registro[:3])
+        if linha.lower() == "obj":
+            if coluna.lower() == "sentido":
+                mt.maximizar = valor.lower().startswith("max")
+            else:
+                mt.obj[mt.coluna(coluna)] = float(valor)
+            continue
+        i = mt.linhas.get(linha)
+        if i is None:
+            i = mt.linha(linha, "≤")
+        if coluna.lower() == "rhs":
+            mt.rhs[i] = float(valor)
+        elif coluna.lower() == "op":
+            mt.operadores[i] = _OPERADORES[valor]
+        else:
+            mt.coeficiente(i, mt.coluna(coluna), float(valor))
+
+
+def ler_csv_triplas(origem):
+    """Lê um CSV de triplas (linha,coluna,valor). Devolve (ProblemaEsparso, EstatisticasLeitura)"""
+    return _ler(origem, _analisar_csv)
+
+
+LEITORES = {".mps": ler_mps, ".lp": ler_lp, ".csv": ler_csv_triplas}
+
+
+def ler_modelo(origem, formato=None):
+    """Escolhe o leitor pelo formato ("mps", "lp", "csv") ou pela extensão do arquivo"""
+    if formato is None:
+        nome = origem if isinstance(origem, (str, os.PathLike)) else getattr(origem, "name", "")
+        formato = os.path.splitext(str(nome))[1].lower()
+    leitor = LEITORES.get("." + formato.lower().lstrip("."))
+    if leitor is None:
+        raise ValueError(f"Formato de modelo não suportado: {formato!r} (use MPS, LP ou CSV)")
+    return leitor(origem)
+
+
+def main(argv=None):
+    import argparse
+
+    from ppl.motores import MOTORES, resolver
+
+    parser = argparse.ArgumentParser(description="Lê um modelo MPS/LP/CSV e resolve")
+    parser.add_argument("arquivo")
+    parser.add_argument("--motor", default="highs", choices=list(MOTORES))
+    args = parser.parse_args(argv)
+
+    problema, estat = ler_modelo(args.arquivo)
+    m, n = problema.restricoes.shape
+    print(f"Lido: {m} restrições × {n} variáveis, {estat.nao_nulos} não nulos")
+    print(f"Leitura: {estat.segundos:.3f} s ({estat.mb_por_segundo:.1f} MB/s, "
+          f"{estat.nao_nulos_por_segundo:,.0f} não nulos/s)")
+
+    inicio = time.perf_counter()
+    resultado = resolver(problema.funcObj, problema.restricoes, problema.constantes,
+                         problema.operadores, problema.tipo_otimizacao, motor=args.motor, tipos=problema.tipos)
+    print(f"Status: {resultado.status} ({time.perf_counter() - inicio:.3f} s, motor {args.motor})")
+    if resultado.status == "Optimal":
+        print(f"Z* = {resultado.valorOtimo:.6g}")
+        for j in np.flatnonzero(np.abs(resultado.solucao) > 1e-9)[:20]:
+            print(f"  {problema.nomes_variaveis[j]} = {resultado.solucao[j]:.6g}")
+    return 0 if resultado.status == "Optimal" else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
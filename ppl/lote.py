@@ -0,0 +1,97 @@
+"""
+Resolução em lote de vários cenários sobre a mesma estrutura de restrições.
+
+A matriz A e os operadores são fixos; cada cenário troca apenas o vetor de
+custos c (``funcObjs``) e/ou o lado direito b (``constantes``). Os cenários são
+divididos em blocos contíguos, cada bloco é resolvido em um processo do pool e,
+dentro do bloco, cada cenário parte da base ótima do cenário vizinho anterior.
+
+O retorno é um ``ResultadoLote`` com arrays empilhados (um cenário por linha),
+em vez de uma tupla Python por cenário.
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import NamedTuple
+
+import numpy as np
+
+CENARIOS_POR_BLOCO = 64
+
+
+class ResultadoLote(NamedTuple):
+    """Resultados de um lote; linhas com status diferente de Optimal ficam com NaN"""
+    status: np.ndarray          # (k,)
+    solucoes: np.ndarray        # (k, n)
+    valoresOtimos: np.ndarray   # (k,)
+    precosSombra: np.ndarray    # (k, m)
+    iteracoes: np.ndarray       # (k,)
+
+
+def _resolver_bloco(A, operadores, maximizar, C, B):
+    """Resolve um bloco de cenários em sequência, com partida a quente"""
+    from ppl.revisado import resolver_revisado
+
+    k, n = C.shape
+    m = A.shape[0]
+    status = np.empty(k, dtype=object)
+    solucoes = np.full((k, n), np.nan)
+    valores = np.full(k, np.nan)
+    precos = np.full((k, m), np.nan)
+    iteracoes = np.zeros(k, dtype=int)
+
+    base = None
+    for i in range(k):
+        resultado = resolver_revisado(C[i], A, B[i], operadores, maximizar, base_inicial=base)
+        status[i] = resultado.status
+        iteracoes[i] = resultado.iteracoes
+        if resultado.status == "Optimal":
+            solucoes[i] = resultado.solucao
+            valores[i] = resultado.valorOtimo
+            precos[i] = resultado.precoSombra
+            # Bases com artificial (linha redundante) não servem para partida a quente
+            base = resultado.base if (resultado.base < n + m).all() else None
+    return status, solucoes, valores, precos, iteracoes
+
+
+def resolver_lote(funcObjs, restricoes, constantes, operadores, tipo_otimizacao, processos=None):
+    """
+    Resolve k cenários do mesmo PPL.
+
+    - ``funcObjs``: array (k, n) com um vetor de custos por cenário, ou (n,)
+      para manter o mesmo objetivo em todos.
+    - ``constantes``: array (k, m) com um lado direito por cenário, ou (m,)
+      para manter o mesmo b em todos.
+    - ``processos``: tamanho do pool (padrão: os.cpu_count()); 1 resolve no
+      próprio processo.
+    """
+    A = np.asarray(restricoes, dtype=float)
+    m, n = A.shape
+    operadores = list(operadores)
+    maximizar = tipo_otimizacao == "Maximizar"
+
+    C = np.asarray(funcObjs, dtype=float).reshape(-1, n)
+    B = np.asarray(constantes, dtype=float).reshape(-1, m)
+    k = max(len(C), len(B))
+    if len(C) not in (1, k) or len(B) not in (1, k):
+        raise ValueError("funcObjs e constantes devem ter o mesmo número de cenários")
+    C = np.broadcast_to(C, (k, n))
+    B = np.broadcast_to(B, (k, m))
+    if k == 0:
+        return ResultadoLote(np.empty(0, dtype=str), np.empty((0, n)), np.empty(0), np.empty((0, m)),
+                             np.empty(0, dtype=int))
+
+    processos = processos or os.cpu_count() or 1
+    blocos = [slice(i, min(i + CENARIOS_POR_BLOCO, k)) for i in range(0, k, CENARIOS_POR_BLOCO)]
+
+    if processos == 1 or len(blocos) == 1:
+        partes = [_resolver_bloco(A, operadores, maximizar, C[s], B[s]) for s in blocos]
+    else:
+        with ProcessPoolExecutor(max_workers=min(processos, len(blocos))) as pool:
+            futuros = [pool.submit(_resolver_bloco, A, operadores, maximizar,
+                                   np.ascontiguousarray(C[s]), np.ascontiguousarray(B[s]))
+                       for s in blocos]
+            partes = [f.result() for f in futuros]
+
+    status, solucoes, valores, precos, iteracoes = (np.concatenate(campo) for campo in zip(*partes))
+    return ResultadoLote(status.astype(str), solucoes, valores, precos, iteracoes)
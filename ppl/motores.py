@@ -0,0 +1,325 @@
+"""
+Motores de resolução (backends) para Problemas de Programação Linear.
+
+Cada motor recebe o problema já em forma de arrays (c, A, b e a lista de
+operadores "≤", "≥" ou "=") e devolve um ``Resultado`` com a mesma informação
+que a interface exibe: status, solução, valor ótimo e preços-sombra.
+
+Motores disponíveis:
+- "revisado": Simplex Revisado próprio em NumPy (ver ppl.revisado). Devolve
+  também o tableau ótimo verdadeiro, a base e os custos reduzidos.
+- "highs": HiGHS em processo, via ``scipy.optimize.linprog(method="highs")``.
+  Não cria arquivos temporários nem subprocessos.
+- "pulp": PuLP com o CBC padrão (comportamento original da calculadora).
+- "barreira": pontos interiores primal-dual (Mehrotra) em NumPy, com crossover
+  para o Simplex Revisado (ver ppl.barreira); ``SIMPLEX_CROSSOVER=0`` desliga
+  o crossover (sem base nem tableau ótimo verdadeiro).
+- "auto": barreira em modelos grandes, Simplex Revisado nos pequenos
+  (ver ppl.barreira.escolher_metodo); a escolha fica em ``resultado.escolha``.
+
+O motor padrão pode ser escolhido pela variável de ambiente ``SIMPLEX_MOTOR``.
+Com variáveis inteiras ou binárias (``tipos``), o "pulp" passa a integralidade
+ao CBC e os demais resolvem as relaxações de um branch-and-bound (ver ppl.inteiro).
+Todos aceitam um ``controle`` (ver ppl.tarefas) com limite de tempo; só o
+"revisado" relata o progresso e pode ser interrompido no meio. Montagem,
+chamada ao solver e extração dos duais são cronometradas na medição do
+controle (ver ppl.desempenho).
+"""
+
+import os
+import time
+from typing import NamedTuple, Optional
+
+import numpy as np
+
+from ppl.desempenho import medir
+from ppl.problema import Problema, sentidos
+
+MOTOR_PADRAO = "revisado"
+
+
+class Resultado(NamedTuple):
+    """Resultado de uma resolução, independente do motor usado"""
+    status: str
+    solucao: Optional[np.ndarray] = None
+    valorOtimo: Optional[float] = None
+    precoSombra: Optional[np.ndarray] = None
+    tableau: Optional[np.ndarray] = None
+    base: Optional[np.ndarray] = None
+    custosReduzidos: Optional[np.ndarray] = None
+    iteracoes: int = 0
+    motor: str = ""
+    doCache: bool = False
+    presolve: Optional[tuple] = None   # ppl.presolve.EstatisticasPresolve, se houve pré-resolução
+    mip: Optional[tuple] = None        # ppl.inteiro.EstatisticasMIP, se houve branch-and-bound
+    historico: Optional[object] = None  # ppl.historico.HistoricoPivos (motor revisado)
+    decomposicao: Optional[tuple] = None  # ppl.decomposicao.EstatisticasDecomposicao, se decomposto
+    barreira: Optional[tuple] = None   # ppl.barreira.EstatisticasBarreira (motor barreira)
+    escolha: Optional[tuple] = None    # ppl.barreira.EscolhaMetodo (motor auto)
+    farkas: Optional[np.ndarray] = None  # raio de Farkas da Fase 1 (revisado, status "Infeasible")
+    iis: Optional[tuple] = None        # ppl.inviabilidade.IIS, se inviável (ver simplex())
+    geracao: Optional[tuple] = None    # ppl.geracao.EstatisticasGeracao, se resolvido por geração de linhas
+
+
+def _opcoes_tempo(controle, nome):
+    """Tempo restante do controle como opção de limite do solver externo"""
+    if controle is None:
+        return {}
+    controle.registrar(0, "Solver externo (sem acompanhamento)")
+    restante = controle.restante()
+    return {} if restante is None else {nome: max(restante, 0.01)}
+
+
+def _resolver_highs(c, A, b, operadores, maximizar, base_inicial=None, controle=None):
+    """Resolve com HiGHS em processo (scipy.optimize.linprog)"""
+    from scipy.optimize import linprog
+
+    sinais = sentidos(operadores)
+    menor = sinais == 1
+    maior = sinais == -1
+    igual = sinais == 0
+
+    # linprog só minimiza e só aceita A_ub x ≤ b_ub: "≥" vira "-A x ≤ -b"
+    with medir(controle, "montagem"):
+        custo = -c if maximizar else c
+        if hasattr(A, "tocsr"):
+            from scipy.sparse import vstack
+            A_ub = vstack([A[menor], -A[maior]]).tocsr()
+        else:
+            A_ub = np.vstack([A[menor], -A[maior]])
+        b_ub = np.concatenate([b[menor], -b[maior]])
+
+    with medir(controle, "solver"):
+        res = linprog(
+            custo,
+            A_ub=A_ub if len(b_ub) else None,
+            b_ub=b_ub if len(b_ub) else None,
+            A_eq=A[igual] if igual.any() else None,
+            b_eq=b[igual] if igual.any() else None,
+            bounds=(0, None),
+            method="highs",
+            options=_opcoes_tempo(controle, "time_limit"),
+        )
+
+    status = {0: "Optimal", 1: "Not Solved", 2: "Infeasible", 3: "Unbounded"}.get(res.status, "Undefined")
+    if status != "Optimal":
+        return Resultado(status, iteracoes=int(getattr(res, "nit", 0) or 0), motor="highs")
+
+    # Preço-sombra = dZ/db no sentido original do problema
+    with medir(controle, "duais"):
+        precoSombra = np.zeros(len(b))
+        if len(b_ub):
+            marg = res.ineqlin.marginals
+            n_menor = int(menor.sum())
+            precoSombra[menor] = marg[:n_menor]
+            precoSombra[maior] = -marg[n_menor:]
+        if igual.any():
+            precoSombra[igual] = res.eqlin.marginals
+        if maximizar:
+            precoSombra = -precoSombra
+
+    valorOtimo = float(c @ res.x)
+    return Resultado("Optimal", np.asarray(res.x), valorOtimo, precoSombra,
+                     iteracoes=int(res.nit), motor="highs")
+
+
+def _resolver_pulp(c, A, b, operadores, maximizar, base_inicial=None, controle=None, tipos=None, gap=None):
+    """
+    Resolve com PuLP + CBC (gera arquivos temporários e um subprocesso).
+    ``tipos`` marca variáveis inteiras/binárias e ``gap`` é o gap relativo do CBC.
+    """
+    from pulp import PULP_CBC_CMD, LpSolutionIntegerFeasible, LpSolutionOptimal, LpStatus, value
+
+    from ppl.construcao import montar_pulp
+
+    # Modelo montado em bloco a partir da matriz (ver ppl.construcao)
+    with medir(controle, "montagem"):
+        prob, vars = montar_pulp(c, A, b, operadores, maximizar, tipos)
+
+    opcoes = _opcoes_tempo(controle, "timeLimit")
+    if gap is not None:
+        opcoes["gapRel"] = gap
+    with medir(controle, "solver"):
+        prob.solve(PULP_CBC_CMD(**opcoes))
+
+    status = LpStatus[prob.status]
+    if status == "Optimal" and prob.sol_status != LpSolutionOptimal:
+        status = "Not Solved"   # parou no limite de tempo
+        if prob.sol_status == LpSolutionIntegerFeasible:
+            # PLI: devolve a melhor solução inteira encontrada até a parada
+            solucao = np.array([var.varValue or 0.0 for var in vars])
+            return Resultado(status, solucao, float(c @ solucao), motor="pulp")
+    if status != "Optimal":
+        return Resultado(status, motor="pulp")
+
+    # Variáveis sem coeficiente algum ficam fora do modelo e valem zero
+    with medir(controle, "duais"):
+        solucao = np.array([var.varValue or 0.0 for var in vars])
+        valorOtimo = value(prob.objective) or 0.0
+
+        # Preços-sombra (dual values das restrições)
+        precoSombra = []
+        for i in range(len(b)):
+            constraint = prob.constraints.get(f"Restricao_{i+1}")
+            if constraint and hasattr(constraint, 'pi') and constraint.pi is not None:
+                precoSombra.append(constraint.pi)
+            else:
+                precoSombra.append(0.0)
+
+    return Resultado("Optimal", solucao, valorOtimo, np.array(precoSombra), motor="pulp")
+
+
+def _resolver_revisado(c, A, b, operadores, maximizar, base_inicial=None, controle=None):
+    """Resolve com o Simplex Revisado em NumPy (sem processo externo)"""
+    from ppl.revisado import resolver_revisado
+
+    A = A.toarray() if hasattr(A, "toarray") else A
+    return resolver_revisado(c, A, b, operadores, maximizar, base_inicial=base_inicial, controle=controle)
+
+
+def _resolver_barreira(c, A, b, operadores, maximizar, base_inicial=None, controle=None):
+    """Pontos interiores (Mehrotra) e crossover para uma base ótima (ver ppl.barreira)"""
+    from ppl.barreira import resolver_barreira
+
+    crossover = os.environ.get("SIMPLEX_CROSSOVER", "1").strip() != "0"
+    return resolver_barreira(c, A, b, operadores, maximizar, base_inicial=base_inicial, controle=controle,
+                             crossover=crossover)
+
+
+def _resolver_auto(c, A, b, operadores, maximizar, base_inicial=None, controle=None):
+    """Barreira ou Simplex Revisado conforme tamanho e densidade de A"""
+    from ppl.barreira import EscolhaMetodo, escolher_metodo
+
+    m, n = A.shape
+    if base_inicial is not None:
+        # Com base para partida a quente, o simplex costuma terminar em poucos pivôs
+        escolha = EscolhaMetodo("revisado", "base anterior disponível para partida a quente", m * n,
+                                (A.nnz if hasattr(A, "nnz") else np.count_nonzero(A)) / max(m * n, 1))
+    else:
+        escolha = escolher_metodo(m, n, A.nnz if hasattr(A, "nnz") else np.count_nonzero(A))
+    resultado = MOTORES[escolha.metodo](c, A, b, operadores, maximizar, base_inicial=base_inicial, controle=controle)
+    return resultado._replace(escolha=escolha)
+
+
+MOTORES = {
+    "revisado": _resolver_revisado,
+    "highs": _resolver_highs,
+    "pulp": _resolver_pulp,
+    "barreira": _resolver_barreira,
+    "auto": _resolver_auto,
+}
+
+
+def motor_padrao():
+    """Motor escolhido pela variável de ambiente SIMPLEX_MOTOR (ou o padrão)"""
+    nome = os.environ.get("SIMPLEX_MOTOR", MOTOR_PADRAO).strip().lower()
+    return nome if nome in MOTORES else MOTOR_PADRAO
+
+
+def resolver(funcObj, restricoes, constantes, operadores, tipo_otimizacao, motor=None, base_inicial=None,
+             controle=None, presolve=False, tipos=None, gap=None, decompor=False, diagnosticar=False,
+             gerar_linhas=False):
+    """
+    Resolve o PPL com o motor indicado (ou o padrão) e devolve um Resultado.
+    Os dados podem ser listas ou arrays; são convertidos uma única vez para float.
+    ``restricoes`` também pode ser uma matriz esparsa do SciPy (usada como está
+    pelo motor "highs"; os demais a convertem para densa).
+    ``base_inicial`` permite partida a quente (motores sem suporte a ignoram).
+    ``controle`` impõe limite de tempo/cancelamento (ver ppl.tarefas).
+    ``presolve`` reduz e escala o problema antes do motor (ver ppl.presolve); a
+    resposta volta no espaço original, com as estatísticas em ``resultado.presolve``.
+    ``tipos``: "Contínua", "Inteira" ou "Binária" por variável. Com alguma
+    inteira, o problema é resolvido como PLI misto com gap relativo ``gap``
+    (ver ppl.inteiro); nesse caso ``base_inicial``, ``presolve``, ``decompor`` e
+    ``gerar_linhas`` são ignorados.
+    ``decompor`` aproveita a estrutura em blocos de A (ver ppl.decomposicao): blocos
+    independentes em paralelo, ou Dantzig–Wolfe se houver restrições ligantes;
+    as estatísticas ficam em ``resultado.decomposicao``.
+    ``gerar_linhas`` resolve só um conjunto de trabalho das restrições "≤" e
+    acrescenta as violadas em lotes (ver ppl.geracao); as estatísticas ficam em
+    ``resultado.geracao``.
+    ``diagnosticar``: se inviável, procura o conflito mínimo de restrições
+    (ver ppl.inviabilidade) e o devolve em ``resultado.iis``.
+    """
+    nome = motor or motor_padrao()
+    if nome not in MOTORES:
+        raise ValueError(f"Motor desconhecido: {nome!r} (disponíveis: {', '.join(MOTORES)})")
+
+    problema = Problema.criar(funcObj, restricoes, constantes, operadores, tipo_otimizacao)
+    c, A, b, maximizar = problema.c, problema.A, problema.b, problema.maximizar
+    operadores = problema.operadores
+    if tipos is not None and any(t != "Contínua" for t in tipos):
+        if nome == "pulp":
+            from ppl.inteiro import GAP_PADRAO
+            resultado = _resolver_pulp(c, A, b, operadores, maximizar, controle=controle,
+                                       tipos=list(tipos), gap=GAP_PADRAO if gap is None else gap)
+        else:
+            from ppl.inteiro import resolver_inteiro
+            resultado = resolver_inteiro(nome, c, A, b, operadores, maximizar, tipos,
+                                         controle=controle, gap=gap)
+    elif presolve:
+        resultado = _resolver_reduzido(nome, c, A, b, operadores, maximizar, base_inicial, controle,
+                                       decompor, gerar_linhas)
+    else:
+        resultado = _motor(nome, decompor, gerar_linhas)(c, A, b, operadores, maximizar,
+                                                          base_inicial=base_inicial, controle=controle)
+    if controle is not None:
+        controle.medicao.contar("iteracoes", resultado.iteracoes)
+    if diagnosticar:
+        from ppl.inviabilidade import diagnosticar as diagnosticar_inviavel
+        resultado = diagnosticar_inviavel(resultado, A, b, operadores, controle)
+    return resultado
+
+
+def _motor(nome, decompor=False, gerar_linhas=False):
+    """Motor ``nome``, por blocos (``decompor``) e/ou por geração de linhas, com a assinatura dos MOTORES"""
+    from functools import partial
+
+    motor = MOTORES[nome]
+    if decompor:
+        from ppl.decomposicao import resolver_decomposto
+        motor = partial(resolver_decomposto, nome)
+    if gerar_linhas:
+        from ppl.geracao import resolver_por_linhas
+        motor = partial(resolver_por_linhas, motor)
+    return motor
+
+
+def _resolver_reduzido(nome, c, A, b, operadores, maximizar, base_inicial, controle, decompor=False,
+                       gerar_linhas=False):
+    """Pré-resolução + motor (ou decomposição/geração de linhas) + pós-resolução, cronometrando cada parte"""
+    from ppl.presolve import Presolve
+
+    motor = _motor(nome, decompor, gerar_linhas)
+
+    inicio = time.perf_counter()
+    with medir(controle, "pré-resolução"):
+        reducao = Presolve(c, A, b, operadores, maximizar)
+    meio = time.perf_counter()
+
+    if reducao.status is not None:
+        resultado = Resultado(reducao.status, motor=nome)
+    elif reducao.identidade:
+        resultado = motor(c, A, b, operadores, maximizar, base_inicial=base_inicial, controle=controle)
+    elif len(reducao.c) == 0:
+        # Tudo foi fixado pela pré-resolução: não sobra nada para o motor
+        resultado = reducao.restaurar(Resultado("Optimal", np.zeros(0), 0.0, np.zeros(len(reducao.b)),
+                                                base=np.zeros(0, dtype=int) if nome in ("revisado", "barreira", "auto") else None,
+                                                custosReduzidos=np.zeros(0), motor=nome))
+    else:
+        reduzido = motor(reducao.c, reducao.A, reducao.b, reducao.operadores, maximizar,
+                         base_inicial=reducao.reduzir_base(base_inicial), controle=controle)
+        with medir(controle, "pós-resolução"):
+            resultado = reducao.restaurar(reduzido)
+
+    estatisticas = reducao.estatisticas._replace(segundos_presolve=meio - inicio,
+                                                 segundos_resolucao=time.perf_counter() - meio)
+    return resultado._replace(presolve=estatisticas)
+
+
+def tableau_simplificado(funcObj, restricoes, constantes, operadores, valorOtimo):
+    """
+    Monta o tableau simplificado para exibição:
+    variáveis de decisão | uma coluna 's_i' por restrição (folga/sobra) | LD
+    """
+    return Problema.criar(funcObj, restricoes, constantes, operadores).tableau(valorOtimo)
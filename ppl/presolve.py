@@ -0,0 +1,339 @@
+"""
+Pré-resolução (presolve) e escala do PPL, com o mapa de volta (postsolve).
+
+Antes de chamar o motor, o problema passa por reduções repetidas até que nada
+mais possa ser removido:
+- linhas vazias (0 op b): somem, ou o problema é inviável;
+- linhas com um único coeficiente: "=" fixa a variável; "≤"/"≥" que já são
+  garantidas por x ≥ 0 somem;
+- variáveis fixadas saem do problema e o lado direito é corrigido;
+- colunas vazias ou dominadas (aumentar x_j só piora o objetivo e aperta as
+  restrições) ficam fixas em zero;
+- restrições duplicadas ou paralelas (múltiplas umas das outras): fica só a
+  mais apertada de cada sentido.
+
+O que sobra tem as linhas equilibradas (escala geométrica em potências de 2,
+para não introduzir erro de arredondamento). ``Presolve.restaurar()``
+desfaz tudo: solução, preços-sombra e custos reduzidos voltam ao espaço
+original e, se o motor devolveu a base, ela é traduzida para o problema
+original (o tableau ótimo é remontado a partir dela). Se só houve escala, o
+histórico dos pivôs também volta ao problema original (ver
+``HistoricoPivos.desescalar``); com linhas ou colunas removidas, ele se perde.
+"""
+
+from typing import NamedTuple
+
+import numpy as np
+from scipy.sparse import csr_matrix, diags
+
+from ppl.problema import sentidos
+
+TOL = 1e-9
+TOL_VIAVEL = 1e-7
+MAX_PASSADAS = 20
+LIMIAR_ESCALA = 16.0   # só escala se max|a| / min|a| passar disso
+
+
+class EstatisticasPresolve(NamedTuple):
+    """O que a pré-resolução fez e quanto tempo cada etapa levou"""
+    linhas: int
+    colunas: int
+    linhas_removidas: int
+    colunas_removidas: int
+    razao_antes: float      # max|a| / min|a| dos coeficientes não nulos
+    razao_depois: float
+    segundos_presolve: float = 0.0
+    segundos_resolucao: float = 0.0
+
+
+def _razao(A):
+    """Espalhamento dos coeficientes não nulos (1.0 para matriz vazia)"""
+    valores = np.abs(A.data[A.data != 0])
+    return float(valores.max() / valores.min()) if len(valores) else 1.0
+
+
+def _equilibrar(A):
+    """
+    Fator de cada linha (média geométrica de max|a| e min|a|), arredondado para
+    potência de 2. As colunas não são escaladas: isso mudaria a escolha de pivôs
+    da regra de Dantzig e, nos testes, aumentou o número de iterações.
+    """
+    modulo = abs(A).tocsr()
+    inverso = modulo.copy()
+    inverso.data = 1.0 / inverso.data
+    maximo = modulo.max(axis=1).toarray().ravel()
+    minimo = 1.0 / np.maximum(inverso.max(axis=1).toarray().ravel(), TOL)
+    fator = np.ones_like(maximo)
+    usadas = maximo > 0
+    fator[usadas] = 1.0 / np.sqrt(maximo[usadas] * minimo[usadas])
+    return np.exp2(np.round(np.log2(fator)))
+
+
+class Presolve:
+    """
+    Reduz o problema na construção. Se as reduções provarem a inviabilidade,
+    ``status`` vale "Infeasible"; senão ``c``, ``A``, ``b`` e ``operadores``
+    são o problema reduzido e escalado, pronto para qualquer motor.
+    """
+
+    def __init__(self, c, A, b, operadores, maximizar):
+        self.c0 = np.asarray(c, dtype=float)
+        self.A0 = A
+        self.b0 = np.asarray(b, dtype=float)
+        self.operadores0 = list(operadores)
+        self.maximizar = maximizar
+        m, n = A.shape
+
+        self._A = csr_matrix(A)
+        self._A.eliminate_zeros()
+        self._A.sort_indices()
+        self._Acsc = self._A.tocsc()
+        self._b = self.b0.copy()
+        self._sinais = sentidos(operadores).astype(float)
+        self._custo = -self.c0 if maximizar else self.c0.copy()
+
+        self.status = None
+        self.linhas = np.ones(m, dtype=bool)
+        self.colunas = np.ones(n, dtype=bool)
+        self.x_fixo = np.zeros(n)
+        self.pilha = []   # ("linha", i) | ("fixa", i, j) | ("coluna", j), na ordem das remoções
+
+        self._reduzir()
+        self._montar()
+
+    @property
+    def identidade(self):
+        """Verdadeiro se nada foi removido nem escalado"""
+        return not self.pilha and self.R is None
+
+    # ---------- reduções ----------
+
+    def _ativa(self):
+        """Submatriz das linhas e colunas ainda ativas (mesmas dimensões, com zeros)"""
+        ativa = diags(self.linhas.astype(float)) @ self._A @ diags(self.colunas.astype(float))
+        ativa = ativa.tocsr()
+        ativa.eliminate_zeros()
+        ativa.sort_indices()
+        return ativa
+
+    def _reduzir(self):
+        etapas = (self._linhas_vazias, self._linhas_singulares, self._colunas_dominadas, self._linhas_paralelas)
+        for _ in range(MAX_PASSADAS):
+            removidos = len(self.pilha)
+            for etapa in etapas:
+                etapa()
+                if self.status is not None:
+                    return
+            if len(self.pilha) == removidos:
+                return
+
+    def _remover_linha(self, i):
+        self.linhas[i] = False
+        self.pilha.append(("linha", i))
+
+    def _fixar(self, i, j, valor):
+        """Fixa x_j = valor (linha i singular de igualdade) e corrige b"""
+        inicio, fim = self._Acsc.indptr[j], self._Acsc.indptr[j + 1]
+        self._b[self._Acsc.indices[inicio:fim]] -= valor * self._Acsc.data[inicio:fim]
+        self.x_fixo[j] = valor
+        self.colunas[j] = False
+        self.linhas[i] = False
+        self.pilha.append(("fixa", i, j))
+
+    def _linhas_vazias(self):
+        nnz = np.diff(self._ativa().indptr)
+        for i in np.flatnonzero(self.linhas & (nnz == 0)):
+            bi, sinal = self._b[i], self._sinais[i]
+            tol = TOL_VIAVEL * (1 + abs(self.b0[i]))
+            if (sinal >= 0 and bi < -tol) or (sinal <= 0 and bi > tol):
+                self.status = "Infeasible"
+                return
+            self._remover_linha(i)
+
+    def _linhas_singulares(self):
+        ativa = self._ativa()
+        nnz = np.diff(ativa.indptr)
+        for i in np.flatnonzero(self.linhas & (nnz == 1)):
+            j, a = ativa.indices[ativa.indptr[i]], ativa.data[ativa.indptr[i]]
+            if not self.colunas[j]:
+                continue   # coluna fixada nesta mesma passada; a linha é revista na próxima
+            limite, sinal = self._b[i] / a, self._sinais[i]
+            tol = TOL_VIAVEL * (1 + abs(limite))
+            if sinal == 0:
+                if limite < -tol:
+                    self.status = "Infeasible"
+                    return
+                self._fixar(i, j, max(limite, 0.0))
+            elif (sinal > 0) == (a > 0):
+                # x_j ≤ limite: só dá para remover fixando, o que exige limite ≤ 0
+                if limite < -tol:
+                    self.status = "Infeasible"
+                    return
+            elif limite <= tol:
+                # x_j ≥ limite ≤ 0: já garantido por x_j ≥ 0
+                self._remover_linha(i)
+
+    def _colunas_dominadas(self):
+        ativa = self._ativa().tocoo()
+        sinal = self._sinais[ativa.row]
+        ruim = np.where(sinal == 0, True, ativa.data * sinal < 0)
+        ruins = np.bincount(ativa.col[ruim], minlength=len(self.colunas))
+        for j in np.flatnonzero(self.colunas & (self._custo >= 0) & (ruins == 0)):
+            self.colunas[j] = False
+            self.pilha.append(("coluna", j))
+
+    def _linhas_paralelas(self):
+        ativa = self._ativa()
+        grupos = {}
+        for i in np.flatnonzero(self.linhas & (np.diff(ativa.indptr) >= 2)):
+            inicio, fim = ativa.indptr[i], ativa.indptr[i + 1]
+            escala = ativa.data[inicio]
+            chave = (ativa.indices[inicio:fim].tobytes(), np.round(ativa.data[inicio:fim] / escala, 10).tobytes())
+            sinal = self._sinais[i] * np.sign(escala)
+            grupos.setdefault(chave, []).append((i, self._b[i] / escala, sinal))
+
+        for membros in grupos.values():
+            if len(membros) > 1 and not self._resolver_grupo(membros):
+                self.status = "Infeasible"
+                return
+
+    def _resolver_grupo(self, membros):
+        """Mantém a restrição mais apertada de cada sentido; False se forem incompatíveis"""
+        menores = [(rhs, i) for i, rhs, sinal in membros if sinal > 0]
+        maiores = [(rhs, i) for i, rhs, sinal in membros if sinal < 0]
+        iguais = [(rhs, i) for i, rhs, sinal in membros if sinal == 0]
+        superior = min(menores)[0] if menores else np.inf
+        inferior = max(maiores)[0] if maiores else -np.inf
+        tol = TOL_VIAVEL * (1 + max(abs(rhs) for _, rhs, _ in membros))
+
+        if iguais:
+            valor = iguais[0][0]
+            if any(abs(rhs - valor) > tol for rhs, _ in iguais) or valor > superior + tol or valor < inferior - tol:
+                return False
+            manter = {iguais[0][1]}
+        else:
+            if inferior > superior + tol:
+                return False
+            manter = set()
+            if menores:
+                manter.add(min(menores)[1])
+            if maiores:
+                manter.add(max(maiores)[1])
+        for i, _, _ in membros:
+            if i not in manter:
+                self._remover_linha(i)
+        return True
+
+    # ---------- problema reduzido ----------
+
+    def _montar(self):
+        m, n = self._A.shape
+        self.idx_linhas = np.flatnonzero(self.linhas)
+        self.idx_colunas = np.flatnonzero(self.colunas)
+        reduzida = self._A[self.idx_linhas][:, self.idx_colunas]
+        razao_antes = _razao(self._A)
+
+        self.R = None
+        if self.status is None and _razao(reduzida) > LIMIAR_ESCALA:
+            self.R = _equilibrar(reduzida)
+            reduzida = diags(self.R) @ reduzida
+        reduzida = reduzida.tocsr()
+
+        self.c = self.c0[self.idx_colunas]
+        self.b = self._b[self.idx_linhas] * (self.R if self.R is not None else 1.0)
+        self.A = reduzida if hasattr(self.A0, "tocsr") else reduzida.toarray()
+        self.operadores = [self.operadores0[i] for i in self.idx_linhas]
+        self.estatisticas = EstatisticasPresolve(
+            m, n, m - len(self.idx_linhas), n - len(self.idx_colunas), razao_antes, _razao(reduzida))
+
+    def reduzir_base(self, base):
+        """Traduz uma base do problema original para o reduzido (None se não couber)"""
+        if base is None:
+            return None
+        m, n = self._A.shape
+        mr, nr = len(self.idx_linhas), len(self.idx_colunas)
+        mapa = np.full(n + 2 * m, -1)
+        mapa[self.idx_colunas] = np.arange(nr)
+        mapa[n + self.idx_linhas] = nr + np.arange(mr)
+        base = np.asarray(base, dtype=int)
+        if len(base) == 0 or base.max() >= n + 2 * m:
+            return None
+        reduzida = mapa[base]
+        reduzida = reduzida[reduzida >= 0]
+        return reduzida if len(reduzida) == mr else None
+
+    # ---------- postsolve ----------
+
+    def _expandir_x(self, solucao):
+        """Solução do reduzido mais as variáveis fixadas"""
+        x = self.x_fixo.copy()
+        x[self.idx_colunas] = solucao
+        return x
+
+    def _expandir_base(self, base):
+        """Base do problema original: a do reduzido mais uma variável por linha removida"""
+        m, n = self._A.shape
+        mapa = np.concatenate([self.idx_colunas, n + self.idx_linhas, n + m + self.idx_linhas])
+        completa = list(mapa[np.asarray(base, dtype=int)])
+        for passo in self.pilha:
+            if passo[0] == "linha":
+                i = passo[1]
+                completa.append(n + m + i if self._sinais[i] == 0 else n + i)
+            elif passo[0] == "fixa":
+                completa.append(passo[2])
+        return np.array(completa, dtype=int)
+
+    def restaurar(self, resultado):
+        """Leva o Resultado do problema reduzido de volta ao espaço original"""
+        if resultado.solucao is None:
+            # Sem ponto a restaurar; o raio de Farkas, se houver, é das linhas reduzidas
+            return resultado._replace(farkas=None)
+        x = self._expandir_x(resultado.solucao)
+        if resultado.status != "Optimal":
+            # Ponto viável de uma resolução interrompida
+            return resultado._replace(solucao=x, valorOtimo=float(self.c0 @ x))
+
+        # Preços-sombra no sentido de minimização (y) para a recuperação dual
+        sentido = -1.0 if self.maximizar else 1.0
+        y = np.zeros(len(self.b0))
+        y[self.idx_linhas] = sentido * resultado.precoSombra * (self.R if self.R is not None else 1.0)
+        for passo in reversed(self.pilha):
+            if passo[0] == "fixa":
+                # x_j fixada pela linha i fica básica: custo reduzido zero define y_i
+                i, j = passo[1], passo[2]
+                inicio, fim = self._Acsc.indptr[j], self._Acsc.indptr[j + 1]
+                linhas, valores = self._Acsc.indices[inicio:fim], self._Acsc.data[inicio:fim]
+                a_ij = valores[linhas == i][0]
+                y[i] = (self._custo[j] - y[linhas] @ valores) / a_ij
+        precoSombra = sentido * y
+        precoSombra[np.abs(precoSombra) < TOL] = 0.0
+
+        custosReduzidos = None
+        if resultado.custosReduzidos is not None:
+            custosReduzidos = sentido * (self._custo - self._A.T @ y)
+            custosReduzidos[np.abs(custosReduzidos) < TOL] = 0.0
+
+        restaurado = resultado._replace(solucao=x, valorOtimo=float(self.c0 @ x), precoSombra=precoSombra,
+                                        custosReduzidos=custosReduzidos, tableau=None, base=None, historico=None)
+        if resultado.base is None:
+            return restaurado
+        if resultado.geracao is not None:
+            # Geração de linhas: a base vale para o problema original, mas o tableau teria todas as linhas
+            return restaurado._replace(base=self._expandir_base(resultado.base))
+
+        # Motor com base (revisado): remonta tableau e base no problema original
+        from ppl.revisado import resultado_da_base
+
+        A = self.A0.toarray() if hasattr(self.A0, "toarray") else np.asarray(self.A0, dtype=float)
+        completo = resultado_da_base(self.c0, A, self.b0, self.operadores0, self.maximizar,
+                                     self._expandir_base(resultado.base))
+        if completo is None:
+            return restaurado
+        # Só escala (nada removido): os pivôs valem para o problema original, desfeita a escala
+        historico = None
+        if resultado.historico is not None and not self.pilha and self.R is not None:
+            historico = resultado.historico.desescalar(self.R)
+        # O tableau é remontado, mas motor e estatísticas continuam sendo os da resolução
+        return completo._replace(iteracoes=resultado.iteracoes, motor=resultado.motor, historico=historico,
+                                 decomposicao=resultado.decomposicao, barreira=resultado.barreira,
+                                 escolha=resultado.escolha)
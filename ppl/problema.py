@@ -0,0 +1,171 @@
+"""
+PPL guardado em arrays contíguos do NumPy.
+
+``Problema`` tem só cinco atributos (``__slots__``): c (n,), A (m×n densa e
+C-contígua, ou CSR do SciPy), b (m,), o vetor int8 ``sentidos`` e
+``maximizar``. O sentido de cada linha é +1 para "≤", -1 para "≥" e 0 para
+"=", o mesmo sinal da folga/sobra da linha no tableau, então os motores usam o
+vetor direto, sem dicionário por linha.
+
+``Problema.criar`` converte listas, arrays ou matrizes esparsas uma única vez,
+sem copiar o que já estiver em float contíguo. Validação (inclusive NaN e
+infinitos), chave do cache e tableau simplificado são operações vetorizadas
+sobre esses arrays, sem laços por elemento.
+"""
+
+import hashlib
+
+import numpy as np
+
+OPERADORES = ("≤", "≥", "=")
+INVALIDO = 2                                   # sentido de um operador desconhecido
+_SIMBOLOS = np.array(["=", "≤", "≥"], dtype=object)   # índice = sentido (0, 1 e -1)
+
+
+def sentidos(operadores):
+    """Vetor int8 dos sentidos (+1 "≤", -1 "≥", 0 "=", INVALIDO para o resto)"""
+    if isinstance(operadores, np.ndarray) and operadores.dtype == np.int8:
+        return operadores
+    ops = np.asarray(operadores, dtype=str)
+    codigos = np.full(ops.shape, INVALIDO, dtype=np.int8)
+    codigos[ops == "≤"] = 1
+    codigos[ops == "≥"] = -1
+    codigos[ops == "="] = 0
+    return codigos
+
+
+class Problema:
+    """c, A, b e sentidos de um PPL (ver o docstring do módulo)"""
+
+    __slots__ = ("c", "A", "b", "sentidos", "maximizar")
+
+    def __init__(self, c, A, b, sentidos, maximizar=True):
+        self.c = c
+        self.A = A
+        self.b = b
+        self.sentidos = sentidos
+        self.maximizar = maximizar
+
+    @classmethod
+    def criar(cls, funcObj, restricoes, constantes, operadores, tipo_otimizacao="Maximizar"):
+        """
+        Converte os dados (listas, arrays ou A esparsa) para float contíguo.
+        Levanta ValueError se não forem numéricos ou as formas não combinarem.
+        """
+        c = np.ascontiguousarray(funcObj, dtype=float)
+        b = np.ascontiguousarray(constantes, dtype=float)
+        if hasattr(restricoes, "tocsr"):
+            A = restricoes.tocsr().astype(float, copy=False)
+            if A.shape != (len(b), len(c)):
+                raise ValueError(f"A tem forma {A.shape}, esperada {(len(b), len(c))}")
+        else:
+            A = np.ascontiguousarray(restricoes, dtype=float).reshape(len(b), len(c))
+        return cls(c, A, b, sentidos(operadores), tipo_otimizacao == "Maximizar")
+
+    @property
+    def m(self):
+        return len(self.b)
+
+    @property
+    def n(self):
+        return len(self.c)
+
+    @property
+    def esparso(self):
+        return hasattr(self.A, "tocsr")
+
+    @property
+    def operadores(self):
+        """Operadores como texto ("≤", "≥", "="), na forma que os motores recebem"""
+        return _SIMBOLOS[self.sentidos].tolist()
+
+    @property
+    def tipo_otimizacao(self):
+        return "Maximizar" if self.maximizar else "Minimizar"
+
+    def _coeficientes(self):
+        return self.A.data if self.esparso else self.A
+
+    def validar(self):
+        """Erros de um problema já convertido (operadores, linhas e valores não finitos)"""
+        erros = []
+        if self.m == 0:
+            erros.append("⚠️ Deve haver pelo menos uma restrição")
+        if len(self.sentidos) != self.m:
+            erros.append("⚠️ Número de constantes, operadores e restrições deve ser o mesmo")
+        if (self.sentidos == INVALIDO).any():
+            erros.append("⚠️ Operadores inválidos detectados")
+        nao_finitos = [onde for onde, valores in (("função objetivo", self.c), ("restrições", self._coeficientes()),
+                                                   ("lado direito", self.b))
+                       if not np.isfinite(valores).all()]
+        if nao_finitos:
+            erros.append(f"⚠️ Valores não finitos (NaN ou infinito) em: {', '.join(nao_finitos)}")
+        return erros
+
+    def estrutura(self):
+        """Resumo de A e dos sentidos: igual entre envios que só mudam b ou c (partida a quente)"""
+        h = hashlib.blake2b(digest_size=16)
+        h.update(f"{self.m}x{self.n}|".encode())
+        if self.esparso:
+            for parte in (self.A.indptr, self.A.indices, self.A.data):
+                h.update(np.ascontiguousarray(parte).tobytes())
+        else:
+            h.update(self.A.tobytes())
+        h.update(self.sentidos.tobytes())
+        return h.hexdigest()
+
+    def chave(self, motor, tipos=None, gap=None, modos=()):
+        """
+        (hash SHA-256, ordem) do problema canônico, para o cache: c e as linhas
+        (operador, a_i, b_i) normalizadas e ordenadas lexicograficamente; a
+        linha canônica i é a linha ``ordem[i]``. Com A esparsa as linhas ficam
+        na ordem dada (ordenar exigiria a matriz densa). Os ``modos`` de
+        resolução (pré-resolução etc.) só entram se houver algum, para as
+        chaves sem modo continuarem as mesmas.
+        """
+        c = _normalizar(self.c)
+        b = _normalizar(self.b)
+        # Mesmos códigos de sempre na chave ("≤" 0, "=" 1, "≥" 2): o cache em disco continua válido
+        codigos = (1 - self.sentidos).astype(float)
+
+        h = hashlib.sha256()
+        h.update(f"{self.tipo_otimizacao}|{motor}|{self.m}x{self.n}|".encode())
+        if tipos is not None and any(t != "Contínua" for t in tipos):
+            h.update(f"{','.join(tipos)}|{gap}|".encode())
+        if modos:
+            h.update(f"modos={'+'.join(modos)}|".encode())
+        h.update(c.tobytes())
+        if self.esparso:
+            A = self.A.copy()
+            A.sum_duplicates()
+            A.eliminate_zeros()
+            A.sort_indices()
+            for parte in (codigos, A.indptr.astype(np.int64), A.indices.astype(np.int64), _normalizar(A.data), b):
+                h.update(np.ascontiguousarray(parte).tobytes())
+            return h.hexdigest(), np.arange(self.m)
+
+        linhas = np.column_stack([codigos, _normalizar(self.A), b])
+        ordem = np.lexsort(linhas.T[::-1]) if self.m else np.zeros(0, dtype=int)
+        h.update(np.ascontiguousarray(linhas[ordem]).tobytes())
+        return h.hexdigest(), ordem
+
+    def tableau(self, valorOtimo):
+        """
+        Tableau simplificado para exibição:
+        variáveis de decisão | uma coluna 's_i' por restrição (folga/sobra) | LD
+        """
+        m, n = self.m, self.n
+        tableau = np.zeros((m + 1, n + m + 1))
+        tableau[:m, :n] = self.A.toarray() if self.esparso else self.A
+        # +1 na coluna de folga para ≤, -1 para ≥ e 0 para =: exatamente o sentido
+        tableau[np.arange(m), n + np.arange(m)] = self.sentidos
+        tableau[:m, -1] = self.b
+        tableau[-1, :n] = self.c
+        tableau[-1, -1] = valorOtimo
+        return tableau
+
+
+def _normalizar(valores):
+    """Arredonda para 12 algarismos significativos e troca -0.0 por 0.0"""
+    mantissa, expoente = np.frexp(np.asarray(valores, dtype=float))
+    return np.ldexp(np.round(mantissa, 12), expoente) + 0.0
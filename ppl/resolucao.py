@@ -0,0 +1,55 @@
+"""
+Ponto de entrada sem interface para resolver um PPL.
+
+``simplex()`` é a mesma função usada pela calculadora, mas não exibe nada:
+devolve sempre um ``Resultado`` (inclusive quando não há solução ótima) e deixa
+para quem chamou a decisão de como apresentar o status.
+"""
+
+from ppl.cache import cache_global
+from ppl.desempenho import medir
+from ppl.inviabilidade import diagnosticar
+from ppl.motores import resolver, tableau_simplificado
+
+
+def simplex(funcObj, restricoes, constantes, operadores, num_variables, tipo_otimizacao,
+            motor=None, base_inicial=None, usar_cache=True, controle=None, presolve=False, tipos=None, gap=None,
+            decompor=False, gerar_linhas=False):
+    """
+    Resolve Problemas de Programação Linear com o motor escolhido (ver ppl.motores).
+    Suporta restrições do tipo ≤, ≥ e =.
+    Retorna o Resultado do motor; resultado.status != "Optimal" indica falha.
+    O motor "revisado" já devolve o tableau ótimo verdadeiro e a base; para os demais,
+    o tableau é uma representação simplificada (uma coluna de folga/sobra por restrição).
+    base_inicial: base ótima de uma resolução anterior, para partida a quente.
+    usar_cache: passa antes pelo cache do processo (resultado.doCache indica acerto).
+    controle: limite de tempo, cancelamento e progresso (ver ppl.tarefas); interrompido,
+    o resultado tem status "Not Solved" e, se houver, o melhor ponto viável encontrado.
+    presolve: reduz e escala o problema antes do motor (ver ppl.presolve).
+    tipos: "Contínua", "Inteira" ou "Binária" por variável; com alguma inteira, resolve
+    por branch-and-bound até o gap relativo ``gap`` (ver ppl.inteiro).
+    decompor: resolve por blocos quando A tem estrutura bloco-diagonal ou com
+    restrições ligantes (ver ppl.decomposicao).
+    gerar_linhas: resolve com um conjunto de trabalho das restrições "≤" e acrescenta
+    só as violadas, em lotes (ver ppl.geracao); o resultado não traz tableau.
+    Inviável, o resultado traz em ``resultado.iis`` o conjunto mínimo de restrições
+    em conflito (ver ppl.inviabilidade).
+    """
+    if usar_cache:
+        resultado = cache_global().resolver(funcObj, restricoes, constantes, operadores, tipo_otimizacao,
+                                            motor=motor, base_inicial=base_inicial, controle=controle,
+                                            presolve=presolve, tipos=tipos, gap=gap, decompor=decompor,
+                                            gerar_linhas=gerar_linhas)
+    else:
+        resultado = resolver(funcObj, restricoes, constantes, operadores, tipo_otimizacao,
+                             motor=motor, base_inicial=base_inicial, controle=controle, presolve=presolve,
+                             tipos=tipos, gap=gap, decompor=decompor, gerar_linhas=gerar_linhas)
+
+    # Motores sem tableau próprio recebem um tableau simplificado para exibição
+    # (exceto na geração de linhas, em que ele teria todas as linhas que se quis evitar)
+    if resultado.status == "Optimal" and resultado.tableau is None and resultado.geracao is None:
+        with medir(controle, "tableau"):
+            tableau = tableau_simplificado(funcObj, restricoes, constantes, operadores, resultado.valorOtimo)
+        resultado = resultado._replace(tableau=tableau)
+    # Depois do cache, como o tableau: um resultado inviável guardado também é diagnosticado
+    return diagnosticar(resultado, restricoes, constantes, operadores, controle)
@@ -0,0 +1,405 @@
+"""
+Motor Simplex Revisado em NumPy (duas fases).
+
+O problema é levado à forma padrão com uma coluna de folga/sobra por restrição
+(+1 para ≤, -1 para ≥ e coluna nula para =) e, quando necessário, uma variável
+artificial por linha para a Fase 1. A base é mantida fatorada em LU e, a cada
+pivô, apenas um vetor eta é acrescentado (forma produto da inversa); a base é
+refatorada do zero a cada ``LIMITE_ETAS`` pivôs para conter o erro numérico.
+
+Também é possível reotimizar a partir de uma base conhecida (partida a quente),
+com o simplex primal ou dual conforme a viabilidade dessa base.
+
+Um ``controle`` (ver ppl.tarefas) opcional recebe o progresso a cada iteração
+e pode interromper o método por tempo ou cancelamento; interrompido na Fase 2,
+o motor devolve o ponto viável atual com status "Not Solved".
+
+Ao final, o motor devolve, em uma única passada, o tableau ótimo verdadeiro
+(B⁻¹[A | S] com a linha Z), a base, os custos reduzidos e os preços-sombra,
+além do histórico compacto dos pivôs (ver ppl.historico).
+"""
+
+import warnings
+
+import numpy as np
+from scipy.linalg import LinAlgWarning, lu_factor, lu_solve
+
+from ppl.desempenho import medir
+from ppl.historico import HistoricoPivos
+from ppl.motores import Resultado
+from ppl.problema import sentidos
+
+TOL = 1e-9
+TOL_PRIMAL = 1e-7   # passos menores que isto contam como degenerados
+LIMITE_ETAS = 64
+LIMITE_DEGENERADOS = 50
+
+
+class _BaseFatorada:
+    """Base B fatorada em LU com atualizações na forma produto (arquivo de etas)"""
+
+    def __init__(self, M, base):
+        self.M = M
+        self.refatorar(base)
+
+    def singular(self):
+        """Verdadeiro se a base fatorada for (numericamente) singular"""
+        return np.abs(np.diag(self.lu[0])).min() <= TOL
+
+    def refatorar(self, base):
+        self.lu = lu_factor(self.M[:, base], check_finite=False)
+        self.etas = []
+
+    def ftran(self, a):
+        """Resolve B x = a"""
+        x = lu_solve(self.lu, a, check_finite=False)
+        for r, d in self.etas:
+            xr = x[r] / d[r]
+            x -= xr * d
+            x[r] = xr
+        return x
+
+    def btran(self, cb):
+        """Resolve yᵀ B = cbᵀ"""
+        w = np.array(cb, dtype=float)
+        for r, d in reversed(self.etas):
+            wr = w[r]
+            w[r] = (wr - (w @ d - wr * d[r])) / d[r]
+        return lu_solve(self.lu, w, trans=1, check_finite=False)
+
+    def atualizar(self, r, d):
+        """Registra o pivô na linha r com a coluna d = B⁻¹a_q"""
+        self.etas.append((r, d))
+
+
+class _Simplex:
+    """Estado do método: matriz na forma padrão, base e valores básicos"""
+
+    def __init__(self, M, b, base, controle=None, historico=None):
+        self.M = M
+        self.b = b
+        self.base = np.array(base, dtype=int)
+        self.fator = _BaseFatorada(M, self.base)
+        self.xB = self.fator.ftran(b)
+        self.iteracoes = 0
+        self.controle = controle
+        self.fase = ""
+        self.escala = 1.0   # converte o custo interno para o sentido relatado
+        self.historico = historico
+
+    def _interromper(self, custo):
+        """Relata o progresso ao controle (se houver) e diz se deve parar"""
+        if self.controle is None:
+            return False
+        self.controle.registrar(self.iteracoes, self.fase, self.escala * float(custo[self.base] @ self.xB))
+        return self.controle.interromper()
+
+    def _pivotear(self, r, q, d):
+        if self.historico is not None:
+            self.historico.registrar(r, q, self.base[r], d, self.fase)
+        self.base[r] = q
+        if len(self.fator.etas) >= LIMITE_ETAS:
+            self.fator.refatorar(self.base)
+            self.xB = self.fator.ftran(self.b)
+        else:
+            self.fator.atualizar(r, d)
+        self.iteracoes += 1
+
+    def custos_reduzidos(self, custo):
+        y = self.fator.btran(custo[self.base])
+        return custo - y @ self.M, y
+
+    def primal(self, custo, permitidas, max_iter):
+        """Simplex primal a partir de uma base primal viável"""
+        degenerados = 0
+        while self.iteracoes < max_iter:
+            if self._interromper(custo):
+                return "Not Solved"
+            dj, _ = self.custos_reduzidos(custo)
+            candidatas = permitidas.copy()
+            candidatas[self.base] = False
+            negativas = np.flatnonzero(candidatas & (dj < -TOL))
+            if len(negativas) == 0:
+                return "Optimal"
+
+            # Dantzig; com muitos pivôs degenerados seguidos, regra de Bland
+            if degenerados > LIMITE_DEGENERADOS:
+                q = negativas[0]
+            else:
+                q = negativas[np.argmin(dj[negativas])]
+
+            d = self.fator.ftran(self.M[:, q])
+            positivos = np.flatnonzero(d > TOL)
+            if len(positivos) == 0:
+                return "Unbounded"
+
+            # Valores básicos levemente negativos (erro de arredondamento) valem
+            # zero: o passo nunca recua e a degenerescência é reconhecida como tal
+            razoes = np.maximum(self.xB[positivos], 0.0) / d[positivos]
+            theta = razoes.min()
+            empates = positivos[razoes <= theta + TOL]
+            if degenerados > LIMITE_DEGENERADOS:
+                r = empates[np.argmin(self.base[empates])]
+            else:
+                r = empates[np.argmax(d[empates])]
+
+            degenerados = degenerados + 1 if theta <= TOL_PRIMAL else 0
+            self.xB -= theta * d
+            self.xB[r] = theta
+            self._pivotear(r, q, d)
+        return "Not Solved"
+
+    def dual(self, custo, permitidas, max_iter):
+        """Simplex dual a partir de uma base dual viável (custos reduzidos ≥ 0)"""
+        identidade = np.eye(len(self.base))
+        dj, _ = self.custos_reduzidos(custo)
+        while self.iteracoes < max_iter:
+            if self._interromper(custo):
+                return "Not Solved"
+            negativos = np.flatnonzero(self.xB < -TOL)
+            if len(negativos) == 0:
+                return "Optimal"
+            r = negativos[np.argmin(self.xB[negativos])]
+
+            alfa = self.fator.btran(identidade[r]) @ self.M
+            candidatas = permitidas & (alfa < -TOL)
+            candidatas[self.base] = False
+            candidatas = np.flatnonzero(candidatas)
+            if len(candidatas) == 0:
+                return "Infeasible"
+
+            razoes = np.maximum(dj[candidatas], 0.0) / -alfa[candidatas]
+            q = candidatas[np.argmin(razoes)]
+            d = self.fator.ftran(self.M[:, q])
+            theta = self.xB[r] / d[r]
+            self.xB -= theta * d
+            self.xB[r] = theta
+            # Atualiza os custos reduzidos com a linha pivô, sem novo btran
+            dj -= (dj[q] / alfa[q]) * alfa
+            self._pivotear(r, q, d)
+        return "Not Solved"
+
+    def remover_artificiais(self, artificiais):
+        """Tira da base as artificiais que ficaram em nível zero após a Fase 1"""
+        for r in np.flatnonzero(artificiais[self.base]):
+            linha = self.fator.btran(np.eye(len(self.base))[r]) @ self.M
+            linha[artificiais] = 0.0
+            linha[self.base] = 0.0
+            q = int(np.argmax(np.abs(linha)))
+            if abs(linha[q]) <= TOL:
+                # Linha redundante: a artificial permanece básica em zero
+                continue
+            d = self.fator.ftran(self.M[:, q])
+            self.xB -= (self.xB[r] / d[r]) * d
+            self.xB[r] = 0.0
+            self._pivotear(r, q, d)
+            self.iteracoes -= 1  # troca degenerada, não conta como iteração
+
+
+def resolver_revisado(c, A, b, operadores, maximizar, base_inicial=None, controle=None):
+    """
+    Resolve o PPL com o Simplex Revisado de duas fases.
+
+    Se ``base_inicial`` (índices de colunas em [x | s]) for informada, tenta
+    partir dela: simplex primal se a base ainda for primal viável (mudou só c),
+    simplex dual se não for (mudou b), com deslocamento temporário de custos
+    quando c também mudou. Se a base for inválida ou singular, resolve do zero.
+    ``controle``: acompanhamento e interrupção (ver ppl.tarefas).
+    """
+    m, n = A.shape
+    sinais = sentidos(operadores).astype(float)
+
+    if base_inicial is not None and m > 0:
+        resultado = _reotimizar(c, A, b, sinais, maximizar, np.asarray(base_inicial, dtype=int), controle)
+        if resultado is not None:
+            return resultado
+
+    # Linhas com lado direito negativo são multiplicadas por -1 (b ≥ 0)
+    flip = np.where(b < 0, -1.0, 1.0)
+    Mf = np.hstack([A, np.diag(sinais), np.eye(m)]) * flip[:, None]
+    Mf[:, n + m:] = np.eye(m)
+    bf = b * flip
+
+    # Base inicial: folga quando ela tem coeficiente +1, senão artificial
+    folga_ok = sinais * flip > 0
+    base = np.where(folga_ok, n + np.arange(m), n + m + np.arange(m))
+    artificiais = np.zeros(n + 2 * m, dtype=bool)
+    artificiais[n + m + np.flatnonzero(~folga_ok)] = True
+
+    permitidas = np.ones(n + 2 * m, dtype=bool)
+    permitidas[n + np.flatnonzero(sinais == 0)] = False   # "=" não tem folga
+    permitidas[n + m:] = artificiais[n + m:]
+    max_iter = 50 * (m + n) + 100
+
+    if m == 0:
+        custo = -c if maximizar else c
+        if (custo < -TOL).any():
+            return Resultado("Unbounded", motor="revisado")
+        zero = np.zeros(n)
+        return Resultado("Optimal", zero, 0.0, np.zeros(0), np.zeros((1, n + 1)),
+                         np.zeros(0, dtype=int), -custo, motor="revisado")
+
+    with medir(controle, "montagem"):
+        objetivo = np.concatenate([c, np.zeros(2 * m)])
+        historico = HistoricoPivos(Mf, bf, base, n, objetivo, artificiais, max_iter + m)
+        metodo = _Simplex(Mf, bf, base, controle, historico)
+
+    # ---------- Fase 1: minimiza a soma das artificiais ----------
+    if artificiais.any():
+        metodo.fase = "Fase 1"
+        custo1 = artificiais.astype(float)
+        with medir(controle, "fase 1"):
+            status = metodo.primal(custo1, permitidas, max_iter)
+        if status != "Optimal":
+            return Resultado(status, iteracoes=metodo.iteracoes, motor="revisado")
+        if custo1[metodo.base] @ metodo.xB > TOL * (1 + np.abs(bf).sum()):
+            # Duais da Fase 1: certificado de Farkas (semente do IIS, ver ppl.inviabilidade)
+            raio = metodo.fator.btran(custo1[metodo.base]) * flip
+            return Resultado("Infeasible", iteracoes=metodo.iteracoes, motor="revisado", farkas=raio)
+        # A troca das artificiais em nível zero já é da Fase 2 (linha Z no passo a passo)
+        metodo.fase = "Fase 2"
+        historico.marcar_fase2()
+        metodo.remover_artificiais(artificiais)
+        permitidas[n + m:] = False
+
+    # ---------- Fase 2: otimiza a função objetivo ----------
+    custo = np.concatenate([-c if maximizar else c, np.zeros(2 * m)])
+    metodo.fase, metodo.escala = "Fase 2", -1.0 if maximizar else 1.0
+    with medir(controle, "fase 2"):
+        status = metodo.primal(custo, permitidas, max_iter)
+    if status == "Not Solved":
+        return _ponto_viavel(metodo, c, n)
+    if status != "Optimal":
+        return Resultado(status, iteracoes=metodo.iteracoes, motor="revisado")
+
+    with medir(controle, "extração"):
+        return _extrair(metodo, c, maximizar, custo, flip, n, m)
+
+
+def _reotimizar(c, A, b, sinais, maximizar, base, controle=None):
+    """Reotimiza a partir de uma base conhecida; None se ela não servir"""
+    m, n = A.shape
+    if len(base) != m or len(np.unique(base)) != m or base.min() < 0 or base.max() >= n + m:
+        return None
+    eq = n + np.flatnonzero(sinais == 0)
+    if np.isin(base, eq).any():
+        return None
+
+    M = np.hstack([A, np.diag(sinais), np.zeros((m, m))])
+
+    permitidas = np.ones(n + 2 * m, dtype=bool)
+    permitidas[eq] = False
+    permitidas[n + m:] = False
+    custo = np.concatenate([-c if maximizar else c, np.zeros(2 * m)])
+    max_iter = 50 * (m + n) + 100
+
+    with medir(controle, "montagem"), warnings.catch_warnings():
+        warnings.simplefilter("ignore", LinAlgWarning)
+        historico = HistoricoPivos(M, b.astype(float), base, n, np.concatenate([c, np.zeros(2 * m)]),
+                                   np.zeros(n + 2 * m, dtype=bool), max_iter)
+        metodo = _Simplex(M, b.astype(float), base, controle, historico)
+    if metodo.fator.singular():
+        return None
+    metodo.escala = -1.0 if maximizar else 1.0
+    with medir(controle, "partida a quente"):
+        status = _reotimizar_base(metodo, custo, permitidas, max_iter)
+
+    if status == "Not Solved" and metodo.fase.startswith("Primal"):
+        return _ponto_viavel(metodo, c, n)
+    if status != "Optimal":
+        return Resultado(status, iteracoes=metodo.iteracoes, motor="revisado")
+    with medir(controle, "extração"):
+        return _extrair(metodo, c, maximizar, custo, np.ones(m), n, m)
+
+
+def _reotimizar_base(metodo, custo, permitidas, max_iter):
+    """Primal se a base for primal viável; senão dual (com custos deslocados) e primal"""
+    if (metodo.xB >= -TOL).all():
+        metodo.fase = "Primal (partida a quente)"
+        status = metodo.primal(custo, permitidas, max_iter)
+    else:
+        # Se c e b mudaram juntos, a base não é nem primal nem dual viável:
+        # desloca temporariamente os custos para torná-la dual viável, roda o
+        # dual até recuperar a viabilidade primal e termina com o primal
+        dj, _ = metodo.custos_reduzidos(custo)
+        deslocado = custo - np.minimum(np.where(permitidas, dj, 0.0), 0.0)
+        metodo.fase = "Dual (partida a quente)"
+        status = metodo.dual(deslocado, permitidas, max_iter)
+        if status == "Optimal":
+            metodo.fase = "Primal (partida a quente)"
+            status = metodo.primal(custo, permitidas, max_iter)
+    return status
+
+
+def resultado_da_base(c, A, b, operadores, maximizar, base):
+    """
+    Resultado completo (tableau, preços-sombra, custos reduzidos) a partir de
+    uma base ótima já conhecida, sem iterar. A base pode conter artificiais de
+    linhas redundantes, em nível zero. Devolve None se ela não for ótima.
+    """
+    m, n = A.shape
+    sinais = sentidos(operadores).astype(float)
+    M = np.hstack([A, np.diag(sinais), np.eye(m)])
+    base = np.asarray(base, dtype=int)
+    if len(base) != m or len(np.unique(base)) != m:
+        return None
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", LinAlgWarning)
+        metodo = _Simplex(M, np.asarray(b, dtype=float), base)
+    if m and metodo.fator.singular():
+        return None
+    tol = 1e-7 * (1 + np.abs(metodo.xB).max(initial=0.0))
+    artificial = base >= n + m
+    if (metodo.xB < -tol).any() or (np.abs(metodo.xB[artificial]) > tol).any():
+        return None
+
+    custo = np.concatenate([-c if maximizar else c, np.zeros(2 * m)])
+    dj, _ = metodo.custos_reduzidos(custo)
+    permitidas = np.ones(n + 2 * m, dtype=bool)
+    permitidas[n + np.flatnonzero(sinais == 0)] = False
+    permitidas[n + m:] = False
+    if (dj[permitidas] < -1e-7 * (1 + np.abs(custo).max(initial=0.0))).any():
+        return None
+    return _extrair(metodo, c, maximizar, custo, np.ones(m), n, m)
+
+
+def _ponto_viavel(metodo, c, n):
+    """Resultado "Not Solved" com o ponto viável atual (parada antes do ótimo)"""
+    x = np.zeros(metodo.M.shape[1])
+    x[metodo.base] = np.maximum(metodo.xB, 0.0)
+    solucao = x[:n]
+    return Resultado("Not Solved", solucao, float(c @ solucao), iteracoes=metodo.iteracoes, motor="revisado")
+
+
+def _extrair(metodo, c, maximizar, custo, flip, n, m):
+    """Monta solução, preços-sombra e o tableau ótimo a partir da base final"""
+    metodo.fator.refatorar(metodo.base)
+    xB = metodo.fator.ftran(metodo.b)
+    xB[np.abs(xB) < TOL] = 0.0
+
+    x = np.zeros(n + 2 * m)
+    x[metodo.base] = xB
+    solucao = x[:n]
+    valorOtimo = float(c @ solucao)
+
+    dj, y = metodo.custos_reduzidos(custo)
+    sentido = -1.0 if maximizar else 1.0
+    # y refere-se às linhas com sinal trocado; dZ/db no sentido original
+    precoSombra = sentido * y * flip
+    custosReduzidos = sentido * dj[:n]
+    precoSombra[np.abs(precoSombra) < TOL] = 0.0
+    custosReduzidos[np.abs(custosReduzidos) < TOL] = 0.0
+
+    # Tableau ótimo: B⁻¹[A | S] | B⁻¹b e linha Z = c_B B⁻¹[A | S] - [c | 0]
+    corpo = lu_solve(metodo.fator.lu, metodo.M[:, :n + m], check_finite=False)
+    tableau = np.zeros((m + 1, n + m + 1))
+    tableau[:m, :n + m] = corpo
+    tableau[:m, -1] = xB
+    tableau[-1, :n + m] = -sentido * dj[:n + m]
+    tableau[-1, -1] = valorOtimo
+    tableau[np.abs(tableau) < TOL] = 0.0
+
+    historico = metodo.historico.compactar() if metodo.historico is not None else None
+    return Resultado("Optimal", solucao, valorOtimo, precoSombra, tableau,
+                     metodo.base.copy(), custosReduzidos, metodo.iteracoes, "revisado", historico=historico)
@@ -0,0 +1,100 @@
+"""
+Análise de sensibilidade a partir da base ótima, sem resolver de novo.
+
+Com a inversa da base B⁻¹ calculada uma única vez, todas as faixas saem de
+operações vetorizadas:
+- faixa do lado direito b_i em que a base continua ótima (B⁻¹b ≥ 0);
+- faixa de cada coeficiente c_j em que a base continua ótima (custos
+  reduzidos mantêm o sinal);
+- custos reduzidos das variáveis e folga/excesso de cada restrição.
+"""
+
+from typing import NamedTuple
+
+import numpy as np
+
+from ppl.problema import sentidos
+
+TOL = 1e-9
+
+
+class Sensibilidade(NamedTuple):
+    """Faixas e valores da análise de sensibilidade (no sentido original do problema)"""
+    ladoDireitoMin: np.ndarray   # (m,)
+    ladoDireitoMax: np.ndarray   # (m,)
+    custoMin: np.ndarray         # (n,)
+    custoMax: np.ndarray         # (n,)
+    custosReduzidos: np.ndarray  # (n,)
+    folgas: np.ndarray           # (m,)
+
+
+def _razoes(numerador, denominador):
+    """
+    Faixa [inferior, superior] de δ com numerador - δ·denominador ≥ 0,
+    reduzindo ao longo do último eixo
+    """
+    with np.errstate(divide="ignore", invalid="ignore"):
+        razao = numerador / denominador
+    superior = np.where(denominador > TOL, razao, np.inf).min(axis=-1, initial=np.inf)
+    inferior = np.where(denominador < -TOL, razao, -np.inf).max(axis=-1, initial=-np.inf)
+    return inferior, superior
+
+
+def analisar(funcObj, restricoes, constantes, operadores, tipo_otimizacao, base):
+    """
+    Calcula a sensibilidade da solução ótima dada pela ``base`` (índices de
+    colunas em [x | s | a], como devolvido pelo motor "revisado").
+    """
+    c = np.asarray(funcObj, dtype=float)
+    b = np.asarray(constantes, dtype=float)
+    A = np.asarray(restricoes, dtype=float).reshape(len(b), len(c))
+    m, n = A.shape
+    base = np.asarray(base, dtype=int)
+    sinais = sentidos(operadores).astype(float)
+    maximizar = tipo_otimizacao == "Maximizar"
+
+    M = np.hstack([A, np.diag(sinais), np.eye(m)])
+    Binv = np.linalg.inv(M[:, base])
+    xB = Binv @ b
+    T = Binv @ M
+
+    # Custos na forma de minimização e custos reduzidos
+    custo = np.concatenate([-c if maximizar else c, np.zeros(2 * m)])
+    y = custo[base] @ Binv
+    dj = custo - y @ M
+
+    # ---------- Lado direito: xB - δ·(-B⁻¹e_i) ≥ 0, uma linha por restrição i ----------
+    delta_min, delta_max = _razoes(xB[None, :], -Binv.T)
+    ladoDireitoMin = b + delta_min
+    ladoDireitoMax = b + delta_max
+
+    # ---------- Coeficientes da função objetivo ----------
+    nao_basicas = np.ones(n + 2 * m, dtype=bool)
+    nao_basicas[base] = False
+    nao_basicas[n + np.flatnonzero(sinais == 0)] = False
+    nao_basicas[n + m:] = False
+    N = np.flatnonzero(nao_basicas)
+
+    # Variável não básica: só pode melhorar até o custo reduzido zerar
+    delta_min_c = np.where(nao_basicas[:n], -dj[:n], -np.inf)
+    delta_max_c = np.full(n, np.inf)
+
+    # Variável básica na linha r: dj_k - δ·T[r, k] ≥ 0 para toda k não básica
+    linhas = np.flatnonzero(base < n)
+    inferior, superior = _razoes(dj[N][None, :], T[np.ix_(linhas, N)])
+    delta_min_c[base[linhas]] = inferior
+    delta_max_c[base[linhas]] = superior
+
+    if maximizar:
+        custoMin, custoMax = c - delta_max_c, c - delta_min_c
+    else:
+        custoMin, custoMax = c + delta_min_c, c + delta_max_c
+
+    x = np.zeros(n + 2 * m)
+    x[base] = xB
+    custosReduzidos = (-dj[:n] if maximizar else dj[:n]) + 0.0
+    custosReduzidos[np.abs(custosReduzidos) < TOL] = 0.0
+    folgas = np.abs(b - A @ x[:n])
+    folgas[np.abs(folgas) < TOL] = 0.0
+
+    return Sensibilidade(ladoDireitoMin, ladoDireitoMax, custoMin, custoMax, custosReduzidos, folgas)
@@ -0,0 +1,494 @@
+"""
+Serviço HTTP/JSON local para validar e resolver PPLs, com processos pré-aquecidos.
+
+Uso:
+    python -m ppl.servico [--host 127.0.0.1] [--porta 8210] [--processos 4]
+        [--fila 256] [--lote 16] [--espera-lote 0.005] [--limite-tempo 30]
+
+Rotas:
+
+- ``POST /resolver``: um problema (objeto JSON) ou uma lista de problemas.
+  Campos: ``funcObj``, ``restricoes``, ``constantes``, ``operadores`` ("≤",
+  "≥", "=" ou "<=", ">=", "=="), ``tipo_otimizacao`` ("Maximizar" ou
+  "Minimizar", padrão "Maximizar") e, opcionais, ``motor``, ``tipos``,
+  ``gap`` e ``presolve``. A resposta traz status, solução, valor ótimo,
+  preços-sombra, custos reduzidos, iterações, motor e o tempo por fase; se
+  inviável, ``iis`` com os índices (base 0) do conflito mínimo de restrições.
+- ``POST /validar``: só a validação (``validar_entrada``), sem resolver.
+- ``GET /saude``: processos vivos e ocupação da fila.
+- ``GET /metricas``: contadores, tamanho médio dos lotes e latências (p50/p95/p99).
+
+Os pedidos válidos entram numa fila limitada (``--fila``). Uma thread
+despachante junta até ``--lote`` pedidos que chegarem dentro de
+``--espera-lote`` segundos e manda o lote inteiro a um processo do pool, que
+já importou os motores e resolveu um problema pequeno ao iniciar (a primeira
+resolução real não paga importações nem compilações). No máximo
+``EM_VOO_POR_PROCESSO`` lotes por processo ficam em andamento; com os
+processos ocupados a fila enche e os pedidos seguintes recebem 503 com
+``Retry-After``, em vez de esperar sem limite. Cada pedido tem
+``--limite-tempo`` segundos no total (fila + resolução): o tempo que sobra
+vira o limite do motor (ver ppl.tarefas) e, esgotado, a resposta é 504.
+
+Só a biblioteca padrão é usada no servidor; o serviço escuta em 127.0.0.1 por
+padrão e não tem autenticação: não deve ser exposto fora da máquina.
+"""
+
+import argparse
+import json
+import math
+import os
+import queue
+import signal
+import sys
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from ppl.validacao import validar_entrada
+
+PORTA = 8210
+TAMANHO_FILA = 256
+LOTE_MAXIMO = 16
+ESPERA_LOTE = 0.005        # s que o despachante espera para completar um lote
+EM_VOO_POR_PROCESSO = 2    # lotes em andamento por processo do pool
+LIMITE_TEMPO = 30.0        # s por pedido, da chegada à resposta
+CORPO_MAXIMO = 16 * 1024 * 1024
+LATENCIAS_GUARDADAS = 2048
+
+OPERADORES = {"≤": "≤", "<=": "≤", "≥": "≥", ">=": "≥", "=": "=", "==": "="}
+TIPOS_OTIMIZACAO = ("Maximizar", "Minimizar")
+
+
+# --- Processos de trabalho ---------------------------------------------------
+
+def _aquecer():
+    """Importa os motores e resolve um PPL pequeno, para o primeiro pedido não pagar por isso"""
+    from ppl.resolucao import simplex
+
+    # Ctrl+C chega a todo o grupo de processos; quem encerra o pool é o processo principal
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+    for motor in ("revisado", "highs"):
+        try:
+            simplex([1, 1], [[1, 2], [3, 1]], [4, 6], ["≤", "≤"], 2, "Maximizar", motor=motor, usar_cache=False)
+        except ImportError:
+            pass
+
+
+def _pronto(segundos):
+    time.sleep(segundos)   # segura o processo para a próxima chamada ir a outro
+    return os.getpid()
+
+
+def _lista(valores):
+    """Array NumPy → lista JSON (NaN e infinitos viram null)"""
+    if valores is None:
+        return None
+    return [v if math.isfinite(v) else None for v in map(float, valores)]
+
+
+def _numero(valor):
+    return float(valor) if valor is not None and math.isfinite(valor) else None
+
+
+def _resolver_pedido(problema, limite_tempo):
+    from ppl.resolucao import simplex
+    from ppl.tarefas import Controle
+
+    controle = Controle(limite_tempo=limite_tempo)
+    resultado = simplex(problema["funcObj"], problema["restricoes"], problema["constantes"],
+                        problema["operadores"], len(problema["funcObj"]), problema["tipo_otimizacao"],
+                        motor=problema.get("motor"), controle=controle, presolve=problema.get("presolve", False),
+                        tipos=problema.get("tipos"), gap=problema.get("gap"))
+    resposta = {
+        "status": resultado.status,
+        "solucao": _lista(resultado.solucao),
+        "valorOtimo": _numero(resultado.valorOtimo),
+        "precoSombra": _lista(resultado.precoSombra),
+        "custosReduzidos": _lista(resultado.custosReduzidos),
+        "iteracoes": int(resultado.iteracoes),
+        "motor": resultado.motor,
+        "doCache": bool(resultado.doCache),
+        "fases": {nome: round(segundos, 6) for nome, (segundos, _, _) in controle.medicao.fases.items()},
+    }
+    if resultado.mip is not None:
+        resposta["mip"] = {nome: _numero(valor) if isinstance(valor, float) else valor
+                           for nome, valor in resultado.mip._asdict().items()}
+    if resultado.iis is not None:
+        resposta["iis"] = {"restricoes": resultado.iis.linhas.tolist(), "minimo": resultado.iis.minimo}
+    return resposta
+
+
+def _resolver_lote(pedidos):
+    """Resolve um lote [(problema, limite de tempo)]; um erro afeta só o próprio pedido"""
+    respostas = []
+    for problema, limite_tempo in pedidos:
+        try:
+            respostas.append((True, _resolver_pedido(problema, limite_tempo)))
+        except Exception as erro:   # o lote continua; o pedido vira um erro 500
+            respostas.append((False, f"{type(erro).__name__}: {erro}"))
+    return respostas
+
+
+# --- Métricas ----------------------------------------------------------------
+
+class Metricas:
+    """Contadores e latências recentes do serviço (seguros entre threads)"""
+
+    def __init__(self):
+        self.inicio = time.monotonic()
+        self.contadores = dict.fromkeys(("recebidos", "resolvidos", "invalidos", "rejeitados",
+                                         "expirados", "erros", "lotes", "pedidos_em_lotes"), 0)
+        self.latencias = deque(maxlen=LATENCIAS_GUARDADAS)
+        self._trava = threading.Lock()
+
+    def contar(self, nome, quantidade=1):
+        with self._trava:
+            self.contadores[nome] += quantidade
+
+    def latencia(self, segundos):
+        with self._trava:
+            self.latencias.append(segundos)
+
+    def registro(self):
+        with self._trava:
+            contadores = dict(self.contadores)
+            latencias = sorted(self.latencias)
+
+        def quantil(q):
+            return round(latencias[min(int(q * len(latencias)), len(latencias) - 1)] * 1000, 3) if latencias else None
+
+        segundos = time.monotonic() - self.inicio
+        return {
+            **contadores,
+            "segundos_ativo": round(segundos, 3),
+            "pedidos_por_s": round(contadores["resolvidos"] / segundos, 3) if segundos > 0 else None,
+            "lote_medio": round(contadores["pedidos_em_lotes"] / contadores["lotes"], 3) if contadores["lotes"] else None,
+            "latencia_ms": {"p50": quantil(0.5), "p95": quantil(0.95), "p99": quantil(0.99),
+                            "amostras": len(latencias)},
+        }
+
+
+# --- Fila, lotes e pool ------------------------------------------------------
+
+class Servico:
+    """Fila limitada → lotes → pool de processos pré-aquecidos"""
+
+    def __init__(self, processos=None, tamanho_fila=TAMANHO_FILA, lote_maximo=LOTE_MAXIMO,
+                 espera_lote=ESPERA_LOTE, limite_tempo=LIMITE_TEMPO):
+        self.processos = processos or os.cpu_count() or 1
+        self.lote_maximo = max(1, lote_maximo)
+        self.espera_lote = espera_lote
+        self.limite_tempo = limite_tempo
+        self.fila = queue.Queue(maxsize=tamanho_fila)
+        self.metricas = Metricas()
+        self._em_voo = threading.BoundedSemaphore(self.processos * EM_VOO_POR_PROCESSO)
+        self._parar = threading.Event()
+        self._pool = None
+        self._sonda = None
+        self._despachante = None
+        self.pids = []
+
+    def iniciar(self):
+        """Sobe o pool, espera todos os processos aquecerem e inicia o despachante"""
+        self._pool = ProcessPoolExecutor(max_workers=self.processos, initializer=_aquecer)
+        # Cada processo só atende depois de aquecer: espera até todos responderem
+        pids = set()
+        for _ in range(20):
+            pids |= {futuro.result() for futuro in [self._pool.submit(_pronto, 0.05) for _ in range(self.processos)]}
+            if len(pids) >= self.processos:
+                break
+        self.pids = sorted(pids)
+        self._despachante = threading.Thread(target=self._despachar, name="despachante", daemon=True)
+        self._despachante.start()
+        return self
+
+    def encerrar(self):
+        self._parar.set()
+        if self._despachante is not None:
+            self._despachante.join()
+        # Pedidos que ficaram na fila não serão atendidos
+        while True:
+            try:
+                _, _, futuro = self.fila.get_nowait()
+            except queue.Empty:
+                break
+            futuro.set_exception(RuntimeError("serviço encerrado"))
+        if self._pool is not None:
+            self._pool.shutdown(wait=True, cancel_futures=True)
+
+    def submeter(self, problema):
+        """Future com a resposta do problema; queue.Full se a fila estiver cheia"""
+        futuro = Future()
+        self.fila.put_nowait((time.monotonic(), problema, futuro))
+        return futuro
+
+    def _vivos(self):
+        """
+        Processos vivos segundo uma tarefa vazia (sonda) enviada ao pool. O
+        ProcessPoolExecutor não repõe processos: se um morre, o pool quebra e
+        encerra os demais, e a sonda falha ou nem é aceita. Logo, são todos ou nenhum.
+        """
+        if self._pool is None:
+            return 0
+        sonda = self._sonda
+        if sonda is not None and sonda.done() and (sonda.cancelled() or sonda.exception() is not None):
+            return 0
+        if sonda is None or sonda.done():
+            try:
+                self._sonda = self._pool.submit(_pronto, 0)
+            except RuntimeError:    # BrokenProcessPool ou pool encerrado
+                return 0
+        return self.processos
+
+    def saude(self):
+        vivos = self._vivos()
+        return {
+            "status": "ok" if vivos == self.processos and not self._parar.is_set() else "degradado",
+            "processos": self.processos,
+            "processos_vivos": vivos,
+            "fila": self.fila.qsize(),
+            "capacidade_fila": self.fila.maxsize,
+        }
+
+    def _coletar(self):
+        """Próximo lote: o primeiro pedido da fila e os que chegarem até ``espera_lote`` depois"""
+        try:
+            lote = [self.fila.get(timeout=0.1)]
+        except queue.Empty:
+            return []
+        prazo = time.monotonic() + self.espera_lote
+        while len(lote) < self.lote_maximo:
+            restante = prazo - time.monotonic()
+            try:
+                lote.append(self.fila.get(timeout=restante) if restante > 0 else self.fila.get_nowait())
+            except queue.Empty:
+                break
+        return lote
+
+    def _despachar(self):
+        while not self._parar.is_set():
+            # Sem vaga no pool, a fila não é consumida e enche: é daí que vem o 503
+            if not self._em_voo.acquire(timeout=0.1):
+                continue
+            lote = self._coletar()
+            agora = time.monotonic()
+            validos = []
+            for chegada, problema, futuro in lote:
+                restante = self.limite_tempo - (agora - chegada)
+                if restante <= 0 or not futuro.set_running_or_notify_cancel():
+                    if restante <= 0:
+                        self.metricas.contar("expirados")
+                        futuro.set_exception(TimeoutError("tempo esgotado na fila"))
+                    continue
+                validos.append((problema, restante, futuro))
+            if not validos:
+                self._em_voo.release()
+                continue
+            self.metricas.contar("lotes")
+            self.metricas.contar("pedidos_em_lotes", len(validos))
+            try:
+                enviado = self._pool.submit(_resolver_lote, [(problema, restante) for problema, restante, _ in validos])
+            except RuntimeError as erro:   # pool encerrado
+                self._em_voo.release()
+                for _, _, futuro in validos:
+                    futuro.set_exception(erro)
+                continue
+            enviado.add_done_callback(lambda concluido, futuros=[f for _, _, f in validos]: self._entregar(concluido, futuros))
+
+    def _entregar(self, concluido, futuros):
+        self._em_voo.release()
+        try:
+            respostas = concluido.result()
+        except Exception as erro:   # processo morto ou lote cancelado
+            respostas = [(False, f"{type(erro).__name__}: {erro}")] * len(futuros)
+        for futuro, (ok, resposta) in zip(futuros, respostas):
+            if ok:
+                futuro.set_result(resposta)
+            else:
+                futuro.set_exception(RuntimeError(resposta))
+
+
+# --- HTTP ----------------------------------------------------------------------
+
+def normalizar(problema):
+    """Problema JSON no formato de ``simplex()``, ou a lista de erros encontrados"""
+    if not isinstance(problema, dict):
+        return None, ["⚠️ O problema deve ser um objeto JSON"]
+    faltando = [campo for campo in ("funcObj", "restricoes", "constantes", "operadores") if campo not in problema]
+    if faltando:
+        return None, [f"⚠️ Campos obrigatórios ausentes: {', '.join(faltando)}"]
+    if not all(isinstance(problema[campo], list) for campo in ("funcObj", "restricoes", "constantes", "operadores")):
+        return None, ["⚠️ funcObj, restricoes, constantes e operadores devem ser listas"]
+    if not all(isinstance(linha, list) for linha in problema["restricoes"]):
+        return None, ["⚠️ restricoes deve ser uma lista de linhas (listas de coeficientes)"]
+
+    normalizado = dict(problema)
+    normalizado["operadores"] = [OPERADORES.get(op, op) if isinstance(op, str) else op
+                                 for op in problema["operadores"]]
+    normalizado.setdefault("tipo_otimizacao", "Maximizar")
+    # bool é subclasse de int: true/false não contam como número
+    numericos = [problema["funcObj"], problema["constantes"], *problema["restricoes"]]
+    if any(isinstance(valor, bool) for lista in numericos for valor in lista):
+        return None, ["⚠️ Coeficientes e constantes devem ser numéricos"]
+
+    erros = validar_entrada(normalizado["funcObj"], normalizado["restricoes"], normalizado["constantes"],
+                            normalizado["operadores"])
+    if normalizado["tipo_otimizacao"] not in TIPOS_OTIMIZACAO:
+        erros.append(f"⚠️ tipo_otimizacao deve ser {' ou '.join(TIPOS_OTIMIZACAO)}")
+    if normalizado.get("motor") is not None:
+        from ppl.motores import MOTORES
+
+        if normalizado["motor"] not in MOTORES:
+            erros.append(f"⚠️ Motor desconhecido: {normalizado['motor']!r} (disponíveis: {', '.join(MOTORES)})")
+    tipos = normalizado.get("tipos")
+    if tipos is not None:
+        from ppl.inteiro import TIPOS
+
+        if not isinstance(tipos, list) or len(tipos) != len(problema["funcObj"]) or any(t not in TIPOS for t in tipos):
+            erros.append(f"⚠️ tipos deve ter um valor por variável ({', '.join(TIPOS)})")
+    return (None, erros) if erros else (normalizado, [])
+
+
+class _Manipulador(BaseHTTPRequestHandler):
+    servico = None          # definido em ``servidor()``
+    protocol_version = "HTTP/1.1"
+    server_version = "CalculadoraSimplex"
+
+    def log_message(self, formato, *args):   # sem uma linha no stderr por pedido
+        pass
+
+    def _responder(self, codigo, dados, cabecalhos=()):
+        corpo = json.dumps(dados, ensure_ascii=False).encode("utf-8")
+        self.send_response(codigo)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(corpo)))
+        for nome, valor in cabecalhos:
+            self.send_header(nome, valor)
+        self.end_headers()
+        self.wfile.write(corpo)
+
+    def _corpo(self):
+        """(True, JSON do corpo) ou (False, None) depois de responder o erro"""
+        tamanho = int(self.headers.get("Content-Length") or 0)
+        if tamanho > CORPO_MAXIMO:
+            self.close_connection = True   # o corpo não é lido
+            self._responder(HTTPStatus.REQUEST_ENTITY_TOO_LARGE, {"erro": f"corpo acima de {CORPO_MAXIMO} bytes"})
+            return False, None
+        try:
+            return True, json.loads(self.rfile.read(tamanho) or b"null")
+        except (UnicodeDecodeError, json.JSONDecodeError) as erro:
+            self._responder(HTTPStatus.BAD_REQUEST, {"erro": f"JSON inválido: {erro}"})
+            return False, None
+
+    def do_GET(self):
+        if self.path == "/saude":
+            saude = self.servico.saude()
+            self._responder(HTTPStatus.OK if saude["status"] == "ok" else HTTPStatus.SERVICE_UNAVAILABLE, saude)
+        elif self.path == "/metricas":
+            self._responder(HTTPStatus.OK, {**self.servico.metricas.registro(), "fila": self.servico.fila.qsize()})
+        else:
+            self._responder(HTTPStatus.NOT_FOUND, {"erro": f"rota desconhecida: {self.path}"})
+
+    def do_POST(self):
+        if self.path not in ("/resolver", "/validar"):
+            self._responder(HTTPStatus.NOT_FOUND, {"erro": f"rota desconhecida: {self.path}"})
+            return
+        lido, dados = self._corpo()
+        if not lido:
+            return
+        if self.path == "/validar":
+            _, erros = normalizar(dados)
+            self._responder(HTTPStatus.OK, {"valido": not erros, "erros": erros})
+        else:
+            self._resolver(dados)
+
+    def _resolver(self, dados):
+        servico, metricas = self.servico, self.servico.metricas
+        inicio = time.monotonic()
+        varios = isinstance(dados, list)
+        problemas = dados if varios else [dados]
+        metricas.contar("recebidos", len(problemas))
+
+        normalizados = [normalizar(problema) for problema in problemas]
+        invalidos = {i: erros for i, (_, erros) in enumerate(normalizados) if erros}
+        if invalidos:
+            metricas.contar("invalidos", len(problemas))
+            self._responder(HTTPStatus.UNPROCESSABLE_ENTITY,
+                            {"erros": invalidos[0]} if not varios else
+                            {"erros": {str(i): erros for i, erros in invalidos.items()}})
+            return
+
+        futuros = []
+        for problema, _ in normalizados:
+            try:
+                futuros.append(servico.submeter(problema))
+            except queue.Full:
+                for futuro in futuros:
+                    futuro.cancel()
+                metricas.contar("rejeitados", len(problemas))
+                self._responder(HTTPStatus.SERVICE_UNAVAILABLE,
+                                {"erro": "fila cheia, tente novamente em instantes"}, [("Retry-After", "1")])
+                return
+
+        respostas = []
+        for futuro in futuros:
+            try:
+                respostas.append(futuro.result(timeout=max(servico.limite_tempo - (time.monotonic() - inicio), 0) + 1.0))
+            except TimeoutError as erro:
+                if not futuro.done():
+                    metricas.contar("expirados")
+                self._responder(HTTPStatus.GATEWAY_TIMEOUT, {"erro": str(erro) or "tempo esgotado"})
+                return
+            except Exception as erro:
+                metricas.contar("erros")
+                self._responder(HTTPStatus.INTERNAL_SERVER_ERROR, {"erro": str(erro)})
+                return
+        metricas.contar("resolvidos", len(respostas))
+        metricas.latencia(time.monotonic() - inicio)
+        self._responder(HTTPStatus.OK, respostas if varios else respostas[0])
+
+
+class _Servidor(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 1024   # conexões pendentes no listen (o padrão, 5, recusa rajadas)
+
+
+def servidor(servico, host="127.0.0.1", porta=PORTA):
+    """Servidor HTTP ligado ao serviço (já iniciado); porta 0 escolhe uma livre"""
+    manipulador = type("Manipulador", (_Manipulador,), {"servico": servico})
+    return _Servidor((host, porta), manipulador)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Serviço HTTP/JSON local de resolução de PPLs")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--porta", type=int, default=PORTA)
+    parser.add_argument("--processos", type=int, default=None, help="processos do pool (padrão: CPUs)")
+    parser.add_argument("--fila", type=int, default=TAMANHO_FILA, help="pedidos aguardando antes de responder 503")
+    parser.add_argument("--lote", type=int, default=LOTE_MAXIMO, help="pedidos por lote enviado a um processo")
+    parser.add_argument("--espera-lote", type=float, default=ESPERA_LOTE,
+                        help="segundos de espera para completar um lote")
+    parser.add_argument("--limite-tempo", type=float, default=LIMITE_TEMPO, help="segundos por pedido")
+    args = parser.parse_args(argv)
+
+    servico = Servico(args.processos, args.fila, args.lote, args.espera_lote, args.limite_tempo).iniciar()
+    http = servidor(servico, args.host, args.porta)
+    host, porta = http.server_address[:2]
+    print(f"Servindo em http://{host}:{porta} ({servico.processos} processos aquecidos, fila de {args.fila})",
+          file=sys.stderr)
+    try:
+        http.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        http.server_close()
+        servico.encerrar()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
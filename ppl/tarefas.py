@@ -0,0 +1,159 @@
+"""
+Resoluções em segundo plano, com limite de tempo e cancelamento.
+
+Cada pedido vira uma ``Tarefa`` executada num pool de threads compartilhado
+pelo processo (todas as sessões do Streamlit). A tarefa carrega um ``Controle``
+que o motor consulta a cada iteração: ele registra o progresso (iterações,
+fase e valor atual da função objetivo) e avisa quando o tempo acabou ou o
+usuário cancelou. Quem pediu só consulta ``progresso()`` de tempos em tempos,
+sem ficar bloqueado esperando a resolução. No branch-and-bound (ver
+ppl.inteiro), as "iterações" são os nós resolvidos e o progresso traz também
+o limitante e o gap.
+
+O controle também carrega a ``Medicao`` da resolução (tempo por fase, ver
+ppl.desempenho); com ``perfilar=True``, a tarefa roda sob um perfilador e o
+relatório fica em ``controle.medicao.perfil``.
+
+O motor "revisado" para no meio do método e, se já estiver na Fase 2, devolve
+o ponto viável atual (status "Not Solved" com solução). O "highs" e o "pulp"
+recebem o tempo restante como limite do próprio solver, mas não podem ser
+interrompidos no meio: ao cancelar, o resultado deles é simplesmente
+descartado quando terminam.
+"""
+
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+from typing import NamedTuple, Optional
+
+from ppl.desempenho import Medicao, perfilar as _perfilar
+
+
+class Progresso(NamedTuple):
+    """Fotografia do andamento de uma tarefa"""
+    iteracoes: int
+    fase: str
+    objetivo: Optional[float]
+    segundos: float
+    limite_tempo: Optional[float]
+    cancelada: bool
+    limitante: Optional[float] = None   # branch-and-bound: melhor limitante
+    gap: Optional[float] = None         # branch-and-bound: gap relativo
+
+
+class Controle:
+    """Canal entre o motor (que relata e consulta) e quem pediu a resolução"""
+
+    def __init__(self, limite_tempo=None):
+        self.limite_tempo = limite_tempo
+        self.inicio = time.monotonic()
+        self.fim = None
+        self.iteracoes = 0
+        self.fase = "Na fila"
+        self.objetivo = None
+        self.limitante = None
+        self.gap = None
+        self.medicao = Medicao()
+        self._cancelado = threading.Event()
+
+    @property
+    def cancelado(self):
+        return self._cancelado.is_set()
+
+    def cancelar(self):
+        self._cancelado.set()
+
+    def decorrido(self):
+        return (self.fim or time.monotonic()) - self.inicio
+
+    def restante(self):
+        """Segundos até o limite de tempo (None se não houver limite)"""
+        if self.limite_tempo is None:
+            return None
+        return max(self.limite_tempo - self.decorrido(), 0.0)
+
+    def interromper(self):
+        """Verdadeiro se o motor deve parar (cancelado ou sem tempo)"""
+        return self.cancelado or self.restante() == 0.0
+
+    def registrar(self, iteracoes, fase, objetivo=None, limitante=None, gap=None):
+        self.iteracoes = iteracoes
+        self.fase = fase
+        self.objetivo = objetivo
+        self.limitante = limitante
+        self.gap = gap
+
+
+class Tarefa:
+    """Uma resolução em andamento (ou já concluída) no pool"""
+
+    def __init__(self, futuro, controle):
+        self._futuro = futuro
+        self.controle = controle
+
+    def progresso(self):
+        c = self.controle
+        return Progresso(c.iteracoes, c.fase, c.objetivo, c.decorrido(), c.limite_tempo, c.cancelado,
+                         c.limitante, c.gap)
+
+    def cancelar(self):
+        """Pede a parada; se a tarefa ainda estiver na fila, ela nem começa"""
+        self.controle.cancelar()
+        self._futuro.cancel()
+
+    def pronta(self):
+        return self._futuro.done()
+
+    def aguardar(self, segundos):
+        """Espera até ``segundos`` pelo fim da tarefa; devolve se ela terminou"""
+        concluidas, _ = wait([self._futuro], timeout=segundos)
+        return bool(concluidas)
+
+    def resultado(self):
+        """Valor devolvido pela função (repassa a exceção, se houve)"""
+        return self._futuro.result()
+
+
+class GerenciadorTarefas:
+    """Pool de threads que executa funções de resolução com um Controle"""
+
+    def __init__(self, trabalhadores=None):
+        self.trabalhadores = trabalhadores or min(4, os.cpu_count() or 1)
+        self._pool = ThreadPoolExecutor(max_workers=self.trabalhadores, thread_name_prefix="simplex")
+
+    def submeter(self, funcao, *args, limite_tempo=None, perfilar=False, **kwargs):
+        """
+        Agenda ``funcao(*args, controle=..., **kwargs)`` e devolve a Tarefa.
+        ``funcao`` pode ser ppl.simplex ou ppl.motores.resolver.
+        ``perfilar``: executa sob o perfilador (ver ppl.desempenho.perfilar).
+        """
+        controle = Controle(limite_tempo)
+
+        def executar():
+            # O relógio do limite começa quando a tarefa sai da fila
+            controle.inicio = time.monotonic()
+            controle.fase = "Iniciando"
+            try:
+                if not perfilar:
+                    return funcao(*args, controle=controle, **kwargs)
+                valor, controle.medicao.perfil = _perfilar(lambda: funcao(*args, controle=controle, **kwargs))
+                return valor
+            finally:
+                controle.fim = time.monotonic()
+
+        return Tarefa(self._pool.submit(executar), controle)
+
+
+_gerenciador_global = None
+_trava_global = threading.Lock()
+
+
+def gerenciador_global():
+    """Pool único do processo; SIMPLEX_TRABALHADORES define o número de threads"""
+    global _gerenciador_global
+    with _trava_global:
+        if _gerenciador_global is None:
+            trabalhadores = int(os.environ.get("SIMPLEX_TRABALHADORES", "0")) or None
+            _gerenciador_global = GerenciadorTarefas(trabalhadores)
+        return _gerenciador_global
@@ -0,0 +1,65 @@
+"""
+Validação dos dados de entrada de um PPL.
+
+Os dados são convertidos de uma vez para arrays (ver ppl.problema) e checados
+de forma vetorizada: tipos numéricos, formas, operadores e valores não finitos
+(NaN e infinitos). O NumPy só é importado na primeira validação.
+"""
+
+
+def _numerico(valores):
+    """Array float dos valores, ou None se não forem todos números (texto, None, linhas irregulares)"""
+    import numpy as np
+
+    if hasattr(valores, "tocsr"):
+        return valores
+    try:
+        array = np.asarray(valores)
+    except ValueError:      # listas de tamanhos diferentes
+        return None
+    if array.dtype.kind not in "biuf":
+        return None
+    return array.astype(float, copy=False)
+
+
+def validar_entrada(funcObj, restricoes, constantes, operadores):
+    """Valida os dados de entrada do problema"""
+    from ppl.problema import Problema
+
+    erros = []
+    c = _numerico(funcObj)
+    A = _numerico(restricoes)
+    b = _numerico(constantes)
+    m = restricoes.shape[0] if hasattr(restricoes, "shape") else len(restricoes)
+
+    # Verifica se os coeficientes da função objetivo são números válidos
+    if c is None or c.ndim != 1:
+        erros.append("⚠️ Coeficientes da função objetivo devem ser numéricos")
+
+    # Verifica se há pelo menos uma restrição
+    if m == 0:
+        erros.append("⚠️ Deve haver pelo menos uma restrição")
+
+    # Verifica se todas as restrições têm o mesmo número de coeficientes
+    if m and A is None and not hasattr(restricoes, "shape") and len({len(r) for r in restricoes}) > 1:
+        erros.append("⚠️ Todas as restrições devem ter o mesmo número de variáveis")
+    elif m and A is None:
+        erros.append("⚠️ Coeficientes das restrições devem ser numéricos")
+    elif m and c is not None and (A.ndim != 2 or A.shape[1] != len(c)):
+        erros.append("⚠️ Cada restrição deve ter um coeficiente por variável da função objetivo")
+
+    # Verifica consistência entre tamanhos
+    if not (len(constantes) == m == len(operadores)):
+        erros.append("⚠️ Número de constantes, operadores e restrições deve ser o mesmo")
+
+    # Constantes negativas são permitidas (podem gerar inviabilidade); só o tipo é checado
+    if b is None or b.ndim != 1:
+        erros.append("⚠️ As constantes (lado direito) devem ser numéricas")
+
+    if erros:
+        # Sem arrays coerentes, só o operador ainda pode ser checado à parte
+        from ppl.problema import INVALIDO, sentidos
+        if (sentidos(operadores) == INVALIDO).any():
+            erros.append("⚠️ Operadores inválidos detectados")
+        return erros
+    return Problema.criar(c, A, b, operadores).validar()
@@ -0,0 +1,40 @@
+"""O último passo do histórico de pivôs é o tableau final do motor revisado."""
+
+import numpy as np
+import pytest
+
+from ppl.motores import resolver
+
+
+def _ultimo_passo(funcObj, restricoes, constantes, operadores, tipo_otimizacao):
+    resultado = resolver(funcObj, restricoes, constantes, operadores, tipo_otimizacao, motor="revisado")
+    assert resultado.status == "Optimal"
+    return resultado, resultado.historico.passo(len(resultado.historico))
+
+
+def test_fase2_sem_pivos_termina_na_linha_z():
+    # A Fase 1 já chega ao ótimo: a Fase 2 não pivota
+    resultado, passo = _ultimo_passo([-2, 4], [[1, 1], [1, -1], [1, 0]], [4, 0, 3], ["=", "=", "≤"], "Minimizar")
+    assert passo.fase == "Fase 2"
+    assert passo.linha_custo == "Z"
+    np.testing.assert_allclose(passo.tableau, resultado.tableau, atol=1e-9)
+
+
+@pytest.mark.parametrize("semente", range(5))
+def test_ultimo_passo_igual_ao_tableau_final(semente):
+    rng = np.random.default_rng(semente)
+    comparados = 0
+    for _ in range(60):
+        m, n = rng.integers(2, 6, 2)
+        A = np.round(rng.normal(size=(m, n)), 1)
+        b = np.round(rng.normal(size=m) + 1, 1)
+        operadores = list(rng.choice(["≤", "≥", "="], m))
+        c = np.round(rng.normal(size=n), 1)
+        resultado = resolver(c.tolist(), A.tolist(), b.tolist(), operadores, "Minimizar", motor="revisado")
+        if resultado.status != "Optimal":
+            continue
+        passo = resultado.historico.passo(len(resultado.historico))
+        assert passo.linha_custo == "Z"
+        np.testing.assert_allclose(passo.tableau, resultado.tableau, atol=1e-7)
+        comparados += 1
+    assert comparados